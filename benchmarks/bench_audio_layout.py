@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Benchmark file lookups in the flat and sharded audio layouts.
+
+Creates the same set of empty files (UUID names, as written by the API)
+in a flat directory and in the two-level sharded layout, then reports
+latency percentiles for the lookup done by the download route (hit and
+miss) and the time to list the directory a file lives in.
+
+Usage:
+    python benchmarks/bench_audio_layout.py
+    python benchmarks/bench_audio_layout.py --files 100000 --dir /mnt/data/bench
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.synthesis_cache import shard_path
+
+
+def populate(root: Path, names: list, sharded: bool) -> float:
+    """Create empty files; return seconds taken."""
+    start = time.perf_counter()
+    for name in names:
+        path = shard_path(root, name) if sharded else root / name
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_WRONLY, 0o644)
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(path, os.O_CREAT | os.O_WRONLY, 0o644)
+        os.close(fd)
+    return time.perf_counter() - start
+
+
+def lookup_latencies(root: Path, names: list, sharded: bool) -> np.ndarray:
+    """Time ``Path.exists`` on the location of each name, in microseconds."""
+    timings = np.empty(len(names))
+    for i, name in enumerate(names):
+        start = time.perf_counter()
+        (shard_path(root, name) if sharded else root / name).exists()
+        timings[i] = time.perf_counter() - start
+    return timings * 1e6
+
+
+def list_time(directory: Path) -> tuple[float, int]:
+    """Seconds to list a directory and the number of entries."""
+    start = time.perf_counter()
+    with os.scandir(directory) as entries:
+        count = sum(1 for _ in entries)
+    return time.perf_counter() - start, count
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=1_000_000, help="Files per layout")
+    parser.add_argument("--lookups", type=int, default=20_000, help="Lookups per measurement")
+    parser.add_argument("--dir", help="Parent directory for the test trees (default: temp dir)")
+    args = parser.parse_args()
+    
+    rng = random.Random(0)
+    names = [f"{uuid.UUID(int=rng.getrandbits(128), version=4)}.wav" for _ in range(args.files)]
+    hits = rng.sample(names, min(args.lookups, len(names)))
+    misses = [f"{uuid.UUID(int=rng.getrandbits(128), version=4)}.wav" for _ in range(args.lookups)]
+    
+    base = Path(tempfile.mkdtemp(prefix="bench-layout-", dir=args.dir))
+    try:
+        print(f"{args.files} files, {args.lookups} lookups, in {base}\n")
+        print(
+            f"{'Layout':<8} {'Create (s)':>10} {'Lookup':<6} {'p50 us':>8} {'p99 us':>8} "
+            f"{'List dir (ms)':>14} {'Entries':>9}"
+        )
+        print("-" * 70)
+        
+        for layout, sharded in [("flat", False), ("sharded", True)]:
+            root = base / layout
+            root.mkdir()
+            created = populate(root, names, sharded)
+            listed, entries = list_time(shard_path(root, hits[0]).parent if sharded else root)
+            
+            for kind, sample in [("hit", hits), ("miss", misses)]:
+                latencies = lookup_latencies(root, sample, sharded)
+                p50, p99 = np.percentile(latencies, [50, 99])
+                print(
+                    f"{layout:<8} {created:>10.1f} {kind:<6} {p50:>8.1f} {p99:>8.1f} "
+                    f"{listed * 1000:>14.2f} {entries:>9}"
+                )
+            shutil.rmtree(root)
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+    
+    print("\nLookups run against a warm dentry cache; cold-cache differences are larger.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""End-to-end synthesis benchmark against the built-in reference model.
+
+Drives SpeechService.synthesize directly and the FastAPI app in-process
+(over an ASGI transport, no sockets) with three corpora: short lines,
+paragraphs and full 5,000-character scripts. For every target, corpus and
+concurrency level it reports latency percentiles, real-time factor (RTF,
+synthesis time / audio duration), throughput and peak RSS, and can write
+all results as JSON and compare them with a previous run.
+
+The reference model is deterministic and needs no download, so results
+reflect the service (scheduling, caching, post-processing, encoding,
+HTTP) rather than the model; use --latency-ms/--latency-ms-per-char to
+give it the cost of a real model. The synthesis cache is disabled unless
+--cache is given, so every request renders.
+
+Usage:
+    python benchmarks/bench_e2e.py
+    python benchmarks/bench_e2e.py --corpora short,paragraph --concurrency 1,4,16
+    python benchmarks/bench_e2e.py --output results.json
+    python benchmarks/bench_e2e.py --baseline results.json
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Add project root to path
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("MODEL_NAME", "reference")
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+
+# Project imports need the path and environment set above (settings are read
+# when the app module is imported)
+from config.settings import Settings  # noqa: E402
+from src.api.dependencies import get_rate_limiter, get_speech_service  # noqa: E402
+from src.api.main import app  # noqa: E402
+from src.services.speech_service import SpeechService  # noqa: E402
+
+EMOTIONS = ["neutral", "excited", "sad", "serious", "empathetic", "urgent"]
+
+WORDS = (
+    "the ocean deep light ancient forest river mountain species survive winter "
+    "journey migration thousands miles across planet remarkable discovery hidden "
+    "world beneath surface creatures adapt changing climate delicate balance life "
+    "predator prey young mother herd sky storm season dawn silence vast desert "
+    "ice coral reef colony scientists observe record evidence history million years "
+    "evolution extraordinary patient hunter shadows moonlight tide island volcano"
+).split()
+
+# Corpus name -> (target characters per text, share of --requests run)
+CORPORA = {
+    "short": (60, 1.0),
+    "paragraph": (500, 0.5),
+    "script": (5000, 0.125),
+}
+
+Call = Callable[[str, str], Awaitable[float]]
+
+
+def sentence(rng: random.Random) -> str:
+    """A random sentence of 6-16 words."""
+    words = [rng.choice(WORDS) for _ in range(rng.randint(6, 16))]
+    return " ".join(words).capitalize() + rng.choice([".", ".", ".", "!", "?"])
+
+
+def make_text(rng: random.Random, target: int, limit: int = 5000) -> str:
+    """Whole sentences adding up to about ``target`` characters (at most ``limit``)."""
+    text = sentence(rng)
+    while len(text) < target:
+        candidate = f"{text} {sentence(rng)}"
+        if len(candidate) > limit:
+            break
+        text = candidate
+    return text
+
+
+def make_corpus(name: str, count: int, seed: int) -> List[str]:
+    """Distinct, reproducible texts for a corpus."""
+    target, _ = CORPORA[name]
+    rng = random.Random(f"{name}-{seed}")
+    return [make_text(rng, target) for _ in range(count)]
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process so far, in MiB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return round(peak / (2**20 if sys.platform == "darwin" else 2**10), 1)
+
+
+async def run_level(call: Call, texts: List[str], concurrency: int) -> Dict:
+    """Send all texts with ``concurrency`` requests in flight; collect timings."""
+    latencies: List[float] = []
+    durations: List[float] = []
+    errors: List[str] = []
+    pending = iter(enumerate(texts))
+
+    async def worker() -> None:
+        for i, text in pending:
+            start = time.perf_counter()
+            try:
+                duration = await call(text, EMOTIONS[i % len(EMOTIONS)])
+            except Exception as e:
+                errors.append(f"{type(e).__name__}: {e}")
+                continue
+            latencies.append(time.perf_counter() - start)
+            durations.append(duration)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - start
+
+    result = {
+        "requests": len(texts),
+        "errors": len(errors),
+        "wall_seconds": round(wall, 4),
+        "throughput_rps": round(len(latencies) / wall, 3),
+        "audio_seconds_per_second": round(sum(durations) / wall, 3),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+    if latencies:
+        lat = np.array(latencies) * 1000
+        rtf = np.array(latencies) / np.maximum(np.array(durations), 1e-9)
+        p50, p95, p99 = np.percentile(lat, [50, 95, 99])
+        result["latency_ms"] = {
+            "mean": round(float(lat.mean()), 3),
+            "p50": round(float(p50), 3),
+            "p95": round(float(p95), 3),
+            "p99": round(float(p99), 3),
+            "max": round(float(lat.max()), 3),
+        }
+        result["rtf"] = {
+            "mean": round(float(rtf.mean()), 5),
+            "p50": round(float(np.percentile(rtf, 50)), 5),
+            "p95": round(float(np.percentile(rtf, 95)), 5),
+        }
+    if errors:
+        result["first_error"] = errors[0]
+    return result
+
+
+def service_call(service: SpeechService) -> Call:
+    """Synthesize through SpeechService."""
+    async def call(text: str, emotion: str) -> float:
+        result = await service.synthesize(text=text, emotion=emotion)
+        return result.duration
+    return call
+
+
+def http_call(client: httpx.AsyncClient) -> Call:
+    """Synthesize through the HTTP API."""
+    async def call(text: str, emotion: str) -> float:
+        response = await client.post("/v1/speech/synthesize", json={"text": text, "emotion": emotion})
+        response.raise_for_status()
+        return response.json()["duration_seconds"]
+    return call
+
+
+async def run(args: argparse.Namespace, settings: Settings) -> List[Dict]:
+    """Run every target x corpus x concurrency combination."""
+    service = SpeechService(settings)
+    service.tts_engine.load_model()
+    app.dependency_overrides[get_speech_service] = lambda: service
+    app.dependency_overrides[get_rate_limiter] = lambda: None
+
+    transport = httpx.ASGITransport(app=app)
+    results = []
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            calls = {"service": service_call(service), "http": http_call(client)}
+            for target, corpus in itertools.product(args.targets, args.corpora):
+                call = calls[target]
+                # Warm up caches of the model, resamplers and encoders
+                await run_level(call, make_corpus(corpus, 2, seed=-1), 1)
+
+                for concurrency in args.concurrency:
+                    count = max(concurrency, round(args.requests * CORPORA[corpus][1]))
+                    texts = make_corpus(corpus, count, seed=concurrency)
+                    result = await run_level(call, texts, concurrency)
+                    result.update(target=target, corpus=corpus, concurrency=concurrency)
+                    results.append(result)
+                    print_row(result)
+    finally:
+        app.dependency_overrides.clear()
+        service.shutdown()
+    return results
+
+
+def print_header() -> None:
+    print(
+        f"{'Target':<8} {'Corpus':<10} {'Conc':>4} {'Reqs':>5} {'Err':>4} "
+        f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'RTF p50':>8} "
+        f"{'req/s':>8} {'audio s/s':>10} {'RSS MiB':>8}"
+    )
+    print("-" * 104)
+
+
+def print_row(r: Dict) -> None:
+    lat = r.get("latency_ms", {})
+    rtf = r.get("rtf", {})
+    print(
+        f"{r['target']:<8} {r['corpus']:<10} {r['concurrency']:>4} {r['requests']:>5} {r['errors']:>4} "
+        f"{lat.get('p50', float('nan')):>9.1f} {lat.get('p95', float('nan')):>9.1f} "
+        f"{lat.get('p99', float('nan')):>9.1f} {rtf.get('p50', float('nan')):>8.4f} "
+        f"{r['throughput_rps']:>8.2f} {r['audio_seconds_per_second']:>10.1f} "
+        f"{r['peak_rss_mb'] if r['peak_rss_mb'] is not None else float('nan'):>8.1f}",
+        flush=True
+    )
+
+
+def compare(results: List[Dict], baseline_path: str) -> None:
+    """Print the change of key metrics relative to a previous run."""
+    with open(baseline_path) as f:
+        baseline = {
+            (r["target"], r["corpus"], r["concurrency"]): r for r in json.load(f)["results"]
+        }
+
+    def change(new: Optional[float], old: Optional[float]) -> str:
+        if new is None or not old:
+            return f"{'-':>8}"
+        return f"{(new - old) / old * 100:>+7.1f}%"
+
+    print(f"\nChange vs {baseline_path} (latency: lower is better; throughput: higher is better)\n")
+    print(f"{'Target':<8} {'Corpus':<10} {'Conc':>4} {'p50':>8} {'p95':>8} {'p99':>8} {'req/s':>8}")
+    print("-" * 60)
+    for r in results:
+        old = baseline.get((r["target"], r["corpus"], r["concurrency"]))
+        if old is None:
+            continue
+        lat, old_lat = r.get("latency_ms", {}), old.get("latency_ms", {})
+        print(
+            f"{r['target']:<8} {r['corpus']:<10} {r['concurrency']:>4} "
+            + " ".join(change(lat.get(p), old_lat.get(p)) for p in ("p50", "p95", "p99"))
+            + " " + change(r["throughput_rps"], old["throughput_rps"])
+        )
+
+
+def git_revision() -> Optional[str]:
+    """Commit of the working tree, if it is a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).parent, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def csv_list(kind):
+    return lambda value: [kind(v) for v in value.split(",") if v]
+
+
+def main() -> None:
+    """Run the benchmark, print a table and optionally write JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--targets", type=csv_list(str), default=["service", "http"],
+                        help="Comma-separated: service, http")
+    parser.add_argument("--corpora", type=csv_list(str), default=list(CORPORA),
+                        help="Comma-separated: " + ", ".join(CORPORA))
+    parser.add_argument("--concurrency", type=csv_list(int), default=[1, 2, 4, 8],
+                        help="Comma-separated requests in flight")
+    parser.add_argument("--requests", type=int, default=32,
+                        help="Requests per level for short lines (paragraphs run 1/2, scripts 1/8)")
+    parser.add_argument("--workers", type=int, default=2, help="Inference worker threads")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated model time per call")
+    parser.add_argument("--latency-ms-per-char", type=float, default=0.0,
+                        help="Simulated model time per character")
+    parser.add_argument("--cache", action="store_true", help="Keep the synthesis cache enabled")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON file of a previous run to compare with")
+    parser.add_argument("--dir", help="Parent directory for generated audio (default: temp dir)")
+    args = parser.parse_args()
+
+    for name in args.corpora:
+        if name not in CORPORA:
+            parser.error(f"unknown corpus '{name}'")
+    for name in args.targets:
+        if name not in ("service", "http"):
+            parser.error(f"unknown target '{name}'")
+
+    # Configuration files (e.g. config/emotions.yaml) are found relative to the root
+    for name in ("output", "baseline", "dir"):
+        if getattr(args, name):
+            setattr(args, name, os.path.abspath(getattr(args, name)))
+    os.chdir(ROOT)
+    audio_dir = tempfile.mkdtemp(prefix="bench-e2e-", dir=args.dir)
+    settings = Settings(
+        model_name="reference",
+        audio_output_dir=audio_dir,
+        cache_enabled=args.cache,
+        inference_workers=args.workers,
+        inference_queue_size=max(16, 2 * max(args.concurrency)),
+        reference_latency_ms=args.latency_ms,
+        reference_latency_ms_per_char=args.latency_ms_per_char,
+        rate_limit_enabled=False
+    )
+    # Per-request log lines would dominate the short-line timings
+    logging.disable(logging.INFO)
+
+    print(
+        f"workers={args.workers} cache={'on' if args.cache else 'off'} "
+        f"latency={args.latency_ms}ms+{args.latency_ms_per_char}ms/char\n"
+    )
+    print_header()
+    try:
+        results = asyncio.run(run(args, settings))
+    finally:
+        shutil.rmtree(audio_dir, ignore_errors=True)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "args": {k: v for k, v in vars(args).items() if k not in ("output", "baseline", "dir")},
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    if args.baseline:
+        compare(results, args.baseline)
+
+    print("\nPeak RSS is process-wide and only grows; compare it across runs, not rows.")
+
+
+if __name__ == "__main__":
+    main()
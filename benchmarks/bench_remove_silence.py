@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Benchmark AudioProcessor.remove_silence against the previous implementation.
+
+Usage:
+    python benchmarks/bench_remove_silence.py
+    python benchmarks/bench_remove_silence.py --minutes 10 --repeats 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.audio_processor import AudioProcessor
+
+
+def legacy_remove_silence(
+    audio: np.ndarray,
+    sample_rate: int,
+    threshold: float = -40.0
+) -> np.ndarray:
+    """Previous list-comprehension implementation, kept for comparison."""
+    frame_length = int(0.02 * sample_rate)
+    hop_length = frame_length // 2
+    
+    energy = np.array([
+        np.sum(audio[i:i + frame_length] ** 2)
+        for i in range(0, len(audio) - frame_length, hop_length)
+    ])
+    energy_db = 10 * np.log10(energy + 1e-10)
+    non_silent = energy_db > threshold
+    
+    mask = np.repeat(non_silent, hop_length)
+    mask = mask[:len(audio)]
+    if len(mask) < len(audio):
+        mask = np.pad(mask, (0, len(audio) - len(mask)), constant_values=True)
+    
+    return audio[mask]
+
+
+def make_narration(minutes: float, sample_rate: int, seed: int = 0) -> np.ndarray:
+    """Generate speech-like audio: bursts of noise separated by pauses."""
+    rng = np.random.default_rng(seed)
+    total = int(minutes * 60 * sample_rate)
+    audio = np.zeros(total, dtype=np.float32)
+    
+    position = 0
+    while position < total:
+        burst = int(rng.uniform(0.5, 3.0) * sample_rate)
+        pause = int(rng.uniform(0.05, 1.0) * sample_rate)
+        end = min(position + burst, total)
+        audio[position:end] = rng.standard_normal(end - position) * 0.2
+        position = end + pause
+    
+    return audio
+
+
+def time_call(fn, repeats: int) -> float:
+    """Return the best wall time of several runs in seconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--minutes", type=float, default=10.0, help="Input length in minutes")
+    parser.add_argument("--sample-rate", type=int, default=24000, help="Sample rate in Hz")
+    parser.add_argument("--repeats", type=int, default=3, help="Runs per implementation")
+    args = parser.parse_args()
+    
+    audio = make_narration(args.minutes, args.sample_rate)
+    processor = AudioProcessor(sample_rate=args.sample_rate)
+    
+    legacy = time_call(lambda: legacy_remove_silence(audio, args.sample_rate), args.repeats)
+    current = time_call(lambda: processor.remove_silence(audio), args.repeats)
+    
+    audio_seconds = len(audio) / args.sample_rate
+    print(f"Input: {args.minutes:.1f} min @ {args.sample_rate} Hz ({len(audio):,} samples)")
+    print(f"{'Implementation':<16} {'Time (s)':>10} {'RTF':>10}")
+    print("-" * 38)
+    print(f"{'legacy':<16} {legacy:>10.3f} {legacy / audio_seconds:>10.5f}")
+    print(f"{'vectorized':<16} {current:>10.3f} {current / audio_seconds:>10.5f}")
+    print(f"\nSpeedup: {legacy / current:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
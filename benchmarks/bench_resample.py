@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Benchmark polyphase resampling against FFT resampling.
+
+Reports wall time and peak traced memory for each supported rate pair,
+for FFT resampling (scipy.signal.resample), one-pass polyphase filtering,
+and block-by-block polyphase streaming.
+
+Usage:
+    python benchmarks/bench_resample.py
+    python benchmarks/bench_resample.py --minutes 10 --block-seconds 1
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+from scipy import signal
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.resampler import get_resampler
+
+RATE_PAIRS = [(24000, 44100), (24000, 16000), (24000, 22050), (22050, 44100)]
+
+
+def measure(fn) -> tuple[float, float]:
+    """Run fn once and return (seconds, peak MiB)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--minutes", type=float, default=10.0, help="Input length in minutes")
+    parser.add_argument("--block-seconds", type=float, default=1.0, help="Block size for streaming")
+    parser.add_argument("--skip-fft", action="store_true", help="Skip the FFT baseline")
+    args = parser.parse_args()
+    
+    print(f"{'Rate pair':<16} {'Method':<12} {'Time (s)':>10} {'Peak MiB':>10}")
+    print("-" * 52)
+    
+    for orig_sr, target_sr in RATE_PAIRS:
+        # Odd length so the FFT path does not get a friendly size
+        n = int(args.minutes * 60 * orig_sr) + 7
+        audio = np.random.default_rng(0).standard_normal(n).astype(np.float32) * 0.1
+        block = int(args.block_seconds * orig_sr)
+        resampler = get_resampler(orig_sr, target_sr)
+        
+        def streaming():
+            blocks = (audio[i:i + block] for i in range(0, len(audio), block))
+            for _ in resampler.process_blocks(blocks):
+                pass
+        
+        methods = [
+            ("polyphase", lambda: resampler.process(audio)),
+            ("streaming", streaming),
+        ]
+        if not args.skip_fft:
+            num_samples = int(len(audio) * target_sr / orig_sr)
+            methods.insert(0, ("fft", lambda: signal.resample(audio, num_samples)))
+        
+        label = f"{orig_sr}->{target_sr}"
+        for name, fn in methods:
+            elapsed, peak = measure(fn)
+            print(f"{label:<16} {name:<12} {elapsed:>10.3f} {peak:>10.1f}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Startup time and first-request latency with and without model warm-up.
+
+Every run starts a fresh Python process, so nothing is cached from a
+previous run. Each process builds the speech service, runs
+SpeechService.warm_up (model load, plus the warm-up syntheses unless
+warm-up is off) and then sends its first synthesis requests: one per
+sample rate, cycling through the emotions, with texts that were never
+synthesized before. It reports the startup time until ready and the
+latency of each of those first requests next to the steady-state latency
+of the same request repeated with new text.
+
+Usage:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --runs 5 --latency-ms 200
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Add project root to path
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+EMOTIONS = ["neutral", "excited", "sad", "serious", "empathetic", "urgent"]
+SAMPLE_RATES = [24000, 16000, 22050, 44100]
+FORMATS = ["wav", "mp3", "ogg", "wav"]
+
+TEXT = "Request {n}: across the frozen plain, the herd moves on before the storm."
+
+
+async def first_requests(service) -> List[Dict]:
+    """Send the first request for each sample rate, then repeat it warm."""
+    results = []
+    n = 0
+    for i, sample_rate in enumerate(SAMPLE_RATES):
+        request = {
+            "emotion": EMOTIONS[i % len(EMOTIONS)],
+            "sample_rate": sample_rate,
+            "output_format": FORMATS[i % len(FORMATS)],
+        }
+        timings = []
+        for _ in range(2):
+            n += 1
+            start = time.perf_counter()
+            await service.synthesize(text=TEXT.format(n=n), **request)
+            timings.append((time.perf_counter() - start) * 1000)
+        results.append({**request, "first_ms": timings[0], "repeat_ms": timings[1]})
+    return results
+
+
+def child(args: argparse.Namespace) -> None:
+    """Measure one cold start and print it as JSON."""
+    start = time.perf_counter()
+    from config.settings import Settings
+    from src.services.speech_service import SpeechService
+    import_ms = (time.perf_counter() - start) * 1000
+
+    logging.disable(logging.INFO)
+    settings = Settings(
+        model_name="reference",
+        audio_output_dir=tempfile.mkdtemp(prefix="bench-startup-"),
+        cache_enabled=False,
+        warmup_enabled=args.warmup == "on",
+        reference_latency_ms=args.latency_ms,
+        reference_latency_ms_per_char=args.latency_ms_per_char,
+        rate_limit_enabled=False
+    )
+    service = SpeechService(settings)
+    status = service.warm_up()
+    ready_ms = (time.perf_counter() - start) * 1000
+    try:
+        requests = asyncio.run(first_requests(service))
+    finally:
+        service.shutdown()
+
+    print(json.dumps({
+        "import_ms": import_ms,
+        "model_load_ms": status["model_load_ms"],
+        "warmup_ms": status["warmup_ms"] or 0.0,
+        "ready_ms": ready_ms,
+        "requests": requests,
+    }))
+
+
+def run_child(warmup: str, args: argparse.Namespace) -> Dict:
+    """Run one cold start in a new interpreter."""
+    command = [
+        sys.executable, __file__, "--child", "--warmup", warmup,
+        "--latency-ms", str(args.latency_ms),
+        "--latency-ms-per-char", str(args.latency_ms_per_char),
+    ]
+    env = {**os.environ, "MODEL_NAME": "reference", "LOG_LEVEL": "WARNING"}
+    output = subprocess.run(command, cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    """Compare cold starts with warm-up on and off."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3, help="Cold starts per configuration")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated model time per call")
+    parser.add_argument("--latency-ms-per-char", type=float, default=0.0,
+                        help="Simulated model time per character")
+    parser.add_argument("--warmup", choices=["on", "off"], default="on", help=argparse.SUPPRESS)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    # Configuration files (e.g. config/emotions.yaml) are found relative to the root
+    os.chdir(ROOT)
+    if args.child:
+        child(args)
+        return
+
+    print(f"{args.runs} cold starts per configuration (medians)\n")
+    print(
+        f"{'Warm-up':<8} {'import ms':>10} {'load ms':>9} {'warm-up ms':>11} {'ready ms':>9}  "
+        + "  ".join(f"{f'{rate} Hz first/repeat':>22}" for rate in SAMPLE_RATES)
+    )
+    print("-" * (52 + 24 * len(SAMPLE_RATES)))
+    for warmup in ("off", "on"):
+        runs = [run_child(warmup, args) for _ in range(args.runs)]
+
+        def median(key: str) -> float:
+            return statistics.median(run[key] for run in runs)
+
+        def request_median(index: int, key: str) -> float:
+            return statistics.median(run["requests"][index][key] for run in runs)
+
+        print(
+            f"{warmup:<8} {median('import_ms'):>10.1f} {median('model_load_ms'):>9.1f} "
+            f"{median('warmup_ms'):>11.1f} {median('ready_ms'):>9.1f}  "
+            + "  ".join(
+                f"{request_median(i, 'first_ms'):>12.1f} / {request_median(i, 'repeat_ms'):>7.1f}"
+                for i in range(len(SAMPLE_RATES))
+            ),
+            flush=True
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Benchmark pitch-preserving time-stretching.
+
+Reports wall time and real-time factor (processing time / audio duration;
+below 1.0 is faster than real time) of the phase vocoder for a range of
+tempo factors, both in one pass and block-by-block as used for streaming.
+
+Usage:
+    python benchmarks/bench_time_stretch.py
+    python benchmarks/bench_time_stretch.py --minutes 10 --sample-rate 44100
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.time_stretch import fft_size_for, get_phase_vocoder
+
+RATES = [0.5, 0.85, 0.9, 1.1, 1.5, 2.0]
+
+
+def main() -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--minutes", type=float, default=2.0, help="Input length in minutes")
+    parser.add_argument("--sample-rate", type=int, default=24000, help="Sample rate in Hz")
+    parser.add_argument("--block-seconds", type=float, default=0.5, help="Block size for streaming")
+    args = parser.parse_args()
+    
+    sr = args.sample_rate
+    duration = args.minutes * 60
+    audio = np.random.default_rng(0).standard_normal(int(duration * sr)).astype(np.float32) * 0.1
+    vocoder = get_phase_vocoder(fft_size_for(sr))
+    block = int(args.block_seconds * sr)
+    
+    print(f"{duration:.0f} s at {sr} Hz, n_fft={vocoder.n_fft}, hop={vocoder.hop_length}")
+    print(f"{'Rate':>6} {'Method':<12} {'Time (s)':>10} {'RTF':>8}")
+    print("-" * 40)
+    
+    for rate in RATES:
+        def streaming():
+            blocks = (audio[i:i + block] for i in range(0, len(audio), block))
+            for _ in vocoder.process_blocks(blocks, rate):
+                pass
+        
+        for name, fn in [("one-pass", lambda: vocoder.stretch(audio, rate)), ("streaming", streaming)]:
+            start = time.perf_counter()
+            fn()
+            elapsed = time.perf_counter() - start
+            print(f"{rate:>6.2f} {name:<12} {elapsed:>10.3f} {elapsed / duration:>8.4f}")
+
+
+if __name__ == "__main__":
+    main()
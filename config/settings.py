@@ -1,7 +1,7 @@
 """Application settings using Pydantic for environment-based configuration."""
 
 from functools import lru_cache
-from typing import List, Literal
+from typing import Dict, List, Literal
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -20,25 +20,89 @@ class Settings(BaseSettings):
     api_v1_prefix: str = Field(default="/v1")
     cors_origins: List[str] = Field(default=["*"])
     api_key: str | None = Field(default=None)
+    api_keys: List[str] = Field(default=[])
 
     # TTS Model
-    model_name: Literal["chatterbox", "coqui", "bark"] = Field(default="chatterbox")
+    model_name: Literal["chatterbox", "coqui", "bark", "reference"] = Field(default="chatterbox")
     model_cache_dir: str = Field(default="data/models")
     device: Literal["cuda", "cpu", "mps"] = Field(default="cpu")
 
+    # Model Pool (several models resident at once)
+    enabled_models: List[str] = Field(default=[])
+    model_memory_budget_bytes: int = Field(default=0, ge=0)
+    model_memory_bytes: Dict[str, int] = Field(default={})
+
+    # Reference Model (MODEL_NAME=reference, offline testing and benchmarks)
+    reference_sample_rate: int = Field(default=24000, ge=8000)
+    reference_seconds_per_char: float = Field(default=0.06, gt=0.0)
+    reference_latency_ms: float = Field(default=0.0, ge=0.0)
+    reference_latency_ms_per_char: float = Field(default=0.0, ge=0.0)
+
     # Audio Settings
     default_sample_rate: int = Field(default=24000)
     max_text_length: int = Field(default=5000)
     audio_output_dir: str = Field(default="data/audio_cache")
     audio_ttl_hours: int = Field(default=24)
+    audio_max_bytes: int = Field(default=10 * 1024 * 1024 * 1024, ge=0)
+    reaper_interval_seconds: float = Field(default=300.0, gt=0.0)
+    audio_cache_max_age: int = Field(default=365 * 24 * 3600, ge=0)
+    response_mode: Literal["url", "auto"] = Field(default="url")
+    inline_audio_max_bytes: int = Field(default=256 * 1024, ge=0)
+
+    # Warm-up (before /v1/health/ready reports ready)
+    warmup_enabled: bool = Field(default=True)
+    warmup_text: str = Field(default="The ancient forest stirs at dawn, and the long journey begins.")
+    warmup_emotions: List[str] = Field(default=[])
+    warmup_sample_rates: List[int] = Field(default=[16000, 22050, 24000, 44100])
+    warmup_formats: List[str] = Field(default=["wav", "mp3", "ogg"])
+
+    # Inference Executor
+    inference_workers: int = Field(default=2, ge=1)
+    inference_queue_size: int = Field(default=16, ge=1)
+    batch_max_items: int = Field(default=500, ge=1)
+
+    # Fair Scheduling
+    interactive_deadline_ms: float = Field(default=30000.0, ge=0.0)
+    batch_deadline_ms: float = Field(default=0.0, ge=0.0)
+    tenant_weights: Dict[str, float] = Field(default={})
+
+    # Background Jobs
+    job_workers: int = Field(default=1, ge=1)
+    job_queue_size: int = Field(default=1000, ge=1)
+    job_store_max_jobs: int = Field(default=10000, ge=1)
+    job_progress_chunks: int = Field(default=8, ge=1)
+
+    # Micro-batching
+    microbatch_enabled: bool = Field(default=True)
+    microbatch_max_size: int = Field(default=8, ge=1)
+    microbatch_max_wait_ms: float = Field(default=10.0, ge=0.0)
+
+    # Synthesis Cache
+    cache_enabled: bool = Field(default=True)
+    cache_memory_bytes: int = Field(default=64 * 1024 * 1024, ge=0)
+    cache_intensity_step: float = Field(default=0.05, ge=0.0)
+    chunk_cache_memory_bytes: int = Field(default=128 * 1024 * 1024, ge=0)
+    synthesis_chunk_size: int = Field(default=500, ge=1)
 
     # Rate Limiting
-    rate_limit_requests: int = Field(default=10)
-    rate_limit_window: int = Field(default=60)
+    rate_limit_enabled: bool = Field(default=True)
+    rate_limit_requests: int = Field(default=10, ge=1)
+    rate_limit_window: int = Field(default=60, ge=1)
+    rate_limit_cost_chars: int = Field(default=500, ge=0)
+    rate_limit_backend: Literal["memory", "redis"] = Field(default="memory")
+    redis_url: str = Field(default="redis://localhost:6379/0")
 
     # Logging
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = Field(default="INFO")
 
+    # Stage Timing (response metadata, Server-Timing header, histograms)
+    timing_enabled: bool = Field(default=True)
+
+    # Metrics (/metrics in the Prometheus text format)
+    metrics_enabled: bool = Field(default=True)
+    metrics_multiproc_dir: str | None = Field(default=None)
+    metrics_flush_seconds: float = Field(default=5.0, gt=0.0)
+
     # Storage (Optional - for S3)
     aws_access_key_id: str | None = Field(default=None)
     aws_secret_access_key: str | None = Field(default=None)
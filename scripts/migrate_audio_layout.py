@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Move audio files from the flat layout into the sharded layout.
+
+Older versions wrote every file directly into AUDIO_OUTPUT_DIR (and its
+chunks/ subdirectory). This moves each such file to its sharded location
+(see ``shard_path``) and updates the storage index, keeping access times.
+It is safe to run while the API is serving: downloads fall back to the flat
+location until a file has been moved, and cache entries not yet moved are
+simply re-rendered.
+
+Usage:
+    python scripts/migrate_audio_layout.py
+    python scripts/migrate_audio_layout.py --dir data/audio_cache --dry-run
+"""
+
+import argparse
+import os
+import sys
+import time
+from itertools import islice
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import Settings
+from src.core.audio_index import AudioIndex
+from src.core.synthesis_cache import shard_path
+
+# Files moved per directory scan; the scan restarts after each batch so the
+# directory is never modified while it is being read
+BATCH_SIZE = 10000
+
+
+def flat_files(directory: Path):
+    """Iterate over files stored flat in ``directory`` that need moving."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.startswith(".") or not entry.is_file(follow_symlinks=False):
+                continue
+            path = Path(entry.path)
+            if shard_path(directory, entry.name) != path:
+                yield path
+
+
+def migrate(directory: Path, index: AudioIndex, dry_run: bool) -> int:
+    """Move all flat files in one directory; return the number moved."""
+    if not directory.is_dir():
+        return 0
+    if dry_run:
+        return sum(1 for _ in flat_files(directory))
+
+    moved = 0
+    while True:
+        files = list(islice(flat_files(directory), BATCH_SIZE))
+        if not files:
+            break
+
+        moves = [(path, shard_path(directory, path.name)) for path in files]
+        for old, new in moves:
+            new.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(old, new)
+        index.relocate(moves)
+        moved += len(moves)
+        print(f"  {directory}: {moved} files moved")
+    return moved
+
+
+def main() -> None:
+    """Run the migration."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dir", help="Audio directory (default: AUDIO_OUTPUT_DIR)")
+    parser.add_argument("--dry-run", action="store_true", help="Count files without moving them")
+    args = parser.parse_args()
+
+    root = Path(args.dir or Settings().audio_output_dir)
+    if not root.is_dir():
+        sys.exit(f"Audio directory not found: {root}")
+
+    index = AudioIndex(root)
+    start = time.perf_counter()
+    total = 0
+    for directory in (root, root / "chunks"):
+        total += migrate(directory, index, args.dry_run)
+    index.close()
+
+    verb = "would be moved" if args.dry_run else "moved"
+    print(f"{total} files {verb} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,44 @@
 """Dependency injection for FastAPI."""
 
+import hashlib
+import hmac
+import json
+import math
 from functools import lru_cache
+from typing import Any, FrozenSet, Optional
+
+from fastapi import Depends, Header, HTTPException, Request
+from starlette.concurrency import run_in_threadpool
 
 from config.settings import Settings, get_settings
+from src.services.fair_queue import DEFAULT_TENANT
+from src.services.job_store import InMemoryJobStore, JobStore
+from src.services.rate_limiter import (
+    InMemoryRateLimiter,
+    RateLimiter,
+    RedisStore,
+    SharedStoreRateLimiter,
+    text_cost,
+)
 from src.services.speech_service import SpeechService
+from src.utils.metrics import MetricsRegistry
+
+
+@lru_cache
+def get_metrics_registry() -> MetricsRegistry:
+    """Get cached metrics registry.
+    
+    With ``metrics_multiproc_dir`` set, worker processes share their
+    metrics through that directory and every worker reports the total.
+    
+    Returns:
+        MetricsRegistry instance
+    """
+    settings = get_settings()
+    return MetricsRegistry(
+        multiproc_dir=settings.metrics_multiproc_dir,
+        flush_seconds=settings.metrics_flush_seconds
+    )
 
 
 @lru_cache
@@ -14,17 +49,140 @@ def get_speech_service() -> SpeechService:
         SpeechService instance
     """
     settings = get_settings()
-    return SpeechService(settings)
+    return SpeechService(settings, metrics=get_metrics_registry())
+
+
+@lru_cache
+def get_job_store() -> JobStore:
+    """Get cached job store instance.
+    
+    Override this dependency to use a different store (e.g. in tests).
+    
+    Returns:
+        JobStore instance
+    """
+    settings = get_settings()
+    return InMemoryJobStore(max_jobs=settings.job_store_max_jobs)
 
 
-def rate_limit() -> None:
-    """Rate limiting dependency (placeholder).
+@lru_cache
+def get_api_keys() -> FrozenSet[str]:
+    """Get the configured API keys (``api_key`` and ``api_keys``).
     
-    In production, implement proper rate limiting using:
-    - slowapi library
-    - Redis-based rate limiting
-    - API gateway (AWS, Kong, etc.)
+    Returns:
+        Set of valid keys (empty when none are configured)
     """
-    # TODO: Implement actual rate limiting
-    pass
+    settings = get_settings()
+    keys = set(settings.api_keys)
+    if settings.api_key:
+        keys.add(settings.api_key)
+    return frozenset(keys)
+
 
+def _validated_key(x_api_key: Optional[str], api_keys: FrozenSet[str]) -> Optional[str]:
+    """Return the presented API key if it is one of the configured keys."""
+    if not x_api_key:
+        return None
+    for key in api_keys:
+        if hmac.compare_digest(x_api_key.encode(), key.encode()):
+            return key
+    return None
+
+
+def get_tenant(
+    x_api_key: Optional[str] = Header(default=None),
+    api_keys: FrozenSet[str] = Depends(get_api_keys)
+) -> str:
+    """Identify the caller for fair scheduling.
+    
+    Requests are shared fairly between configured API keys. Requests
+    without a valid key are pooled under one anonymous tenant, so callers
+    cannot claim extra shares by inventing keys.
+    
+    Returns:
+        Tenant identifier
+    """
+    return _validated_key(x_api_key, api_keys) or DEFAULT_TENANT
+
+
+@lru_cache
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """Get cached rate limiter instance.
+    
+    Each client gets a bucket of ``rate_limit_requests`` tokens that refills
+    over ``rate_limit_window`` seconds.
+    
+    Returns:
+        RateLimiter instance, or None if rate limiting is disabled
+    """
+    settings = get_settings()
+    if not settings.rate_limit_enabled:
+        return None
+    
+    capacity = settings.rate_limit_requests
+    refill_per_second = settings.rate_limit_requests / settings.rate_limit_window
+    if settings.rate_limit_backend == "redis":
+        return SharedStoreRateLimiter(RedisStore(settings.redis_url), capacity, refill_per_second)
+    return InMemoryRateLimiter(capacity, refill_per_second)
+
+
+def _text_length(payload: Any) -> int:
+    """Total characters of text in a synthesis request body."""
+    if not isinstance(payload, dict):
+        return 0
+    items = payload.get("items")
+    if isinstance(items, list):
+        return sum(_text_length(item) for item in items)
+    text = payload.get("text")
+    return len(text) if isinstance(text, str) else 0
+
+
+async def rate_limit(
+    request: Request,
+    x_api_key: Optional[str] = Header(default=None),
+    api_keys: FrozenSet[str] = Depends(get_api_keys),
+    limiter: Optional[RateLimiter] = Depends(get_rate_limiter)
+) -> None:
+    """Rate limiting dependency.
+    
+    Clients are identified by API key when it is one of the configured
+    keys, and by IP address otherwise, so rotating the header does not
+    yield fresh buckets (or push real clients out of the limiter). Each
+    request costs one token per ``rate_limit_cost_chars`` characters of
+    text (at least one), so long texts use up the budget faster.
+    
+    Raises:
+        HTTPException: 429 ``RATE_LIMIT_EXCEEDED`` with ``Retry-After`` when
+            the client's bucket is empty
+    """
+    if limiter is None:
+        return
+    
+    api_key = _validated_key(x_api_key, api_keys)
+    if api_key:
+        key = "key:" + hashlib.sha256(api_key.encode()).hexdigest()[:32]
+    else:
+        key = "ip:" + (request.client.host if request.client else "unknown")
+    
+    # The body has already been read for validation, so this is cached
+    try:
+        payload = json.loads(await request.body() or b"null")
+    except ValueError:
+        payload = None
+    cost = text_cost(_text_length(payload), get_settings().rate_limit_cost_chars)
+    
+    if limiter.blocking:
+        decision = await run_in_threadpool(limiter.acquire, key, cost)
+    else:
+        decision = limiter.acquire(key, cost)
+    
+    if not decision.allowed:
+        raise HTTPException(
+            status_code=429,
+            detail={
+                "code": "RATE_LIMIT_EXCEEDED",
+                "message": f"Rate limit exceeded, retry in {decision.retry_after:.1f} seconds",
+                "request_id": "request_id_placeholder"
+            },
+            headers={"Retry-After": str(max(1, math.ceil(decision.retry_after)))}
+        )
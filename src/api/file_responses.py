@@ -0,0 +1,153 @@
+"""File responses with byte ranges and conditional requests."""
+
+import hashlib
+import os
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
+
+READ_CHUNK_SIZE = 64 * 1024
+
+
+def make_etag(path: Path, stat: os.stat_result) -> str:
+    """Strong validator that changes whenever the file is rewritten."""
+    base = f"{path.name}-{stat.st_mtime_ns}-{stat.st_size}"
+    return '"' + hashlib.sha1(base.encode()).hexdigest() + '"'
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """Parse a single-range ``Range`` header.
+
+    Args:
+        header: Header value, e.g. ``bytes=0-1023``, ``bytes=1024-`` or ``bytes=-500``
+        size: File size in bytes
+
+    Returns:
+        Inclusive (start, end) byte positions, or None if the header is not a
+        single byte range (the whole file should be sent)
+
+    Raises:
+        ValueError: If the range cannot be satisfied
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+
+    first, sep, last = spec.strip().partition("-")
+    if not sep:
+        return None
+    try:
+        if first:
+            start = int(first)
+            end = int(last) if last else size - 1
+        else:
+            # Suffix range: the last N bytes
+            start = max(0, size - int(last))
+            end = size - 1
+    except ValueError:
+        return None
+
+    if start < 0 or start >= size or end < start:
+        raise ValueError(f"Range {header!r} not satisfiable for {size} bytes")
+    return start, min(end, size - 1)
+
+
+def _not_modified(request: Request, etag: str, mtime: float) -> bool:
+    """Whether the client's cached copy is current (RFC 9110 section 13.2.2)."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None:
+        try:
+            return int(mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def _if_range_matches(request: Request, etag: str, last_modified: str) -> bool:
+    """Whether a ``Range`` header still applies to the current file."""
+    if_range = request.headers.get("if-range")
+    return if_range is None or if_range.strip() in (etag, last_modified)
+
+
+def _read_range(path: Path, start: int, end: int) -> Iterator[bytes]:
+    """Yield the bytes ``start``..``end`` (inclusive) of a file."""
+    remaining = end - start + 1
+    with open(path, "rb") as f:
+        f.seek(start)
+        while remaining > 0:
+            data = f.read(min(READ_CHUNK_SIZE, remaining))
+            if not data:
+                break
+            remaining -= len(data)
+            yield data
+
+
+def file_response(
+    request: Request,
+    path: Path,
+    media_type: str,
+    filename: Optional[str] = None,
+    cache_control: Optional[str] = None
+) -> Response:
+    """Serve a file honouring ``Range``, ``If-Range`` and conditional headers.
+
+    Answers 304 when the client's copy is current, 206 with the requested
+    bytes for a single byte range, 416 for a range outside the file, and the
+    whole file otherwise. Every response carries ``ETag``,
+    ``Last-Modified`` and ``Accept-Ranges``.
+
+    Args:
+        request: Incoming request
+        path: File to serve
+        media_type: Content type
+        filename: Download name for ``Content-Disposition``
+        cache_control: ``Cache-Control`` header value
+
+    Returns:
+        Response for the request
+    """
+    stat = path.stat()
+    etag = make_etag(path, stat)
+    last_modified = formatdate(stat.st_mtime, usegmt=True)
+
+    headers = {"etag": etag, "last-modified": last_modified, "accept-ranges": "bytes"}
+    if cache_control:
+        headers["cache-control"] = cache_control
+
+    if _not_modified(request, etag, stat.st_mtime):
+        return Response(status_code=304, headers=headers)
+
+    range_header = request.headers.get("range")
+    if range_header and _if_range_matches(request, etag, last_modified):
+        try:
+            byte_range = parse_range(range_header, stat.st_size)
+        except ValueError:
+            headers["content-range"] = f"bytes */{stat.st_size}"
+            return Response(status_code=416, headers=headers)
+
+        if byte_range is not None:
+            start, end = byte_range
+            headers["content-range"] = f"bytes {start}-{end}/{stat.st_size}"
+            headers["content-length"] = str(end - start + 1)
+            return StreamingResponse(
+                _read_range(path, start, end),
+                status_code=206,
+                media_type=media_type,
+                headers=headers
+            )
+
+    return FileResponse(
+        path=str(path),
+        media_type=media_type,
+        filename=filename,
+        stat_result=stat,
+        headers=headers
+    )
@@ -1,14 +1,16 @@
 """FastAPI main application."""
 
-from contextlib import asynccontextmanager
-from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import JSONResponse, Response
 
 from config.settings import get_settings
 from src.api.middleware import setup_middleware
 from src.api.v1.routes import health, tts, emotions
-from src.api.dependencies import get_speech_service
+from src.api.dependencies import get_metrics_registry, get_speech_service
 from src.utils.logging import setup_logging, get_logger
+from src.utils.metrics import CONTENT_TYPE
 
 # Setup logging
 setup_logging()
@@ -22,19 +24,48 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Emotional Speech Generation API...")
     settings = get_settings()
     
-    # Initialize and load TTS model
+    # Load and warm up the TTS model off the event loop; /v1/health/ready
+    # reports 503 until this has finished
+    warmup_task = None
     try:
         speech_service = get_speech_service()
-        speech_service.tts_engine.load_model()
-        logger.info(f"TTS model loaded successfully: {settings.model_name}")
+        warmup_task = asyncio.create_task(asyncio.to_thread(speech_service.warm_up))
     except Exception as e:
-        logger.error(f"Failed to load TTS model: {e}")
+        logger.error(f"Failed to start TTS model warm-up: {e}")
         # Continue anyway - will fail gracefully on synthesis requests
     
+    # Expire old audio and enforce the disk quota in the background
+    reaper_task = None
+    try:
+        reaper_task = asyncio.create_task(get_speech_service().reaper.run())
+    except Exception as e:
+        logger.error(f"Failed to start audio reaper: {e}")
+    
+    # Share metrics with the other worker processes (METRICS_MULTIPROC_DIR)
+    if settings.metrics_enabled:
+        get_metrics_registry().start()
+    
     yield
     
     # Shutdown
     logger.info("Shutting down Emotional Speech Generation API...")
+    if settings.metrics_enabled:
+        try:
+            get_metrics_registry().stop()
+        except Exception as e:
+            logger.error(f"Failed to write final metrics snapshot: {e}")
+    if reaper_task is not None:
+        reaper_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await reaper_task
+    try:
+        get_speech_service().shutdown()
+    except Exception as e:
+        logger.error(f"Failed to shut down speech service: {e}")
+    if warmup_task is not None:
+        # An unfinished warm-up stops after its current synthesis
+        with suppress(Exception):
+            await warmup_task
 
 
 # Create FastAPI application
@@ -70,6 +101,19 @@ async def root():
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    """Metrics in the Prometheus text exposition format.
+    
+    A plain ``def``, so FastAPI renders on its thread pool: collectors take
+    component locks and multi-process mode reads and writes snapshot files.
+    """
+    if not settings.metrics_enabled:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    get_speech_service()
+    return Response(content=get_metrics_registry().render(), media_type=CONTENT_TYPE)
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler for unhandled errors."""
@@ -32,6 +32,18 @@ def setup_middleware(app: FastAPI) -> None:
     # Gzip compression
     app.add_middleware(GZipMiddleware, minimum_size=1000)
     
+    # Per-route request counts and latency
+    http_requests = http_latency = None
+    if settings.metrics_enabled:
+        from src.api.dependencies import get_metrics_registry
+        registry = get_metrics_registry()
+        http_requests = registry.counter(
+            "http_requests_total", "HTTP requests by route and status", ("method", "route", "status")
+        )
+        http_latency = registry.histogram(
+            "http_request_duration_seconds", "HTTP request latency by route", ("method", "route")
+        )
+    
     # Request logging and timing
     @app.middleware("http")
     async def log_requests(request: Request, call_next):
@@ -52,6 +64,23 @@ def setup_middleware(app: FastAPI) -> None:
         response.headers["X-Request-ID"] = request_id
         response.headers["X-Process-Time"] = str(process_time)
         
+        if http_requests is not None:
+            route = _route_template(request)
+            status = str(response.status_code)
+            body = response.body_iterator
+            
+            # Streamed bodies (e.g. /speech/stream) are still being rendered
+            # here, so latency is observed once the body has been sent
+            async def observe_when_sent():
+                try:
+                    async for chunk in body:
+                        yield chunk
+                finally:
+                    http_requests.inc((request.method, route, status))
+                    http_latency.observe(time.time() - start_time, (request.method, route))
+            
+            response.body_iterator = observe_when_sent()
+        
         logger.info(
             f"Request completed: {request.method} {request.url.path} "
             f"- Status: {response.status_code} - Time: {process_time:.3f}s",
@@ -60,3 +89,21 @@ def setup_middleware(app: FastAPI) -> None:
         
         return response
 
+
+def _route_template(request: Request) -> str:
+    """Path of the matched route with parameters as placeholders.
+    
+    Metrics are labelled by template, not raw path, so per-file and
+    per-job URLs do not each create a series.
+    """
+    route = request.scope.get("route")
+    template = getattr(route, "path_format", None)
+    if template is None:
+        return "unmatched"
+    # Some FastAPI versions report routes of an included router without the
+    # include prefix; that prefix is literal, so take it from the request path
+    path = request.scope["path"]
+    if not route.path_regex.match(path):
+        prefix = path.split("/")[:-template.count("/")]
+        template = "/".join(prefix) + template
+    return template
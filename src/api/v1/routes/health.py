@@ -38,22 +38,37 @@ async def health_check() -> HealthResponse:
     )
 
 
+@router.get("/stats")
+async def stats() -> dict:
+    """
+    Runtime statistics for the synthesis pipeline.
+    
+    Reports inference queue depth, active workers and queue wait times.
+    """
+    speech_service = get_speech_service()
+    return speech_service.get_stats()
+
+
 @router.get("/ready", status_code=200)
 async def readiness_check() -> dict:
     """
     Readiness check for Kubernetes/deployment systems.
     
-    Returns 200 if service is ready to handle requests, 503 otherwise.
+    Returns 200 once the model is loaded and warm-up has finished, 503
+    otherwise. The replica stays ready if the default model is later
+    evicted from the model pool, since it is reloaded on demand.
     """
     try:
         speech_service = get_speech_service()
+        if speech_service.is_ready():
+            return {"status": "ready"}
+        
         model_info = speech_service.get_model_info()
         
+        from fastapi import HTTPException
         if not model_info.get("loaded", False):
-            from fastapi import HTTPException
             raise HTTPException(status_code=503, detail="Model not loaded")
-        
-        return {"status": "ready"}
+        raise HTTPException(status_code=503, detail="Model warming up")
         
     except Exception as e:
         from fastapi import HTTPException
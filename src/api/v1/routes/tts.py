@@ -1,38 +1,92 @@
 """TTS synthesis endpoints."""
 
+import base64
 import time
-from fastapi import APIRouter, HTTPException, Depends, Response
-from fastapi.responses import FileResponse
+from typing import Literal, Optional
 
-from src.api.v1.schemas.tts import SynthesizeRequest, SynthesizeResponse, SynthesisMetadata
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from src.api.v1.schemas.tts import (
+    SynthesizeRequest,
+    SynthesizeResponse,
+    SynthesisMetadata,
+    StreamSynthesizeRequest,
+    BatchSynthesizeRequest,
+    BatchSynthesizeResponse,
+    BatchItemResponse,
+    JobProgress,
+    JobResponse,
+)
 from src.api.v1.schemas.errors import ErrorResponse
-from src.services.speech_service import SpeechService
-from src.api.dependencies import get_speech_service, rate_limit
+from src.services.job_store import Job, JobStore
+from src.services.speech_service import (
+    RESPONSE_AUTO,
+    RESPONSE_INLINE,
+    RESPONSE_URL,
+    BatchItem,
+    SpeechService,
+)
+from src.api.file_responses import file_response
+from src.api.dependencies import get_job_store, get_speech_service, get_tenant, rate_limit
+from src.utils.exceptions import DeadlineExceededException, QueueFullException
+from src.core.encoders import ENCODERS
+from src.core.synthesis_cache import shard_path
 from src.utils.logging import get_logger
+from src.utils.timing import server_timing
 
 router = APIRouter(prefix="/speech", tags=["speech"])
 logger = get_logger(__name__)
 
+# Service delivery mode for each client-facing response mode
+_RESPONSE_MODES = {
+    "url": RESPONSE_URL,
+    "auto": RESPONSE_AUTO,
+    "base64": RESPONSE_INLINE,
+    "binary": RESPONSE_INLINE,
+}
+
 
 @router.post(
     "/synthesize",
     response_model=SynthesizeResponse,
     responses={
+        200: {
+            "content": {media_type: {} for media_type in ("audio/wav", "audio/mpeg", "audio/ogg")},
+            "description": "Synthesis result, or the audio itself with `response_mode=binary`"
+        },
         400: {"model": ErrorResponse, "description": "Bad Request"},
         422: {"model": ErrorResponse, "description": "Validation Error"},
-        500: {"model": ErrorResponse, "description": "Internal Server Error"}
+        429: {"model": ErrorResponse, "description": "Inference Queue Full"},
+        500: {"model": ErrorResponse, "description": "Internal Server Error"},
+        503: {"model": ErrorResponse, "description": "Queue Deadline Exceeded"}
     }
 )
 async def synthesize_speech(
     request: SynthesizeRequest,
+    response: Response,
+    response_mode: Optional[Literal["url", "auto", "base64", "binary"]] = Query(
+        default=None,
+        description="How the audio is returned (default: the server's RESPONSE_MODE)"
+    ),
     speech_service: SpeechService = Depends(get_speech_service),
+    tenant: str = Depends(get_tenant),
     _: None = Depends(rate_limit)
-) -> SynthesizeResponse:
+) -> SynthesizeResponse | Response:
     """
     Synthesize emotional speech from text.
     
     This endpoint generates speech audio with the specified emotion and intensity.
-    The audio is saved to the server and a URL is returned for download.
+    By default the audio is saved to the server and a URL is returned for download.
+    
+    **Query Parameters:**
+    - **response_mode**: `url` stores the audio and returns `audio_url`;
+      `base64` returns the audio in `audio_base64` without storing it;
+      `binary` returns the audio itself as the response body (job id,
+      duration and cache hit in `X-Job-ID`, `X-Duration-Seconds` and
+      `X-Cache-Hit`); `auto` returns clips up to `INLINE_AUDIO_MAX_BYTES`
+      in `audio_base64` and stores larger ones
     
     **Request Body:**
     - **text**: Input text to synthesize (1-5000 characters)
@@ -47,6 +101,7 @@ async def synthesize_speech(
     - **job_id**: Unique identifier for this synthesis job
     - **status**: Synthesis status (completed, processing, failed)
     - **audio_url**: URL to download the generated audio
+    - **audio_base64**: The generated audio, for inline responses
     - **duration_seconds**: Length of the generated audio
     - **metadata**: Processing details and metadata
     - **expires_at**: When the audio URL will expire
@@ -56,6 +111,7 @@ async def synthesize_speech(
         
         # Convert Pydantic model to dict
         options = request.options.model_dump() if request.options else None
+        mode = response_mode or speech_service.settings.response_mode
         
         # Synthesize speech
         result = await speech_service.synthesize(
@@ -65,26 +121,75 @@ async def synthesize_speech(
             voice_id=request.voice_id,
             output_format=request.output_format,
             sample_rate=request.sample_rate,
-            options=options
+            options=options,
+            tenant=tenant,
+            response_mode=_RESPONSE_MODES[mode],
+            model=request.model
         )
         
         processing_time = int((time.time() - start_time) * 1000)
         
+        headers = {}
+        if result.timings:
+            headers["Server-Timing"] = server_timing(result.timings)
+        
+        if mode == "binary":
+            return Response(
+                content=result.audio_data,
+                media_type=ENCODERS[request.output_format].media_type,
+                headers={
+                    "X-Job-ID": result.job_id,
+                    "X-Duration-Seconds": f"{result.duration:.3f}",
+                    "X-Cache-Hit": str(result.cached).lower(),
+                    **headers
+                }
+            )
+        response.headers.update(headers)
+        
+        audio_base64 = None
+        if result.audio_data is not None:
+            audio_base64 = base64.b64encode(result.audio_data).decode("ascii")
+        
         return SynthesizeResponse(
             job_id=result.job_id,
             status="completed",
             audio_url=result.audio_url,
+            audio_base64=audio_base64,
             duration_seconds=result.duration,
             metadata=SynthesisMetadata(
                 text_length=len(request.text),
                 emotion_applied=request.emotion,
                 intensity=request.intensity,
                 processing_time_ms=processing_time,
-                model=result.model_name
+                model=result.model_name,
+                cache_hit=result.cached,
+                stage_timings_ms=result.timings or None
             ),
             expires_at=result.expires_at
         )
         
+    except QueueFullException as e:
+        logger.warning(f"Synthesis rejected: {e}")
+        raise HTTPException(
+            status_code=429,
+            detail={
+                "code": "QUEUE_FULL",
+                "message": str(e),
+                "request_id": "request_id_placeholder"
+            },
+            headers={"Retry-After": "1"}
+        )
+    except DeadlineExceededException as e:
+        logger.warning(f"Synthesis dropped: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "code": "DEADLINE_EXCEEDED",
+                "message": str(e),
+                "request_id": "request_id_placeholder"
+            },
+            headers={"Retry-After": "1"}
+        )
     except ValueError as e:
         logger.error(f"Validation error: {e}")
         raise HTTPException(
@@ -107,37 +212,386 @@ async def synthesize_speech(
         )
 
 
-@router.get("/audio/{filename}")
-async def get_audio_file(filename: str) -> FileResponse:
+@router.post(
+    "/batch",
+    response_model=BatchSynthesizeResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "Bad Request"},
+        422: {"model": ErrorResponse, "description": "Validation Error"},
+        429: {"model": ErrorResponse, "description": "Inference Queue Full"},
+        503: {"model": ErrorResponse, "description": "Queue Deadline Exceeded"}
+    }
+)
+async def synthesize_batch(
+    request: BatchSynthesizeRequest,
+    speech_service: SpeechService = Depends(get_speech_service),
+    tenant: str = Depends(get_tenant),
+    _: None = Depends(rate_limit)
+) -> BatchSynthesizeResponse:
+    """
+    Synthesize many texts in one request.
+    
+    Items sharing emotion, intensity, voice and sample rate are rendered
+    together with a single batched model invocation, which is considerably
+    faster than sending them as separate `/speech/synthesize` calls.
+    
+    **Request Body:**
+    - **items**: List of `/speech/synthesize` request bodies
+    
+    **Response:**
+    A manifest with one entry per item, in request order. Items fail
+    individually; the batch status is `partial` if only some succeeded.
+    """
+    max_items = speech_service.settings.batch_max_items
+    if len(request.items) > max_items:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "code": "BATCH_TOO_LARGE",
+                "message": f"Batch has {len(request.items)} items, maximum is {max_items}",
+                "request_id": "request_id_placeholder"
+            }
+        )
+    
+    start_time = time.time()
+    items = [
+        BatchItem(
+            text=item.text,
+            emotion=item.emotion,
+            intensity=item.intensity,
+            voice_id=item.voice_id,
+            output_format=item.output_format,
+            sample_rate=item.sample_rate,
+            options=item.options.model_dump() if item.options else None,
+            model=item.model
+        )
+        for item in request.items
+    ]
+    
+    try:
+        batch = await speech_service.synthesize_batch(items, tenant=tenant)
+    except QueueFullException as e:
+        logger.warning(f"Batch rejected: {e}")
+        raise HTTPException(
+            status_code=429,
+            detail={
+                "code": "QUEUE_FULL",
+                "message": str(e),
+                "request_id": "request_id_placeholder"
+            },
+            headers={"Retry-After": "1"}
+        )
+    except DeadlineExceededException as e:
+        logger.warning(f"Batch dropped: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "code": "DEADLINE_EXCEEDED",
+                "message": str(e),
+                "request_id": "request_id_placeholder"
+            },
+            headers={"Retry-After": "1"}
+        )
+    
+    item_responses = []
+    for item in batch.items:
+        if item.result is None:
+            item_responses.append(BatchItemResponse(index=item.index, status="failed", error=item.error))
+        else:
+            item_responses.append(BatchItemResponse(
+                index=item.index,
+                status="completed",
+                job_id=item.result.job_id,
+                audio_url=item.result.audio_url,
+                duration_seconds=item.result.duration,
+                cache_hit=item.result.cached,
+                model=item.result.model_name
+            ))
+    
+    succeeded = sum(1 for item in item_responses if item.status == "completed")
+    if succeeded == len(item_responses):
+        status = "completed"
+    elif succeeded:
+        status = "partial"
+    else:
+        status = "failed"
+    
+    return BatchSynthesizeResponse(
+        batch_id=batch.batch_id,
+        status=status,
+        total=len(item_responses),
+        succeeded=succeeded,
+        failed=len(item_responses) - succeeded,
+        groups=batch.group_count,
+        processing_time_ms=int((time.time() - start_time) * 1000),
+        model=batch.model_name,
+        items=item_responses
+    )
+
+
+def _job_response(job: Job) -> JobResponse:
+    """Convert a job snapshot to its API representation."""
+    return JobResponse(
+        job_id=job.job_id,
+        status=job.status,
+        progress=JobProgress(chunks_done=job.chunks_done, chunks_total=job.chunks_total),
+        status_url=f"/v1/speech/jobs/{job.job_id}",
+        audio_url=job.audio_url,
+        duration_seconds=job.duration,
+        model=job.model_name,
+        cache_hit=job.cached,
+        error=job.error,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+        expires_at=job.expires_at
+    )
+
+
+@router.post(
+    "/jobs",
+    response_model=JobResponse,
+    status_code=202,
+    responses={
+        400: {"model": ErrorResponse, "description": "Bad Request"},
+        422: {"model": ErrorResponse, "description": "Validation Error"},
+        429: {"model": ErrorResponse, "description": "Job Queue Full"}
+    }
+)
+async def create_job(
+    request: SynthesizeRequest,
+    speech_service: SpeechService = Depends(get_speech_service),
+    job_store: JobStore = Depends(get_job_store),
+    tenant: str = Depends(get_tenant),
+    _: None = Depends(rate_limit)
+) -> JobResponse:
+    """
+    Start synthesis in the background.
+    
+    Returns immediately with a job that can be polled at
+    `GET /speech/jobs/{job_id}`, instead of holding the connection open for
+    the whole render. Suited to long narrations.
+    
+    **Request Body:**
+    Same as `/speech/synthesize`.
+    
+    **Response:**
+    The initial job state (`queued`, or `completed` if the result was
+    already cached) with a `status_url` to poll.
+    """
+    try:
+        options = request.options.model_dump() if request.options else None
+        
+        # The cache lookup reads files, so keep it off the event loop
+        job = await run_in_threadpool(
+            speech_service.submit_job,
+            job_store,
+            text=request.text,
+            emotion=request.emotion,
+            intensity=request.intensity,
+            voice_id=request.voice_id,
+            output_format=request.output_format,
+            sample_rate=request.sample_rate,
+            options=options,
+            tenant=tenant,
+            model=request.model
+        )
+    except QueueFullException as e:
+        logger.warning(f"Job rejected: {e}")
+        raise HTTPException(
+            status_code=429,
+            detail={
+                "code": "QUEUE_FULL",
+                "message": str(e),
+                "request_id": "request_id_placeholder"
+            },
+            headers={"Retry-After": "5"}
+        )
+    except ValueError as e:
+        logger.error(f"Validation error: {e}")
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "code": "VALIDATION_ERROR",
+                "message": str(e),
+                "request_id": "request_id_placeholder"
+            }
+        )
+    
+    return _job_response(job)
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=JobResponse,
+    responses={
+        404: {"model": ErrorResponse, "description": "Job Not Found"}
+    }
+)
+async def get_job(
+    job_id: str,
+    job_store: JobStore = Depends(get_job_store)
+) -> JobResponse:
+    """
+    Get the state of a background synthesis job.
+    
+    **Parameters:**
+    - **job_id**: Identifier returned by `POST /speech/jobs`
+    
+    **Response:**
+    Current status, progress as chunks done out of total, and the audio URL
+    once the job has completed.
+    """
+    job = job_store.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "code": "JOB_NOT_FOUND",
+                "message": f"Job '{job_id}' not found",
+                "request_id": "request_id_placeholder"
+            }
+        )
+    return _job_response(job)
+
+
+@router.post(
+    "/stream",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {"audio/wav": {}, "audio/pcm": {}, "audio/ogg": {}, "audio/mpeg": {}},
+            "description": "Audio stream"
+        },
+        400: {"model": ErrorResponse, "description": "Bad Request"},
+        422: {"model": ErrorResponse, "description": "Validation Error"},
+        429: {"model": ErrorResponse, "description": "Inference Queue Full"}
+    }
+)
+async def stream_speech(
+    request: StreamSynthesizeRequest,
+    speech_service: SpeechService = Depends(get_speech_service),
+    tenant: str = Depends(get_tenant),
+    _: None = Depends(rate_limit)
+) -> StreamingResponse:
+    """
+    Stream emotional speech as it is synthesized.
+    
+    The text is split at sentence boundaries and each chunk is sent as soon
+    as it has been synthesized and post-processed, so playback can start
+    after the first sentence instead of after the whole text.
+    
+    **Request Body:**
+    Same as `/speech/synthesize`, except **output_format** is one of
+    wav (open-ended header), pcm (raw 16-bit little-endian mono), ogg or mp3.
+    
+    **Response:**
+    A chunked audio body. The `X-Chunk-Count` header gives the number of
+    text chunks that will be rendered.
+    """
+    try:
+        options = request.options.model_dump() if request.options else None
+        
+        stream = speech_service.synthesize_stream(
+            text=request.text,
+            emotion=request.emotion,
+            intensity=request.intensity,
+            voice_id=request.voice_id,
+            output_format=request.output_format,
+            sample_rate=request.sample_rate,
+            options=options,
+            tenant=tenant,
+            model=request.model
+        )
+    except QueueFullException as e:
+        logger.warning(f"Stream rejected: {e}")
+        raise HTTPException(
+            status_code=429,
+            detail={
+                "code": "QUEUE_FULL",
+                "message": str(e),
+                "request_id": "request_id_placeholder"
+            },
+            headers={"Retry-After": "1"}
+        )
+    except ValueError as e:
+        logger.error(f"Validation error: {e}")
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "code": "VALIDATION_ERROR",
+                "message": str(e),
+                "request_id": "request_id_placeholder"
+            }
+        )
+    
+    return StreamingResponse(
+        stream.chunks,
+        media_type=stream.media_type,
+        headers={"X-Chunk-Count": str(stream.chunk_count)}
+    )
+
+
+@router.get(
+    "/audio/{filename}",
+    response_class=Response,
+    responses={
+        200: {"description": "Audio file"},
+        206: {"description": "Requested byte range of the audio file"},
+        304: {"description": "Client's cached copy is current"},
+        404: {"description": "Audio file not found"},
+        416: {"description": "Range not satisfiable"}
+    }
+)
+async def get_audio_file(
+    filename: str,
+    request: Request,
+    speech_service: SpeechService = Depends(get_speech_service)
+) -> Response:
     """
     Download generated audio file.
     
+    Supports single byte ranges (`Range`, `If-Range`) for seeking and resumed
+    downloads, and conditional requests (`If-None-Match`,
+    `If-Modified-Since`). Generated files never change, so responses may be
+    cached for `AUDIO_CACHE_MAX_AGE` seconds.
+    
     **Parameters:**
     - **filename**: Name of the audio file to download
     
     **Returns:**
-    The audio file as a downloadable response.
+    The audio file (200), the requested part of it (206), or 304 if the
+    client's copy is current.
     """
     from pathlib import Path
     from config.settings import get_settings
     
     settings = get_settings()
-    file_path = Path(settings.audio_output_dir) / filename
     
-    if not file_path.exists():
+    # Dotfiles are temporary files and the storage index, never audio
+    if filename.startswith("."):
         raise HTTPException(status_code=404, detail="Audio file not found")
     
+    # Files not yet moved by scripts/migrate_audio_layout.py are still flat
+    # (only regular files: names like "chunks" are directories of the store)
+    file_path = shard_path(settings.audio_output_dir, filename)
+    if not file_path.is_file():
+        file_path = Path(settings.audio_output_dir) / filename
+        if not file_path.is_file():
+            raise HTTPException(status_code=404, detail="Audio file not found")
+    
+    # Downloads count as use, so the reaper expires files by last access;
+    # the index write may wait on SQLite's lock, so keep it off the event loop
+    await run_in_threadpool(speech_service.audio_index.touch, file_path)
+    
     # Determine media type based on extension
-    media_type_map = {
-        ".wav": "audio/wav",
-        ".mp3": "audio/mpeg",
-        ".ogg": "audio/ogg"
-    }
-    media_type = media_type_map.get(file_path.suffix, "application/octet-stream")
+    audio_format = ENCODERS.get(file_path.suffix.lstrip("."))
+    media_type = audio_format.media_type if audio_format else "application/octet-stream"
     
-    return FileResponse(
-        path=str(file_path),
+    return file_response(
+        request,
+        file_path,
         media_type=media_type,
-        filename=filename
+        filename=filename,
+        cache_control=f"public, max-age={settings.audio_cache_max_age}, immutable"
     )
 
@@ -1,7 +1,7 @@
 """TTS request and response schemas."""
 
 from datetime import datetime
-from typing import Optional, Literal
+from typing import Dict, List, Optional, Literal
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -24,6 +24,9 @@ class SynthesizeRequest(BaseModel):
     output_format: Literal["wav", "mp3", "ogg"] = Field(default="wav", description="Audio format")
     sample_rate: Literal[16000, 22050, 24000, 44100] = Field(default=24000, description="Sample rate in Hz")
     options: Optional[SynthesisOptions] = Field(default=None, description="Additional synthesis options")
+    model: Optional[str] = Field(
+        default=None, description="Model to synthesize with (the server's default model if omitted)"
+    )
     
     @field_validator("emotion")
     @classmethod
@@ -55,6 +58,15 @@ class SynthesizeRequest(BaseModel):
     }
 
 
+class StreamSynthesizeRequest(SynthesizeRequest):
+    """Request schema for streaming speech synthesis."""
+    
+    output_format: Literal["wav", "pcm", "ogg", "mp3"] = Field(
+        default="wav",
+        description="Stream format (wav with open-ended header, raw 16-bit PCM, Ogg Vorbis or MP3)"
+    )
+
+
 class SynthesisMetadata(BaseModel):
     """Metadata about the synthesis process."""
     
@@ -63,6 +75,10 @@ class SynthesisMetadata(BaseModel):
     intensity: float = Field(..., description="Intensity that was used")
     processing_time_ms: int = Field(..., description="Processing time in milliseconds")
     model: str = Field(..., description="Model name used")
+    cache_hit: bool = Field(default=False, description="Whether the audio was served from the synthesis cache")
+    stage_timings_ms: Optional[Dict[str, float]] = Field(
+        default=None, description="Time spent in each pipeline stage in milliseconds"
+    )
 
 
 class SynthesizeResponse(BaseModel):
@@ -97,3 +113,92 @@ class SynthesizeResponse(BaseModel):
         }
     }
 
+
+
+class BatchSynthesizeRequest(BaseModel):
+    """Request schema for batch speech synthesis."""
+    
+    items: List[SynthesizeRequest] = Field(..., min_length=1, description="Texts to synthesize")
+    
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "items": [
+                        {"text": "Chapter one.", "emotion": "serious", "intensity": 0.6},
+                        {"text": "The storm arrived at dawn.", "emotion": "serious", "intensity": 0.6},
+                        {"text": "Nobody saw it coming.", "emotion": "urgent", "intensity": 0.8}
+                    ]
+                }
+            ]
+        }
+    }
+
+
+class BatchItemResponse(BaseModel):
+    """Outcome of one batch item."""
+    
+    index: int = Field(..., description="Position of the item in the request")
+    status: Literal["completed", "failed"] = Field(..., description="Item status")
+    job_id: Optional[str] = Field(None, description="Job identifier of the rendered audio")
+    audio_url: Optional[str] = Field(None, description="URL to download audio")
+    duration_seconds: Optional[float] = Field(None, description="Audio duration in seconds")
+    cache_hit: bool = Field(default=False, description="Whether the audio was served from the synthesis cache")
+    model: Optional[str] = Field(None, description="Model name used")
+    error: Optional[str] = Field(None, description="Failure reason")
+
+
+class BatchSynthesizeResponse(BaseModel):
+    """Manifest returned for a batch synthesis request."""
+    
+    batch_id: str = Field(..., description="Unique batch identifier")
+    status: Literal["completed", "partial", "failed"] = Field(..., description="Overall batch status")
+    total: int = Field(..., description="Number of items in the batch")
+    succeeded: int = Field(..., description="Number of items rendered")
+    failed: int = Field(..., description="Number of items that failed")
+    groups: int = Field(..., description="Number of model invocation groups")
+    processing_time_ms: int = Field(..., description="Processing time in milliseconds")
+    model: Optional[str] = Field(
+        default=None, description="Model used by every item (null when items use different models)"
+    )
+    items: List[BatchItemResponse] = Field(..., description="Per-item results in request order")
+
+
+class JobProgress(BaseModel):
+    """Progress of an asynchronous synthesis job."""
+    
+    chunks_done: int = Field(..., description="Text chunks synthesized so far")
+    chunks_total: int = Field(..., description="Total number of text chunks")
+
+
+class JobResponse(BaseModel):
+    """State of an asynchronous synthesis job."""
+    
+    job_id: str = Field(..., description="Unique job identifier")
+    status: Literal["queued", "processing", "completed", "failed"] = Field(..., description="Job status")
+    progress: JobProgress = Field(..., description="Synthesis progress")
+    status_url: str = Field(..., description="URL to poll for job status")
+    audio_url: Optional[str] = Field(None, description="URL to download audio once completed")
+    duration_seconds: Optional[float] = Field(None, description="Audio duration in seconds")
+    model: Optional[str] = Field(None, description="Model name used")
+    cache_hit: bool = Field(default=False, description="Whether the audio was served from the synthesis cache")
+    error: Optional[str] = Field(None, description="Failure reason")
+    created_at: datetime = Field(..., description="When the job was submitted")
+    updated_at: datetime = Field(..., description="When the job last changed")
+    expires_at: Optional[datetime] = Field(None, description="Audio URL expiration time")
+    
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "job_id": "123e4567-e89b-12d3-a456-426614174000",
+                    "status": "processing",
+                    "progress": {"chunks_done": 4, "chunks_total": 11},
+                    "status_url": "/v1/speech/jobs/123e4567-e89b-12d3-a456-426614174000",
+                    "audio_url": None,
+                    "created_at": "2025-10-30T12:00:00Z",
+                    "updated_at": "2025-10-30T12:00:09Z"
+                }
+            ]
+        }
+    }
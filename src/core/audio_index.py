@@ -0,0 +1,227 @@
+"""On-disk index of generated audio files."""
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Iterable, List, Tuple
+
+# (relative path, size in bytes, last access time)
+IndexEntry = Tuple[str, int, float]
+
+
+class AudioIndex:
+    """SQLite index of the files below an audio directory.
+
+    Tracks size, creation and last access time of every file, so expiry and
+    quota enforcement can find candidates with an indexed query instead of
+    listing the directory. Paths are stored relative to ``root``; files whose
+    name starts with a dot (temporary files, the index itself) are ignored.
+
+    The database lives inside ``root`` and may be shared by several
+    processes; SQLite serializes their writes.
+
+    File and byte totals are kept as running counters, so reading them
+    never queries the database. They follow this process's writes only;
+    ``recount`` resets them from the table (the reaper does so every pass).
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        filename: str = ".index.sqlite3",
+        clock: Callable[[], float] = time.time
+    ):
+        """Open (or create) the index.
+
+        Args:
+            root: Directory whose files are indexed
+            filename: Database file name inside ``root``
+            clock: Time source for access times
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            str(self.root / filename),
+            timeout=30,
+            isolation_level=None,
+            check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            " path TEXT PRIMARY KEY,"
+            " size INTEGER NOT NULL,"
+            " created REAL NOT NULL,"
+            " accessed REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS files_accessed ON files (accessed)")
+        # (files, bytes), replaced as a whole so readers need no lock
+        self._totals: Tuple[int, int] = (0, 0)
+        self.recount()
+
+    def _relative(self, path: str | Path) -> str:
+        """Index key for a path below ``root``."""
+        return Path(path).relative_to(self.root).as_posix()
+
+    def record(self, path: str | Path, size: int) -> None:
+        """Add or replace a file that has just been written.
+
+        Args:
+            path: File path below ``root``
+            size: File size in bytes
+        """
+        now = self.clock()
+        key = self._relative(path)
+        with self._lock:
+            previous = self._db.execute("SELECT size FROM files WHERE path = ?", (key,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO files (path, size, created, accessed) VALUES (?, ?, ?, ?)",
+                (key, size, now, now)
+            )
+            files, total = self._totals
+            if previous is None:
+                self._totals = (files + 1, total + size)
+            else:
+                self._totals = (files, total + size - previous[0])
+
+    def touch(self, path: str | Path) -> None:
+        """Mark a file as used now.
+
+        Args:
+            path: File path below ``root``
+        """
+        with self._lock:
+            self._db.execute(
+                "UPDATE files SET accessed = ? WHERE path = ?",
+                (self.clock(), self._relative(path))
+            )
+
+    def expired(self, accessed_before: float, limit: int) -> List[IndexEntry]:
+        """Files not used since a point in time, least recently used first.
+
+        Args:
+            accessed_before: Cut-off time
+            limit: Maximum number of entries
+
+        Returns:
+            List of (path, size, accessed)
+        """
+        with self._lock:
+            return self._db.execute(
+                "SELECT path, size, accessed FROM files WHERE accessed < ?"
+                " ORDER BY accessed LIMIT ?",
+                (accessed_before, limit)
+            ).fetchall()
+
+    def least_recent(self, limit: int) -> List[IndexEntry]:
+        """Least recently used files.
+
+        Args:
+            limit: Maximum number of entries
+
+        Returns:
+            List of (path, size, accessed)
+        """
+        with self._lock:
+            return self._db.execute(
+                "SELECT path, size, accessed FROM files ORDER BY accessed LIMIT ?",
+                (limit,)
+            ).fetchall()
+
+    def forget(self, entries: Iterable[IndexEntry]) -> None:
+        """Remove entries, unless the file was used again since they were read.
+
+        Args:
+            entries: Entries as returned by ``expired`` or ``least_recent``
+        """
+        with self._lock:
+            removed = removed_bytes = 0
+            self._db.execute("BEGIN")
+            for path, size, accessed in entries:
+                cursor = self._db.execute(
+                    "DELETE FROM files WHERE path = ? AND accessed <= ?", (path, accessed)
+                )
+                if cursor.rowcount:
+                    removed += 1
+                    removed_bytes += size
+            self._db.execute("COMMIT")
+            files, total = self._totals
+            self._totals = (files - removed, total - removed_bytes)
+
+    def relocate(self, moves: Iterable[Tuple[str | Path, str | Path]]) -> None:
+        """Update the paths of moved files, keeping their access times.
+
+        Args:
+            moves: Pairs of (old path, new path) below ``root``
+        """
+        with self._lock:
+            self._db.executemany(
+                "UPDATE OR REPLACE files SET path = ? WHERE path = ?",
+                [(self._relative(new), self._relative(old)) for old, new in moves]
+            )
+
+    def totals(self) -> Tuple[int, int]:
+        """Number of indexed files and their total size in bytes (running counters)."""
+        return self._totals
+
+    def recount(self) -> Tuple[int, int]:
+        """Reset the running totals from the table with one full query.
+
+        Returns:
+            Tuple of (files, bytes)
+        """
+        with self._lock:
+            count, size = self._db.execute("SELECT COUNT(*), SUM(size) FROM files").fetchone()
+            self._totals = (count, size or 0)
+        return self._totals
+
+    def reconcile(self) -> Tuple[int, int]:
+        """Bring the index in line with the directory with one full scan.
+
+        Files missing from the index (e.g. written before it existed) are
+        added with their modification time as creation and access time;
+        entries whose file is gone are dropped.
+
+        Returns:
+            Tuple of (files added, entries dropped)
+        """
+        on_disk = {}
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            for name in filenames:
+                if name.startswith("."):
+                    continue
+                path = Path(dirpath) / name
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                on_disk[self._relative(path)] = (stat.st_size, stat.st_mtime)
+
+        with self._lock:
+            indexed = {row[0] for row in self._db.execute("SELECT path FROM files")}
+            added = [
+                (path, size, mtime, mtime)
+                for path, (size, mtime) in on_disk.items() if path not in indexed
+            ]
+            missing = [(path,) for path in indexed if path not in on_disk]
+            self._db.execute("BEGIN")
+            self._db.executemany(
+                "INSERT OR IGNORE INTO files (path, size, created, accessed) VALUES (?, ?, ?, ?)",
+                added
+            )
+            self._db.executemany("DELETE FROM files WHERE path = ?", missing)
+            self._db.execute("COMMIT")
+        self.recount()
+        return len(added), len(missing)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
@@ -1,11 +1,34 @@
 """Audio post-processing utilities."""
 
+from fractions import Fraction
+from math import gcd
+
 import numpy as np
 import soundfile as sf
 from scipy import signal
 from pathlib import Path
 from typing import Tuple
 
+from src.core import encoders
+from src.core.resampler import get_resampler
+from src.core.time_stretch import fft_size_for, get_phase_vocoder
+from src.utils.timing import span
+
+# Largest up/down factor handled by the polyphase resampler; beyond this
+# the filter gets long enough that FFT resampling is cheaper
+MAX_POLYPHASE_FACTOR = 1000
+
+# Pitch ratios are rounded to a fraction with at most this denominator so the
+# resampling filters stay short (e.g. 1.15 -> 23/20)
+MAX_PITCH_DENOMINATOR = 100
+
+
+def _fit_length(audio: np.ndarray, length: int) -> np.ndarray:
+    """Trim or zero-pad audio to an exact length."""
+    if len(audio) >= length:
+        return audio[:length]
+    return np.pad(audio, (0, length - len(audio)))
+
 
 class AudioProcessor:
     """Process and enhance synthesized audio."""
@@ -51,43 +74,67 @@ class AudioProcessor:
         self, 
         audio: np.ndarray, 
         threshold: float = -40.0,
-        min_silence_duration: float = 0.3
+        min_silence_duration: float = 0.3,
+        sample_rate: int | None = None
     ) -> np.ndarray:
         """Remove long silence from audio.
         
+        Frame energies are computed on a zero-copy sliding-window view. A
+        sample counts as silent only if every frame covering it is below the
+        threshold, and only silent runs of at least ``min_silence_duration``
+        are removed, so natural pauses between words are preserved.
+        
         Args:
             audio: Input audio array
             threshold: Silence threshold in dB
             min_silence_duration: Minimum silence duration to remove (seconds)
+            sample_rate: Sample rate (uses instance default if not provided)
             
         Returns:
             Audio with silence removed
         """
-        # Calculate frame energy
-        frame_length = int(0.02 * self.sample_rate)  # 20ms frames
+        sr = sample_rate or self.sample_rate
+        frame_length = int(0.02 * sr)  # 20ms frames
         hop_length = frame_length // 2
         
+        if hop_length == 0 or len(audio) < frame_length:
+            return audio
+        
         # Calculate energy per frame
-        energy = np.array([
-            np.sum(audio[i:i + frame_length] ** 2)
-            for i in range(0, len(audio) - frame_length, hop_length)
-        ])
+        frames = np.lib.stride_tricks.sliding_window_view(
+            np.square(audio), frame_length
+        )[::hop_length]
+        energy = frames.sum(axis=1, dtype=np.float64)
         
-        # Convert to dB
+        # Convert to dB and identify silent frames
         energy_db = 10 * np.log10(energy + 1e-10)
+        silent = energy_db <= threshold
         
-        # Identify non-silent frames
-        non_silent = energy_db > threshold
+        # Find runs of consecutive silent frames [first, last]
+        edges = np.diff(np.concatenate(([0], silent.astype(np.int8), [0])))
+        first = np.flatnonzero(edges == 1)
+        last = np.flatnonzero(edges == -1) - 1
         
-        # Expand frame decisions to samples
-        mask = np.repeat(non_silent, hop_length)
-        mask = mask[:len(audio)]
+        # Map each run to the samples covered only by its silent frames:
+        # the neighbouring voiced frames overlap the run's outer edges
+        n_frames = len(energy)
+        run_start = np.where(first > 0, (first - 1) * hop_length + frame_length, 0)
+        run_end = np.where(
+            last < n_frames - 1, (last + 1) * hop_length, last * hop_length + frame_length
+        )
         
-        # Ensure mask covers all samples
-        if len(mask) < len(audio):
-            mask = np.pad(mask, (0, len(audio) - len(mask)), constant_values=True)
+        min_samples = max(int(min_silence_duration * sr), 1)
+        long_runs = (run_end - run_start) >= min_samples
+        if not long_runs.any():
+            return audio
         
-        return audio[mask]
+        # Keep everything between the removed runs
+        keep_starts = np.concatenate(([0], run_end[long_runs]))
+        keep_ends = np.concatenate((run_start[long_runs], [len(audio)]))
+        segments = [
+            audio[start:end] for start, end in zip(keep_starts, keep_ends) if end > start
+        ]
+        return np.concatenate(segments) if segments else audio[:0]
 
     def apply_compression(
         self, 
@@ -120,6 +167,10 @@ class AudioProcessor:
     def resample(self, audio: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
         """Resample audio to target sample rate.
         
+        Rate pairs with a small rational ratio (all supported output rates)
+        use a polyphase filter designed once per pair; other ratios fall back
+        to FFT resampling.
+        
         Args:
             audio: Input audio array
             orig_sr: Original sample rate
@@ -131,36 +182,88 @@ class AudioProcessor:
         if orig_sr == target_sr:
             return audio
         
+        divisor = gcd(orig_sr, target_sr)
+        if max(orig_sr, target_sr) // divisor <= MAX_POLYPHASE_FACTOR:
+            return get_resampler(orig_sr, target_sr).process(audio)
+        
         # Calculate resampling ratio
         num_samples = int(len(audio) * target_sr / orig_sr)
         
         # Use scipy's resample
         return signal.resample(audio, num_samples)
 
-    def change_speed(self, audio: np.ndarray, speed: float) -> np.ndarray:
-        """Change audio playback speed.
+    def change_speed(
+        self,
+        audio: np.ndarray,
+        speed: float,
+        sample_rate: int | None = None
+    ) -> np.ndarray:
+        """Change audio tempo without changing pitch.
         
         Args:
             audio: Input audio array
             speed: Speed multiplier (0.5-2.0, where 1.0 is original speed)
+            sample_rate: Sample rate of the audio (uses instance default if not provided)
             
         Returns:
             Speed-adjusted audio
         """
-        if speed == 1.0:
+        return self.shift_pitch(audio, 1.0, speed=speed, sample_rate=sample_rate)
+
+    def shift_pitch(
+        self,
+        audio: np.ndarray,
+        pitch_scale: float,
+        speed: float = 1.0,
+        sample_rate: int | None = None
+    ) -> np.ndarray:
+        """Shift pitch and change tempo independently.
+        
+        The audio is time-stretched by ``speed / pitch_scale`` and then
+        resampled by ``pitch_scale``, so both changes cost a single vocoder
+        pass.
+        
+        Args:
+            audio: Input audio array
+            pitch_scale: Pitch multiplier (1.0 keeps the original pitch)
+            speed: Speed multiplier (1.0 keeps the original tempo)
+            sample_rate: Sample rate of the audio (uses instance default if not provided)
+            
+        Returns:
+            Audio of length ``int(len(audio) / speed)``
+        """
+        if pitch_scale == 1.0 and speed == 1.0:
             return audio
         
-        # Calculate new length
-        new_length = int(len(audio) / speed)
+        ratio = Fraction(pitch_scale).limit_denominator(MAX_PITCH_DENOMINATOR)
+        sr = sample_rate or self.sample_rate
+        vocoder = get_phase_vocoder(fft_size_for(sr))
         
-        # Resample to change speed
-        return signal.resample(audio, new_length)
+        stretched = vocoder.stretch(audio, speed / float(ratio))
+        if ratio != 1:
+            stretched = get_resampler(ratio.numerator, ratio.denominator).process(stretched)
+        return _fit_length(stretched, int(len(audio) / speed))
+
+    def apply_energy(self, audio: np.ndarray, energy_scale: float) -> np.ndarray:
+        """Scale signal energy.
+        
+        Args:
+            audio: Input audio array
+            energy_scale: Energy multiplier (amplitude is scaled by its square root)
+            
+        Returns:
+            Scaled audio, clipped to [-1, 1]
+        """
+        if energy_scale == 1.0:
+            return audio
+        return np.clip(audio * np.sqrt(energy_scale), -1.0, 1.0).astype(audio.dtype, copy=False)
 
     def save_audio(
         self, 
         audio: np.ndarray, 
         output_path: str | Path,
-        sample_rate: int | None = None
+        sample_rate: int | None = None,
+        output_format: str | None = None
     ) -> None:
         """Save audio to file.
         
@@ -168,16 +271,19 @@ class AudioProcessor:
             audio: Audio array to save
             output_path: Output file path
             sample_rate: Sample rate (uses instance default if not provided)
+            output_format: Registered output format (defaults to the file extension)
+            
+        Raises:
+            ValueError: If the format is not supported
         """
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         sr = sample_rate or self.sample_rate
+        output_format = output_format or output_path.suffix.lstrip(".").lower() or "wav"
         
-        # Ensure audio is in correct format
-        audio = np.clip(audio, -1.0, 1.0)
-        
-        sf.write(str(output_path), audio, sr, subtype='PCM_16')
+        with open(output_path, "w+b") as f:
+            encoders.encode(audio, output_format, sr, f)
 
     def load_audio(self, audio_path: str | Path) -> Tuple[np.ndarray, int]:
         """Load audio from file.
@@ -197,35 +303,53 @@ class AudioProcessor:
         normalize: bool = True,
         remove_silence: bool = False,
         compress: bool = False,
-        speed: float = 1.0
+        speed: float = 1.0,
+        sample_rate: int | None = None,
+        pitch_scale: float = 1.0,
+        energy_scale: float = 1.0
     ) -> np.ndarray:
         """Apply complete audio processing pipeline.
         
+        Each stage that runs is timed as a span (``time_stretch``,
+        ``remove_silence``, ``compress``, ``normalize``, ``energy``) of the
+        active ``Timings``, if any.
+        
         Args:
             audio: Input audio array
             normalize: Whether to normalize audio
             remove_silence: Whether to remove silence
             compress: Whether to apply compression
             speed: Speed adjustment factor
+            sample_rate: Sample rate of the audio (uses instance default if not provided)
+            pitch_scale: Pitch multiplier from emotion prosody
+            energy_scale: Energy multiplier from emotion prosody
             
         Returns:
             Processed audio
         """
-        # Apply speed change
-        if speed != 1.0:
-            audio = self.change_speed(audio, speed)
+        # Apply speed change and pitch shift
+        if speed != 1.0 or pitch_scale != 1.0:
+            with span("time_stretch"):
+                audio = self.shift_pitch(audio, pitch_scale, speed=speed, sample_rate=sample_rate)
         
         # Remove silence
         if remove_silence:
-            audio = self.remove_silence(audio)
+            with span("remove_silence"):
+                audio = self.remove_silence(audio, sample_rate=sample_rate)
         
         # Apply compression
         if compress:
-            audio = self.apply_compression(audio)
+            with span("compress"):
+                audio = self.apply_compression(audio)
         
         # Normalize
         if normalize:
-            audio = self.normalize_audio(audio)
+            with span("normalize"):
+                audio = self.normalize_audio(audio)
+        
+        # Apply energy after normalization, which would otherwise undo it
+        if energy_scale != 1.0:
+            with span("energy"):
+                audio = self.apply_energy(audio, energy_scale)
         
         return audio
-
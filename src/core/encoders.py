@@ -0,0 +1,410 @@
+"""Audio output encoders: whole-file and incremental (streaming)."""
+
+import struct
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import BinaryIO, Dict, List, Optional, Type
+
+import numpy as np
+import soundfile as sf
+
+# Samples converted and written per call when encoding a whole signal, so
+# the clipped float32 copy never holds more than one block
+ENCODE_BLOCK_SIZE = 65536
+
+
+def to_pcm16(audio: np.ndarray) -> bytes:
+    """Convert float audio to 16-bit little-endian PCM bytes.
+    
+    Args:
+        audio: Audio array in the range [-1.0, 1.0]
+        
+    Returns:
+        Raw PCM bytes
+    """
+    audio = np.clip(audio, -1.0, 1.0)
+    return (audio * 32767.0).astype("<i2").tobytes()
+
+
+class _ForwardSink:
+    """Append-only file object for soundfile's virtual I/O.
+    
+    Encoded bytes are collected until drained by the caller, so memory use
+    stays bounded by the size of one encoded block. Seeks back into data that
+    was already drained (header fix-ups at close) are accepted but their
+    writes are discarded, since those bytes have already been sent.
+    """
+
+    def __init__(self):
+        self._pending: List[bytes] = []
+        self._position = 0
+        self._end = 0
+
+    def write(self, data: bytes) -> int:
+        data = bytes(data)
+        if self._position >= self._end:
+            self._pending.append(data)
+            self._end += len(data)
+        self._position += len(data)
+        return len(data)
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        if whence == 0:
+            self._position = offset
+        elif whence == 1:
+            self._position += offset
+        else:
+            self._position = self._end + offset
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+    def read(self, size: int = -1) -> bytes:
+        return b""
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        """Return and forget all bytes written since the last drain."""
+        data = b"".join(self._pending)
+        self._pending = []
+        return data
+
+
+class EncoderStats:
+    """Thread-safe per-format counters for encoder throughput."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._formats: Dict[str, Dict[str, float]] = {}
+
+    def record(self, output_format: str, audio_seconds: float, num_bytes: int, seconds: float) -> None:
+        """Record one encode.
+        
+        Args:
+            output_format: Format name
+            audio_seconds: Duration of the encoded audio
+            num_bytes: Encoded size in bytes
+            seconds: Time spent in the encoder
+        """
+        with self._lock:
+            entry = self._formats.setdefault(
+                output_format,
+                {"count": 0, "audio_seconds": 0.0, "bytes": 0, "encode_seconds": 0.0}
+            )
+            entry["count"] += 1
+            entry["audio_seconds"] += audio_seconds
+            entry["bytes"] += num_bytes
+            entry["encode_seconds"] += seconds
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Get encoder statistics.
+        
+        Returns:
+            Per-format count, bytes, audio seconds, total encode time,
+            encoded bytes per second of audio and encoder throughput
+        """
+        with self._lock:
+            stats = {}
+            for name, entry in self._formats.items():
+                audio_seconds = entry["audio_seconds"]
+                encode_seconds = entry["encode_seconds"]
+                stats[name] = {
+                    "count": entry["count"],
+                    "bytes": entry["bytes"],
+                    "audio_seconds": round(audio_seconds, 3),
+                    "encode_ms": round(encode_seconds * 1000, 3),
+                    "bytes_per_audio_second": (
+                        round(entry["bytes"] / audio_seconds, 1) if audio_seconds else 0.0
+                    ),
+                    "encode_bytes_per_second": (
+                        round(entry["bytes"] / encode_seconds, 1) if encode_seconds else 0.0
+                    ),
+                }
+            return stats
+
+
+encoder_stats = EncoderStats()
+
+
+class StreamEncoder(ABC):
+    """Incrementally encode audio blocks into a byte stream.
+    
+    Subclasses implement ``_encode`` and ``_finish``; ``write`` and ``close``
+    add timing and record the stream in ``encoder_stats`` when it ends.
+    """
+
+    media_type = "application/octet-stream"
+    format_name = "unknown"
+
+    def __init__(self, sample_rate: int):
+        """Initialize encoder.
+        
+        Args:
+            sample_rate: Sample rate of the audio blocks
+        """
+        self.sample_rate = sample_rate
+        self._samples = 0
+        self._bytes = 0
+        self._seconds = 0.0
+
+    def write(self, audio: np.ndarray) -> bytes:
+        """Encode a block of audio.
+        
+        Args:
+            audio: Audio block
+            
+        Returns:
+            Encoded bytes ready to be sent (may be empty)
+        """
+        start = time.perf_counter()
+        data = self._encode(audio)
+        self._seconds += time.perf_counter() - start
+        self._samples += len(audio)
+        self._bytes += len(data)
+        return data
+
+    def close(self) -> bytes:
+        """Finish the stream.
+        
+        Returns:
+            Any remaining encoded bytes
+        """
+        start = time.perf_counter()
+        data = self._finish()
+        self._seconds += time.perf_counter() - start
+        self._bytes += len(data)
+        encoder_stats.record(
+            self.format_name, self._samples / self.sample_rate, self._bytes, self._seconds
+        )
+        return data
+
+    @abstractmethod
+    def _encode(self, audio: np.ndarray) -> bytes:
+        """Encode one block of audio (see ``write``)."""
+
+    def _finish(self) -> bytes:
+        return b""
+
+
+class PCMStreamEncoder(StreamEncoder):
+    """Raw 16-bit little-endian mono PCM."""
+
+    media_type = "audio/pcm"
+    format_name = "pcm"
+
+    def _encode(self, audio: np.ndarray) -> bytes:
+        return to_pcm16(audio)
+
+
+class WavStreamEncoder(PCMStreamEncoder):
+    """WAV with an open-ended header followed by 16-bit PCM.
+    
+    The RIFF and data chunk sizes are set to the maximum value because the
+    final length is unknown when the header is sent; players treat such
+    files as "read until end of stream".
+    """
+
+    media_type = "audio/wav"
+    format_name = "wav"
+
+    def __init__(self, sample_rate: int):
+        super().__init__(sample_rate)
+        self._header_sent = False
+
+    def _header(self) -> bytes:
+        """Build a 44-byte WAV header for mono 16-bit PCM."""
+        byte_rate = self.sample_rate * 2
+        return (
+            b"RIFF" + struct.pack("<I", 0xFFFFFFFF) + b"WAVE"
+            + b"fmt " + struct.pack("<IHHIIHH", 16, 1, 1, self.sample_rate, byte_rate, 2, 16)
+            + b"data" + struct.pack("<I", 0xFFFFFFFF)
+        )
+
+    def _encode(self, audio: np.ndarray) -> bytes:
+        data = super()._encode(audio)
+        if not self._header_sent:
+            self._header_sent = True
+            return self._header() + data
+        return data
+
+    def _finish(self) -> bytes:
+        # Empty stream still needs a valid header
+        if not self._header_sent:
+            self._header_sent = True
+            return self._header()
+        return b""
+
+
+class SoundFileStreamEncoder(StreamEncoder):
+    """Compressed stream via libsndfile, drained block by block."""
+
+    container = ""
+    subtype = ""
+
+    def __init__(self, sample_rate: int):
+        super().__init__(sample_rate)
+        self._sink = _ForwardSink()
+        self._file = sf.SoundFile(
+            self._sink,
+            mode="w",
+            samplerate=sample_rate,
+            channels=1,
+            format=self.container,
+            subtype=self.subtype
+        )
+
+    def _encode(self, audio: np.ndarray) -> bytes:
+        self._file.write(np.clip(audio, -1.0, 1.0).astype(np.float32))
+        return self._sink.drain()
+
+    def _finish(self) -> bytes:
+        self._file.close()
+        return self._sink.drain()
+
+
+class OggStreamEncoder(SoundFileStreamEncoder):
+    """Ogg Vorbis stream."""
+
+    media_type = "audio/ogg"
+    format_name = "ogg"
+    container = "OGG"
+    subtype = "VORBIS"
+
+
+class Mp3StreamEncoder(SoundFileStreamEncoder):
+    """MPEG Layer III stream."""
+
+    media_type = "audio/mpeg"
+    format_name = "mp3"
+    container = "MP3"
+    subtype = "MPEG_LAYER_III"
+
+
+@dataclass(frozen=True)
+class AudioFormat:
+    """An output format and how to encode it."""
+
+    name: str
+    media_type: str
+    container: str
+    subtype: str
+    stream_encoder: Optional[Type[StreamEncoder]] = None
+
+
+ENCODERS: Dict[str, AudioFormat] = {}
+
+
+def register_format(audio_format: AudioFormat) -> None:
+    """Register (or replace) an output format.
+    
+    Args:
+        audio_format: Format definition keyed by its name
+    """
+    ENCODERS[audio_format.name] = audio_format
+
+
+register_format(AudioFormat("wav", "audio/wav", "WAV", "PCM_16", WavStreamEncoder))
+register_format(AudioFormat("mp3", "audio/mpeg", "MP3", "MPEG_LAYER_III", Mp3StreamEncoder))
+register_format(AudioFormat("ogg", "audio/ogg", "OGG", "VORBIS", OggStreamEncoder))
+register_format(AudioFormat("pcm", "audio/pcm", "RAW", "PCM_16", PCMStreamEncoder))
+
+
+def get_format(output_format: str) -> AudioFormat:
+    """Look up a registered output format.
+    
+    Args:
+        output_format: Format name
+        
+    Returns:
+        Format definition
+        
+    Raises:
+        ValueError: If the format is not registered
+    """
+    audio_format = ENCODERS.get(output_format)
+    if audio_format is None:
+        raise ValueError(
+            f"Unsupported output format '{output_format}'. "
+            f"Available: {', '.join(ENCODERS.keys())}"
+        )
+    return audio_format
+
+
+def encode(audio: np.ndarray, output_format: str, sample_rate: int, target: BinaryIO) -> int:
+    """Encode a whole signal into a binary file object.
+    
+    Audio is clipped and converted in blocks, so no full-size copy of the
+    signal is made; the target may be a ``BytesIO`` or an open file.
+    
+    Args:
+        audio: Audio array
+        output_format: Registered format name
+        sample_rate: Sample rate of the audio
+        target: Writable (and seekable) binary file object
+        
+    Returns:
+        Number of bytes written
+        
+    Raises:
+        ValueError: If the format is not registered
+    """
+    audio_format = get_format(output_format)
+    start_position = target.tell()
+    start = time.perf_counter()
+    
+    with sf.SoundFile(
+        target,
+        mode="w",
+        samplerate=sample_rate,
+        channels=1,
+        format=audio_format.container,
+        subtype=audio_format.subtype
+    ) as output:
+        for i in range(0, len(audio), ENCODE_BLOCK_SIZE):
+            block = audio[i:i + ENCODE_BLOCK_SIZE]
+            output.write(np.clip(block, -1.0, 1.0).astype(np.float32))
+    
+    # Trailing fix-ups may leave the position before the end
+    target.seek(0, 2)
+    num_bytes = target.tell() - start_position
+    encoder_stats.record(
+        output_format, len(audio) / sample_rate, num_bytes, time.perf_counter() - start
+    )
+    return num_bytes
+
+
+def create_stream_encoder(output_format: str, sample_rate: int) -> StreamEncoder:
+    """Create a streaming encoder for an output format.
+    
+    Args:
+        output_format: Stream format (pcm, wav, ogg, mp3)
+        sample_rate: Sample rate of the audio
+        
+    Returns:
+        Streaming encoder instance
+        
+    Raises:
+        ValueError: If the format cannot be streamed
+    """
+    audio_format = ENCODERS.get(output_format)
+    if audio_format is None or audio_format.stream_encoder is None:
+        streamable = [name for name, fmt in ENCODERS.items() if fmt.stream_encoder is not None]
+        raise ValueError(
+            f"Format '{output_format}' cannot be streamed. "
+            f"Available: {', '.join(streamable)}"
+        )
+    return audio_format.stream_encoder(sample_rate)
+
+
+def get_encoder_stats() -> Dict[str, Dict[str, float]]:
+    """Get process-wide encoder statistics.
+    
+    Returns:
+        Per-format encoder statistics
+    """
+    return encoder_stats.get_stats()
@@ -0,0 +1,274 @@
+"""Resident TTS models under a memory budget with LRU eviction."""
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from src.models.base import BaseTTSModel
+from src.utils.logging import get_logger
+from src.utils.timing import span
+
+logger = get_logger(__name__)
+
+# Longest single wait for an in-use model to be released before re-checking
+_RELEASE_POLL_SECONDS = 1.0
+
+
+@dataclass
+class _Entry:
+    """A model instance and its residency bookkeeping."""
+
+    name: str
+    model: BaseTTSModel
+    size_bytes: int = 0
+    in_use: int = 0
+    loads: int = 0
+    last_load_ms: float = 0.0
+    load_lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class ModelPool:
+    """Keep several TTS models loaded within a memory budget.
+
+    Models are created by ``factory`` on first use and loaded on demand.
+    ``acquire`` pins a model while a caller synthesizes with it; when
+    loading another model would exceed ``memory_budget_bytes``, the least
+    recently used models that are not pinned are unloaded first (through
+    ``unload_model``). If only pinned models stand in the way, the load
+    waits until they are released. A model that is larger than the budget
+    on its own is still loaded once everything else has been evicted.
+    Loads that run at the same time can together exceed the budget; the
+    pool then evicts what is idle, logs a warning and goes over budget
+    rather than have the loads wait on each other.
+
+    Loading happens outside the pool lock, so requests for models that are
+    already resident are never held up by another model's load.
+
+    Model sizes come from ``sizes`` (bytes per model name) when declared,
+    otherwise from ``memory_footprint()`` after the first load; a model
+    whose size is unknown counts as zero until then.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[str], BaseTTSModel],
+        memory_budget_bytes: int = 0,
+        sizes: Optional[Dict[str, int]] = None
+    ):
+        """Initialize pool.
+
+        Args:
+            factory: Creates the (unloaded) model for a name
+            memory_budget_bytes: Total size of resident models (0 = unlimited)
+            sizes: Declared memory use per model name, in bytes
+        """
+        self.factory = factory
+        self.memory_budget_bytes = memory_budget_bytes
+        self.sizes = dict(sizes or {})
+
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._condition = threading.Condition()
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, name: str) -> BaseTTSModel:
+        """Get a model instance without loading it.
+
+        Args:
+            name: Model name
+
+        Returns:
+            The pool's instance for ``name``
+        """
+        with self._condition:
+            return self._entry(name).model
+
+    @contextmanager
+    def acquire(self, name: str) -> Iterator[BaseTTSModel]:
+        """Load a model if needed and keep it resident inside a ``with`` block.
+
+        Args:
+            name: Model name
+
+        Yields:
+            The loaded model
+        """
+        with self._condition:
+            entry = self._entry(name)
+            entry.in_use += 1
+            self._entries.move_to_end(name)
+        try:
+            self._load(entry)
+            yield entry.model
+        finally:
+            with self._condition:
+                entry.in_use -= 1
+                self._condition.notify_all()
+
+    def load(self, name: str) -> BaseTTSModel:
+        """Make a model resident (it may be evicted again later).
+
+        Args:
+            name: Model name
+
+        Returns:
+            The loaded model
+        """
+        with self.acquire(name) as model:
+            return model
+
+    def unload(self, name: str) -> bool:
+        """Unload a model that is not in use.
+
+        Args:
+            name: Model name
+
+        Returns:
+            True if the model was resident and has been unloaded
+        """
+        with self._condition:
+            entry = self._entries.get(name)
+            if entry is None or entry.in_use or not entry.model.is_loaded:
+                return False
+            self._unload(entry)
+            return True
+
+    def unload_all(self) -> None:
+        """Unload every model that is not in use."""
+        with self._condition:
+            for entry in list(self._entries.values()):
+                if entry.model.is_loaded and not entry.in_use:
+                    self._unload(entry)
+
+    def resident(self) -> List[str]:
+        """Names of loaded models, least recently used first."""
+        with self._condition:
+            return [name for name, entry in self._entries.items() if entry.model.is_loaded]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics.
+
+        Returns:
+            Dictionary with the budget, resident bytes, hit/miss/eviction
+            counters and per-model residency, size and load time
+        """
+        with self._condition:
+            return {
+                "memory_budget_bytes": self.memory_budget_bytes,
+                "resident_bytes": self._resident_bytes(),
+                "resident": [n for n, e in self._entries.items() if e.model.is_loaded],
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "models": {
+                    name: {
+                        "loaded": entry.model.is_loaded,
+                        "in_use": entry.in_use,
+                        "size_bytes": entry.size_bytes,
+                        "loads": entry.loads,
+                        "last_load_ms": round(entry.last_load_ms, 3),
+                    }
+                    for name, entry in self._entries.items()
+                },
+            }
+
+    def _entry(self, name: str) -> _Entry:
+        """Get or create the entry for a model (lock held)."""
+        entry = self._entries.get(name)
+        if entry is None:
+            entry = _Entry(name=name, model=self.factory(name), size_bytes=self.sizes.get(name, 0))
+            self._entries[name] = entry
+        return entry
+
+    def _load(self, entry: _Entry) -> None:
+        """Load a pinned model, making room for it first."""
+        if entry.model.is_loaded:
+            with self._condition:
+                self._hits += 1
+            return
+
+        with entry.load_lock:
+            if entry.model.is_loaded:
+                with self._condition:
+                    self._hits += 1
+                return
+            with self._condition:
+                self._misses += 1
+                self._make_room(entry)
+
+            start = time.perf_counter()
+            with span("model_load"):
+                entry.model.load_model()
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            with self._condition:
+                entry.loads += 1
+                entry.last_load_ms = elapsed_ms
+                if entry.name not in self.sizes:
+                    entry.size_bytes = entry.model.memory_footprint() or entry.size_bytes
+                # The measured size may be larger than expected
+                self._make_room(entry, wait=False)
+            logger.info(
+                f"Loaded model '{entry.name}' in {elapsed_ms:.0f} ms "
+                f"({entry.size_bytes} bytes, resident: {', '.join(self.resident())})"
+            )
+
+    def _make_room(self, entry: _Entry, wait: bool = True) -> None:
+        """Evict idle models until ``entry`` fits the budget (lock held).
+
+        Models that are pinned but not loaded yet hold no memory and are
+        not waited for.
+
+        Args:
+            entry: Model about to be loaded, or just loaded
+            wait: Wait for pinned models to be released when evicting idle
+                ones is not enough. Pass False once ``entry`` is loaded: it
+                is pinned itself, and another load may be waiting on it
+        """
+        if not self.memory_budget_bytes:
+            return
+        while self._resident_bytes(exclude=entry) + entry.size_bytes > self.memory_budget_bytes:
+            others = [
+                other for other in self._entries.values()
+                if other is not entry and other.model.is_loaded
+            ]
+            idle = [other for other in others if not other.in_use]
+            if idle:
+                # Entries are kept in least-recently-used order
+                self._unload(idle[0], evicted=True)
+            elif others and wait:
+                self._condition.wait(timeout=_RELEASE_POLL_SECONDS)
+            elif others:
+                logger.warning(
+                    f"Model memory budget of {self.memory_budget_bytes} bytes exceeded "
+                    f"after loading '{entry.name}': the other resident models are in use"
+                )
+                return
+            else:
+                logger.warning(
+                    f"Model '{entry.name}' ({entry.size_bytes} bytes) exceeds the model "
+                    f"memory budget of {self.memory_budget_bytes} bytes on its own"
+                )
+                return
+
+    def _unload(self, entry: _Entry, evicted: bool = False) -> None:
+        """Unload an idle model (lock held)."""
+        entry.model.unload_model()
+        if evicted:
+            self._evictions += 1
+            logger.info(f"Evicted model '{entry.name}' to stay within the model memory budget")
+        else:
+            logger.info(f"Unloaded model '{entry.name}'")
+
+    def _resident_bytes(self, exclude: Optional[_Entry] = None) -> int:
+        """Total size of loaded models (lock held)."""
+        return sum(
+            entry.size_bytes for entry in self._entries.values()
+            if entry.model.is_loaded and entry is not exclude
+        )
@@ -0,0 +1,196 @@
+"""Rational-ratio polyphase resampling with cached filters."""
+
+from functools import lru_cache
+from math import gcd
+from typing import Iterable, Iterator
+
+import numpy as np
+from scipy import signal
+
+
+class PolyphaseResampler:
+    """Resample by a fixed rational ratio ``up / down``.
+    
+    The anti-aliasing filter matches ``scipy.signal.resample_poly`` (Kaiser
+    windowed sinc, 10 zero crossings per side) but is designed once per rate
+    pair and reused. Whole signals are filtered with ``upfirdn`` in a single
+    pass; ``stream()`` processes arbitrarily sized blocks with the same
+    output, keeping only the filter history between blocks.
+    """
+
+    def __init__(self, orig_sr: int, target_sr: int):
+        """Design the filter for a rate pair.
+        
+        Args:
+            orig_sr: Input sample rate
+            target_sr: Output sample rate
+        """
+        if orig_sr <= 0 or target_sr <= 0:
+            raise ValueError(f"Sample rates must be positive, got {orig_sr} -> {target_sr}")
+
+        self.orig_sr = orig_sr
+        self.target_sr = target_sr
+
+        divisor = gcd(orig_sr, target_sr)
+        self.up = target_sr // divisor
+        self.down = orig_sr // divisor
+
+        # Design a linear-phase low-pass FIR filter
+        max_rate = max(self.up, self.down)
+        half_len = 10 * max_rate
+        h = signal.firwin(2 * half_len + 1, 1.0 / max_rate, window=("kaiser", 5.0)) * self.up
+
+        # Zero-pad the filter so the output delay is a whole number of samples
+        n_pre_pad = self.down - half_len % self.down
+        self.filter = np.concatenate([np.zeros(n_pre_pad), h])
+        self.delay = (half_len + n_pre_pad) // self.down
+
+    def output_length(self, n_in: int) -> int:
+        """Number of output samples for a given input length."""
+        return -(-n_in * self.up // self.down)
+
+    def process(self, audio: np.ndarray) -> np.ndarray:
+        """Resample a complete signal.
+        
+        Args:
+            audio: Input audio array
+            
+        Returns:
+            Resampled audio
+        """
+        if self.up == self.down:
+            return audio.copy()
+
+        n_out = self.output_length(len(audio))
+        y = signal.upfirdn(self.filter, audio, self.up, self.down)
+        y = y[self.delay:self.delay + n_out]
+        if len(y) < n_out:
+            y = np.pad(y, (0, n_out - len(y)))
+        return y.astype(_float_dtype(audio), copy=False)
+
+    def stream(self) -> "ResamplerStream":
+        """Create a stateful stream for block-by-block resampling."""
+        return ResamplerStream(self)
+
+    def process_blocks(self, blocks: Iterable[np.ndarray]) -> Iterator[np.ndarray]:
+        """Resample a sequence of blocks, yielding output as it is ready.
+        
+        Args:
+            blocks: Consecutive input blocks
+            
+        Yields:
+            Consecutive output blocks
+        """
+        stream = self.stream()
+        for block in blocks:
+            out = stream.push(block)
+            if len(out):
+                yield out
+        out = stream.flush()
+        if len(out):
+            yield out
+
+
+class ResamplerStream:
+    """Block-by-block state for a ``PolyphaseResampler``.
+    
+    Output is identical to ``PolyphaseResampler.process`` on the
+    concatenated input. Only the input samples still needed by the filter
+    are retained between pushes.
+    """
+
+    def __init__(self, resampler: PolyphaseResampler):
+        self.resampler = resampler
+        self._dtype = None
+        self._n_in = 0
+
+        # Next global filter-output index to emit (first valid one is the delay)
+        self._next = resampler.delay
+
+        # Buffered input starts at a multiple of ``down`` so that filtering the
+        # buffer lines up with the global output grid; negative indices are
+        # the implicit zeros before the signal
+        self._buffer_start = self._history_start(self._next)
+        self._buffer = np.zeros(-self._buffer_start)
+
+    def _history_start(self, n: int) -> int:
+        """First buffered input index needed to compute output ``n``."""
+        r = self.resampler
+        first_input = -(-(n * r.down - len(r.filter) + 1) // r.up)
+        return (first_input // r.down) * r.down
+
+    def _emit(self, n_stop: int) -> np.ndarray:
+        """Compute global outputs [self._next, n_stop) from the buffer."""
+        r = self.resampler
+        if n_stop <= self._next:
+            return np.zeros(0, dtype=self._dtype or np.float64)
+
+        offset = self._buffer_start * r.up // r.down
+        y = signal.upfirdn(r.filter, self._buffer, r.up, r.down)
+        out = y[self._next - offset:n_stop - offset]
+        if len(out) < n_stop - self._next:
+            out = np.pad(out, (0, n_stop - self._next - len(out)))
+        self._next = n_stop
+
+        # Drop input that no future output depends on
+        start = min(self._history_start(self._next), self._buffer_start + len(self._buffer))
+        if start > self._buffer_start:
+            self._buffer = self._buffer[start - self._buffer_start:]
+            self._buffer_start = start
+
+        return out.astype(self._dtype or np.float64, copy=False)
+
+    def push(self, block: np.ndarray) -> np.ndarray:
+        """Add input and return all output that no longer depends on future input.
+        
+        Args:
+            block: Next input block
+            
+        Returns:
+            Newly available output samples (possibly empty)
+        """
+        r = self.resampler
+        if self._dtype is None:
+            self._dtype = _float_dtype(block)
+        self._n_in += len(block)
+        self._buffer = np.concatenate([self._buffer, block])
+
+        buffer_end = self._buffer_start + len(self._buffer)
+        return self._emit((buffer_end * r.up - 1) // r.down + 1)
+
+    def flush(self) -> np.ndarray:
+        """Finish the stream and return the remaining output.
+        
+        Returns:
+            Final output samples
+        """
+        r = self.resampler
+        n_stop = r.delay + r.output_length(self._n_in)
+
+        # Everything after the input is zero; extend the buffer far enough
+        # to cover the last output
+        needed_end = (n_stop - 1) * r.down // r.up + 1
+        buffer_end = self._buffer_start + len(self._buffer)
+        if needed_end > buffer_end:
+            self._buffer = np.concatenate([self._buffer, np.zeros(needed_end - buffer_end)])
+
+        return self._emit(n_stop)
+
+
+def _float_dtype(audio: np.ndarray) -> np.dtype:
+    """Floating dtype to use for output derived from ``audio``."""
+    return audio.dtype if np.issubdtype(audio.dtype, np.floating) else np.dtype(np.float64)
+
+
+@lru_cache(maxsize=32)
+def get_resampler(orig_sr: int, target_sr: int) -> PolyphaseResampler:
+    """Get a cached resampler for a rate pair.
+    
+    Args:
+        orig_sr: Input sample rate
+        target_sr: Output sample rate
+        
+    Returns:
+        Shared resampler instance
+    """
+    return PolyphaseResampler(orig_sr, target_sr)
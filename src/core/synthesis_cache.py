@@ -0,0 +1,338 @@
+"""Content-addressed cache for synthesized audio."""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Optional
+
+from src.core.audio_index import AudioIndex
+
+
+def make_cache_key(**parts: Any) -> str:
+    """Build a stable content hash from synthesis parameters.
+    
+    Args:
+        **parts: JSON-serializable values that determine the audio output
+        
+    Returns:
+        Hex-encoded SHA-256 digest
+    """
+    payload = json.dumps(parts, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# Directory levels and characters per level of the sharded layout
+SHARD_LEVELS = 2
+SHARD_WIDTH = 2
+
+
+def shard_path(directory: str | Path, name: str) -> Path:
+    """Get the sharded location of a file.
+    
+    Files are spread over nested subdirectories named after the leading
+    characters of the file name, e.g. ``ab/cd/abcdef....wav``. Names here are
+    hashes or UUIDs, so each directory holds a small, even share of files.
+    Names too short to shard stay at the top level.
+    
+    Args:
+        directory: Root directory
+        name: File name
+        
+    Returns:
+        Path of the file below ``directory``
+    """
+    stem = name.split(".", 1)[0].lower()
+    if len(stem) < SHARD_LEVELS * SHARD_WIDTH:
+        return Path(directory) / name
+    parts = [stem[i * SHARD_WIDTH:(i + 1) * SHARD_WIDTH] for i in range(SHARD_LEVELS)]
+    return Path(directory).joinpath(*parts, name)
+
+
+def quantize(value: float, step: float) -> float:
+    """Round a value to the nearest multiple of step.
+    
+    Args:
+        value: Value to quantize
+        step: Quantization step (values <= 0 disable quantization)
+        
+    Returns:
+        Quantized value
+    """
+    if step <= 0:
+        return value
+    return round(round(value / step) * step, 6)
+
+
+class ContentCache:
+    """Two-tier content-addressed store.
+    
+    Entries are immutable blobs addressed by ``{key}.{suffix}``. The disk tier
+    is a directory tree sharded by key prefix (see ``shard_path``), so cached
+    files can be served directly and no directory grows too large; the memory
+    tier is an LRU bounded by a total byte budget that keeps recently written
+    blobs around for fast reads and to restore files removed from disk.
+    
+    With an ``AudioIndex``, every file written and every hit is recorded
+    there, so files can be expired and evicted by last use.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        memory_budget_bytes: int = 64 * 1024 * 1024,
+        index: Optional[AudioIndex] = None
+    ):
+        """Initialize cache.
+        
+        Args:
+            directory: Directory for the on-disk tier
+            memory_budget_bytes: Maximum total size of in-memory entries
+            index: Index recording file writes and uses (must cover ``directory``)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.memory_budget_bytes = memory_budget_bytes
+        self.index = index
+
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+
+        # Statistics
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def path_for(self, key: str, suffix: str) -> Path:
+        """Get the on-disk path for an entry.
+        
+        Args:
+            key: Content key
+            suffix: File extension without the dot
+            
+        Returns:
+            Path of the entry in the disk tier
+        """
+        return shard_path(self.directory, f"{key}.{suffix}")
+
+    def lookup(self, key: str, suffix: str) -> Optional[Path]:
+        """Find an entry and make sure it is present on disk.
+        
+        Args:
+            key: Content key
+            suffix: File extension without the dot
+            
+        Returns:
+            Path of the cached file, or None on a miss
+        """
+        name = f"{key}.{suffix}"
+        path = self.path_for(key, suffix)
+
+        with self._lock:
+            data = self._memory.get(name)
+            if data is not None:
+                self._memory.move_to_end(name)
+                self._memory_hits += 1
+
+        if data is not None:
+            if not path.exists():
+                self._write_file(path, lambda f: f.write(data))
+            else:
+                self._touch(path)
+            return path
+
+        if path.exists():
+            with self._lock:
+                self._disk_hits += 1
+            self._touch(path)
+            return path
+
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def load(self, key: str, suffix: str) -> Optional[bytes]:
+        """Read an entry's contents.
+        
+        Args:
+            key: Content key
+            suffix: File extension without the dot
+            
+        Returns:
+            Cached bytes, or None on a miss
+        """
+        name = f"{key}.{suffix}"
+
+        path = self.path_for(key, suffix)
+
+        with self._lock:
+            data = self._memory.get(name)
+            if data is not None:
+                self._memory.move_to_end(name)
+                self._memory_hits += 1
+        if data is not None:
+            self._touch(path)
+            return data
+
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            with self._lock:
+                self._misses += 1
+            return None
+
+        with self._lock:
+            self._disk_hits += 1
+            self._remember(name, data)
+        self._touch(path)
+        return data
+
+    def peek(self, key: str, suffix: str, max_bytes: Optional[int] = None) -> Optional[bytes]:
+        """Read an entry from the memory tier only, without any I/O.
+        
+        Safe to call on an event loop. The use is not recorded in the
+        index; call ``touch`` (off the loop) for that.
+        
+        Args:
+            key: Content key
+            suffix: File extension without the dot
+            max_bytes: Treat larger entries as absent
+            
+        Returns:
+            Cached bytes, or None if not in memory (a miss is not counted,
+            so the caller can fall back to ``load`` or ``lookup``)
+        """
+        name = f"{key}.{suffix}"
+        with self._lock:
+            data = self._memory.get(name)
+            if data is None or (max_bytes is not None and len(data) > max_bytes):
+                return None
+            self._memory.move_to_end(name)
+            self._memory_hits += 1
+            return data
+
+    def touch(self, key: str, suffix: str) -> None:
+        """Record a use of an entry in the index.
+        
+        Args:
+            key: Content key
+            suffix: File extension without the dot
+        """
+        self._touch(self.path_for(key, suffix))
+
+    def store(self, key: str, suffix: str, data: bytes) -> Path:
+        """Write an entry to both tiers.
+        
+        Args:
+            key: Content key
+            suffix: File extension without the dot
+            data: Entry contents
+            
+        Returns:
+            Path of the written file
+        """
+        path = self.path_for(key, suffix)
+        self._write_file(path, lambda f: f.write(data))
+        with self._lock:
+            self._remember(f"{key}.{suffix}", data)
+        return path
+
+    def remember(self, key: str, suffix: str, data: bytes) -> None:
+        """Keep an entry in the memory tier only.
+
+        For content that is handed to the client directly and may never be
+        requested as a file; ``lookup`` still writes it to disk on demand.
+
+        Args:
+            key: Content key
+            suffix: File extension without the dot
+            data: Entry contents
+        """
+        with self._lock:
+            self._remember(f"{key}.{suffix}", data)
+
+    def store_file(self, key: str, suffix: str, write: Callable[[BinaryIO], Any]) -> Path:
+        """Write an entry by streaming it straight into the cache file.
+        
+        Avoids holding the encoded entry in memory while it is produced;
+        entries that fit the memory budget are read back into the memory
+        tier afterwards.
+        
+        Args:
+            key: Content key
+            suffix: File extension without the dot
+            write: Callable that writes the entry into a binary file object
+            
+        Returns:
+            Path of the written file
+        """
+        path = self.path_for(key, suffix)
+        self._write_file(path, write)
+        if path.stat().st_size <= self.memory_budget_bytes:
+            data = path.read_bytes()
+            with self._lock:
+                self._remember(f"{key}.{suffix}", data)
+        return path
+
+    def _remember(self, name: str, data: bytes) -> None:
+        """Insert into the memory tier, evicting LRU entries (lock held)."""
+        if len(data) > self.memory_budget_bytes:
+            return
+
+        previous = self._memory.pop(name, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+
+        self._memory[name] = data
+        self._memory_bytes += len(data)
+
+        while self._memory_bytes > self.memory_budget_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self._evictions += 1
+
+    def _write_file(self, path: Path, write: Callable[[BinaryIO], Any]) -> None:
+        """Atomically write a file so readers never see partial content."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w+b") as f:
+                write(f)
+                f.flush()
+                size = os.fstat(f.fileno()).st_size
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        if self.index is not None:
+            self.index.record(path, size)
+
+    def _touch(self, path: Path) -> None:
+        """Record a use of an on-disk entry in the index."""
+        if self.index is not None:
+            self.index.touch(path)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+        
+        Returns:
+            Dictionary with hit/miss counters and memory usage
+        """
+        with self._lock:
+            hits = self._memory_hits + self._disk_hits
+            lookups = hits + self._misses
+            return {
+                "memory_hits": self._memory_hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "memory_budget_bytes": self.memory_budget_bytes,
+                "evictions": self._evictions,
+            }
@@ -1,6 +1,7 @@
 """Text processing utilities for TTS."""
 
 import re
+import zlib
 from typing import List
 
 
@@ -86,9 +87,35 @@ class TextProcessor:
         
         return text
 
+    def split_sentences(self, text: str) -> List[str]:
+        """Split normalized text into sentences.
+        
+        Args:
+            text: Normalized text
+            
+        Returns:
+            List of sentences with their terminal punctuation
+        """
+        parts = re.split(r'([.!?])\s+', text)
+        
+        # Reconstruct sentences with punctuation
+        sentences = [parts[i] + parts[i + 1] for i in range(0, len(parts) - 1, 2)]
+        
+        # Trailing sentence has no whitespace after its punctuation
+        if len(parts) % 2 == 1 and parts[-1].strip():
+            sentences.append(parts[-1])
+        
+        return [sentence.strip() for sentence in sentences if sentence.strip()]
+
     def chunk_text(self, text: str, max_chunk_size: int = 500) -> List[str]:
         """Split text into smaller chunks at sentence boundaries.
         
+        Besides the size limit, a chunk also ends after any sentence whose
+        content hash marks it as a boundary. Chunk boundaries therefore
+        depend on the sentences themselves rather than on everything before
+        them, so editing one sentence only changes the chunk that contains it
+        and cached audio for the remaining chunks stays valid.
+        
         Args:
             text: Input text
             max_chunk_size: Maximum characters per chunk
@@ -99,34 +126,39 @@ class TextProcessor:
         # Normalize first
         text = self.normalize(text)
 
-        # Split into sentences
-        sentences = re.split(r'([.!?])\s+', text)
-        
-        # Reconstruct sentences with punctuation
-        reconstructed = []
-        for i in range(0, len(sentences) - 1, 2):
-            if i + 1 < len(sentences):
-                reconstructed.append(sentences[i] + sentences[i + 1])
-            else:
-                reconstructed.append(sentences[i])
-
         # Group sentences into chunks
         chunks = []
         current_chunk = ""
         
-        for sentence in reconstructed:
-            if len(current_chunk) + len(sentence) <= max_chunk_size:
-                current_chunk += " " + sentence if current_chunk else sentence
-            else:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                current_chunk = sentence
+        for sentence in self.split_sentences(text):
+            if current_chunk and len(current_chunk) + 1 + len(sentence) > max_chunk_size:
+                chunks.append(current_chunk)
+                current_chunk = ""
+            
+            current_chunk = current_chunk + " " + sentence if current_chunk else sentence
+            
+            if self._is_chunk_boundary(sentence):
+                chunks.append(current_chunk)
+                current_chunk = ""
 
         if current_chunk:
-            chunks.append(current_chunk.strip())
+            chunks.append(current_chunk)
 
         return chunks
 
+    def _is_chunk_boundary(self, sentence: str) -> bool:
+        """Decide from sentence content whether a chunk should end after it.
+        
+        Uses a stable hash so boundaries are identical across processes.
+        
+        Args:
+            sentence: Sentence text
+            
+        Returns:
+            True for roughly one sentence in four
+        """
+        return zlib.crc32(sentence.encode("utf-8")) % 4 == 0
+
     def detect_emotion_hints(self, text: str) -> str:
         """Detect emotion hints from text content (simple keyword-based).
         
@@ -0,0 +1,301 @@
+"""Pitch-preserving time-stretching with a vectorized phase vocoder."""
+
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+from scipy.signal import get_window
+
+# Synthesis steps processed per vectorized block; bounds the size of the
+# intermediate spectra regardless of input length
+_STEPS_PER_BLOCK = 256
+
+
+class PhaseVocoder:
+    """Change tempo without changing pitch.
+    
+    Frames are analysed with a Hann-windowed STFT, magnitudes are
+    interpolated at the new frame positions and phases are advanced by each
+    bin's instantaneous frequency so partials stay coherent. All per-frame
+    work is done on whole blocks of frames with NumPy; only the block loop is
+    in Python. ``stream()`` processes arbitrarily sized input blocks with the
+    same output as ``stretch()``.
+    """
+
+    def __init__(self, n_fft: int = 1024, hop_length: Optional[int] = None):
+        """Initialize vocoder.
+        
+        Args:
+            n_fft: FFT size in samples
+            hop_length: Hop between frames (defaults to n_fft // 4; must divide n_fft)
+        """
+        hop_length = hop_length or n_fft // 4
+        if n_fft % hop_length:
+            raise ValueError(f"hop_length ({hop_length}) must divide n_fft ({n_fft})")
+
+        self.n_fft = n_fft
+        self.hop_length = hop_length
+        self.window = get_window("hann", n_fft)
+        self.window_sq = self.window ** 2
+
+        # Expected phase advance per hop for each frequency bin
+        self.phase_advance = np.linspace(0, np.pi * hop_length, n_fft // 2 + 1)
+
+    def stretch(self, audio: np.ndarray, rate: float) -> np.ndarray:
+        """Time-stretch a complete signal.
+        
+        Args:
+            audio: Input audio array
+            rate: Tempo factor (>1.0 is faster/shorter, <1.0 slower/longer)
+            
+        Returns:
+            Stretched audio of length ``round(len(audio) / rate)``
+        """
+        if rate == 1.0:
+            return audio.copy()
+
+        block = self.hop_length * _STEPS_PER_BLOCK
+        blocks = (audio[i:i + block] for i in range(0, len(audio), block))
+        out = list(self.process_blocks(blocks, rate))
+        if not out:
+            return np.zeros(0, dtype=audio.dtype)
+        return np.concatenate(out).astype(audio.dtype, copy=False)
+
+    def stream(self, rate: float) -> "TimeStretchStream":
+        """Create a stateful stream for block-by-block stretching.
+        
+        Args:
+            rate: Tempo factor
+        """
+        return TimeStretchStream(self, rate)
+
+    def process_blocks(self, blocks: Iterable[np.ndarray], rate: float) -> Iterator[np.ndarray]:
+        """Stretch a sequence of blocks, yielding output as it is ready.
+        
+        Args:
+            blocks: Consecutive input blocks
+            rate: Tempo factor
+            
+        Yields:
+            Consecutive output blocks
+        """
+        stream = self.stream(rate)
+        for block in blocks:
+            out = stream.push(block)
+            if len(out):
+                yield out
+        out = stream.flush()
+        if len(out):
+            yield out
+
+
+class TimeStretchStream:
+    """Block-by-block state for a ``PhaseVocoder``.
+    
+    Frame ``k`` of the (centre-padded) input starts at sample ``k * hop``.
+    Synthesis step ``s`` reads input frames around ``s * rate`` and is
+    overlap-added at output sample ``s * hop``. Only the input frames still
+    needed and the unfinished overlap-add tail are kept between pushes.
+    """
+
+    def __init__(self, vocoder: PhaseVocoder, rate: float):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+
+        self.vocoder = vocoder
+        self.rate = rate
+        self._n_in = 0
+        self._n_out = 0
+
+        # Input starts with half a frame of zeros so frames are centred
+        self._buffer = np.zeros(vocoder.n_fft // 2)
+        self._frame_offset = 0
+
+        self._step = 0
+        self._phase: Optional[np.ndarray] = None
+
+        # Overlap-add accumulators starting at output sample step * hop
+        self._ola = np.zeros(vocoder.n_fft)
+        self._ola_norm = np.zeros(vocoder.n_fft)
+
+        # Output samples still to drop from the front (the centre padding)
+        self._skip = vocoder.n_fft // 2
+
+    def push(self, block: np.ndarray) -> np.ndarray:
+        """Add input and return all output that is complete.
+        
+        Args:
+            block: Next input block
+            
+        Returns:
+            Newly available output samples (possibly empty)
+        """
+        self._n_in += len(block)
+        self._buffer = np.concatenate([self._buffer, block])
+
+        # Step s needs frames floor(s * rate) and floor(s * rate) + 1
+        last_frame = self._frame_offset + self._available_frames()
+        return self._run(self._steps_before(last_frame - 1), n_frames=None)
+
+    def flush(self) -> np.ndarray:
+        """Finish the stream and return the remaining output.
+        
+        Returns:
+            Final output samples, trimmed so the total length is
+            ``round(input_length / rate)``
+        """
+        v = self.vocoder
+        self._buffer = np.concatenate([self._buffer, np.zeros(v.n_fft // 2)])
+        n_frames = 1 + self._n_in // v.hop_length
+
+        out = self._run(self._steps_before(n_frames), n_frames=n_frames)
+
+        # Remaining overlap-add tail is final as well
+        tail = self._normalize(self._ola, self._ola_norm)
+        out = np.concatenate([out, self._take(tail)])
+
+        target = int(round(self._n_in / self.rate))
+        missing = target - (self._n_out - len(out))
+        if len(out) > missing:
+            out = out[:max(missing, 0)]
+        elif len(out) < missing:
+            out = np.pad(out, (0, missing - len(out)))
+        return out
+
+    def _available_frames(self) -> int:
+        """Number of complete frames in the input buffer."""
+        v = self.vocoder
+        if len(self._buffer) < v.n_fft:
+            return 0
+        return (len(self._buffer) - v.n_fft) // v.hop_length + 1
+
+    def _steps_before(self, limit: int) -> int:
+        """Number of steps s >= 0 with s * rate < limit."""
+        if limit <= 0:
+            return 0
+        steps = int(np.ceil(limit / self.rate))
+        while steps > 0 and (steps - 1) * self.rate >= limit:
+            steps -= 1
+        while steps * self.rate < limit:
+            steps += 1
+        return steps
+
+    def _run(self, step_end: int, n_frames: Optional[int]) -> np.ndarray:
+        """Run synthesis steps up to ``step_end`` in bounded blocks."""
+        out = []
+        while self._step < step_end:
+            out.append(self._run_block(min(step_end, self._step + _STEPS_PER_BLOCK), n_frames))
+        return np.concatenate(out) if out else np.zeros(0)
+
+    def _run_block(self, step_end: int, n_frames: Optional[int]) -> np.ndarray:
+        """Vectorized phase vocoder for steps [self._step, step_end)."""
+        v = self.vocoder
+        hop = v.hop_length
+        n_steps = step_end - self._step
+
+        # Fractional input frame positions for each step
+        positions = np.arange(self._step, step_end) * self.rate
+        frame_index = np.floor(positions).astype(np.int64)
+        alpha = (positions - frame_index)[:, None]
+
+        # Analyse the input frames these steps need; frames past the end of
+        # the signal (when flushing) are zero columns
+        first = frame_index[0] - self._frame_offset
+        stop = frame_index[-1] + 2 - self._frame_offset
+        available = min(stop, self._available_frames())
+        frames = np.lib.stride_tricks.sliding_window_view(self._buffer, v.n_fft)[::hop]
+        spectra = np.fft.rfft(frames[first:available] * v.window, axis=1)
+        if available < stop:
+            spectra = np.vstack([spectra, np.zeros((stop - available, spectra.shape[1]))])
+
+        local = frame_index - frame_index[0]
+        left = spectra[local]
+        right = spectra[local + 1]
+
+        # Interpolate magnitude between neighbouring frames
+        magnitude = (1.0 - alpha) * np.abs(left) + alpha * np.abs(right)
+
+        # Phase advance from the instantaneous frequency of each bin
+        delta = np.angle(right) - np.angle(left) - v.phase_advance
+        delta -= 2.0 * np.pi * np.round(delta / (2.0 * np.pi))
+        increment = v.phase_advance + delta
+
+        if self._phase is None:
+            self._phase = np.angle(spectra[0])
+        phase = np.empty_like(increment)
+        phase[0] = self._phase
+        np.cumsum(increment[:-1], axis=0, out=phase[1:])
+        phase[1:] += self._phase
+        self._phase = np.mod(phase[-1] + increment[-1], 2.0 * np.pi)
+
+        # Synthesize frames and overlap-add them at the output hop
+        frames_out = np.fft.irfft(magnitude * np.exp(1j * phase), n=v.n_fft, axis=1) * v.window
+
+        length = (n_steps - 1) * hop + v.n_fft
+        ola = np.zeros(length)
+        ola[:len(self._ola)] += self._ola
+        ola_norm = np.zeros(length)
+        ola_norm[:len(self._ola_norm)] += self._ola_norm
+
+        ola_blocks = ola.reshape(-1, hop)
+        norm_blocks = ola_norm.reshape(-1, hop)
+        for q in range(v.n_fft // hop):
+            ola_blocks[q:q + n_steps] += frames_out[:, q * hop:(q + 1) * hop]
+            norm_blocks[q:q + n_steps] += v.window_sq[q * hop:(q + 1) * hop]
+
+        # Samples before the next step's frame are complete
+        done = n_steps * hop
+        out = self._normalize(ola[:done], ola_norm[:done])
+        self._ola = ola[done:]
+        self._ola_norm = ola_norm[done:]
+        self._step = step_end
+
+        # Drop input frames no later step reads
+        next_frame = int(np.floor(self._step * self.rate))
+        drop = min(next_frame - self._frame_offset, len(self._buffer) // hop)
+        if drop > 0 and n_frames is None:
+            self._buffer = self._buffer[drop * hop:]
+            self._frame_offset += drop
+
+        return self._take(out)
+
+    def _normalize(self, ola: np.ndarray, norm: np.ndarray) -> np.ndarray:
+        """Divide out the summed synthesis window where it is non-negligible."""
+        out = ola.copy()
+        valid = norm > 1e-8
+        out[valid] /= norm[valid]
+        return out
+
+    def _take(self, out: np.ndarray) -> np.ndarray:
+        """Drop leading centre padding and count emitted samples."""
+        if self._skip:
+            skipped = min(self._skip, len(out))
+            out = out[skipped:]
+            self._skip -= skipped
+        self._n_out += len(out)
+        return out
+
+
+@lru_cache(maxsize=8)
+def get_phase_vocoder(n_fft: int = 1024) -> PhaseVocoder:
+    """Get a shared vocoder for an FFT size.
+    
+    Args:
+        n_fft: FFT size in samples
+        
+    Returns:
+        Shared PhaseVocoder instance
+    """
+    return PhaseVocoder(n_fft=n_fft)
+
+
+def fft_size_for(sample_rate: int) -> int:
+    """Pick an FFT size covering roughly 40 ms at a sample rate.
+    
+    Args:
+        sample_rate: Sample rate in Hz
+        
+    Returns:
+        Power-of-two FFT size
+    """
+    return int(2 ** round(np.log2(0.04 * sample_rate)))
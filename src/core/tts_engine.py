@@ -1,54 +1,160 @@
 """TTS engine abstraction layer."""
 
-from typing import Optional, Dict, Any
+import importlib
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Iterator, List
 import numpy as np
 
+from src.core.model_pool import ModelPool
 from src.models.base import BaseTTSModel
-from src.models.coqui import CoquiTTSModel
-from src.models.chatterbox import ChatterboxModel
+from src.utils.timing import span
 from config.settings import Settings
 
+# Backends that render emotion in the model itself; for anything else the
+# emotion's prosody scales are applied to the audio after synthesis
+NATIVE_EMOTION_MODELS = {"chatterbox", "coqui"}
+
+# Model name -> (module, class); modules are imported on first use so the
+# heavy dependencies of one backend are not needed to run another
+MODEL_BACKENDS = {
+    "coqui": ("src.models.coqui", "CoquiTTSModel"),
+    "chatterbox": ("src.models.chatterbox", "ChatterboxModel"),
+    "reference": ("src.models.reference", "ReferenceTTSModel"),
+    # "bark": ("src.models.bark", "BarkModel"),  # Implement when available
+}
+
 
 class TTSEngine:
-    """Main TTS engine that manages model loading and synthesis."""
+    """Main TTS engine that manages model loading and synthesis.
+
+    The default model (``model_name``) and any ``enabled_models`` are
+    kept in a ``ModelPool``: each is loaded on first use and stays
+    resident until it has to make room for another model under
+    ``model_memory_budget_bytes``. Every method takes an optional
+    ``model`` name and uses the default model when it is omitted.
+    """
 
     def __init__(self, settings: Settings):
         """Initialize TTS engine.
         
         Args:
             settings: Application settings
+            
+        Raises:
+            ValueError: If a model name is unknown
+            ImportError: If a backend or its dependencies are not installed
         """
         self.settings = settings
-        self.model: Optional[BaseTTSModel] = None
-        self._initialize_model()
-
-    def _initialize_model(self) -> None:
-        """Initialize the TTS model based on settings."""
-        model_map = {
-            "coqui": CoquiTTSModel,
-            "chatterbox": ChatterboxModel,
-            # "bark": BarkModel,  # Implement when available
-        }
-
-        model_class = model_map.get(self.settings.model_name)
-        if not model_class:
+        self.default_model = settings.model_name
+        self.available_models = list(dict.fromkeys([settings.model_name, *settings.enabled_models]))
+        self.pool = ModelPool(
+            self._create_model,
+            memory_budget_bytes=settings.model_memory_budget_bytes,
+            sizes=settings.model_memory_bytes
+        )
+        # Models are created (not loaded) up front so a missing backend
+        # is reported at startup rather than on its first request
+        for name in self.available_models:
+            self.pool.get(name)
+        self.model: Optional[BaseTTSModel] = self.pool.get(self.default_model)
+
+    def _create_model(self, name: str) -> BaseTTSModel:
+        """Instantiate the (unloaded) backend for a model name.
+        
+        Raises:
+            ValueError: If the model name is unknown
+            ImportError: If the backend or its dependencies are not installed
+        """
+        backend = MODEL_BACKENDS.get(name)
+        if not backend:
+            raise ValueError(
+                f"Unknown model: {name}. "
+                f"Available: {', '.join(MODEL_BACKENDS.keys())}"
+            )
+
+        module_name, class_name = backend
+        try:
+            model_class = getattr(importlib.import_module(module_name), class_name)
+        except ImportError as e:
+            raise ImportError(
+                f"Model backend '{name}' is not available: {e}"
+            ) from e
+
+        return model_class(device=self.settings.device, **self._model_options(name))
+
+    def _model_options(self, name: str) -> Dict[str, Any]:
+        """Backend-specific constructor arguments from settings."""
+        if name == "reference":
+            return {
+                "sample_rate": self.settings.reference_sample_rate,
+                "seconds_per_char": self.settings.reference_seconds_per_char,
+                "latency_ms": self.settings.reference_latency_ms,
+                "latency_ms_per_char": self.settings.reference_latency_ms_per_char,
+            }
+        return {}
+
+    def resolve_model(self, model: Optional[str] = None) -> str:
+        """Validate a requested model name.
+        
+        Args:
+            model: Requested model, or None for the default model
+            
+        Returns:
+            Name of the model to use
+            
+        Raises:
+            ValueError: If the model is not enabled
+        """
+        if model is None:
+            return self.default_model
+        if model not in self.available_models:
             raise ValueError(
-                f"Unknown model: {self.settings.model_name}. "
-                f"Available: {', '.join(model_map.keys())}"
+                f"Model '{model}' not available. "
+                f"Available: {', '.join(self.available_models)}"
             )
+        return model
 
-        self.model = model_class(device=self.settings.device)
+    def get_model(self, model: Optional[str] = None) -> BaseTTSModel:
+        """Get a model instance without loading it.
+        
+        Args:
+            model: Model name, or None for the default model
+            
+        Returns:
+            The model instance
+        """
+        return self.pool.get(self.resolve_model(model))
+
+    def load_model(self, model: Optional[str] = None) -> None:
+        """Load a model, evicting others if the memory budget requires it.
+        
+        Safe to call from several threads (warm-up and early requests);
+        the model is loaded once.
+        
+        Args:
+            model: Model name, or None for the default model
+        """
+        self.pool.load(self.resolve_model(model))
 
-    def load_model(self) -> None:
-        """Load the TTS model."""
-        if self.model and not self.model.is_loaded:
-            self.model.load_model()
+    @contextmanager
+    def keep_loaded(self, model: Optional[str] = None) -> Iterator[None]:
+        """Load a model on the calling thread and keep it resident inside a ``with`` block.
+        
+        Work handed to another thread inside the block (the micro-batcher's
+        dispatcher) then finds the model loaded and never loads it there.
+        
+        Args:
+            model: Model name, or None for the default model
+        """
+        with self.pool.acquire(self.resolve_model(model)):
+            yield
 
     def synthesize(
         self,
         text: str,
         emotion: str = "neutral",
         intensity: float = 0.5,
+        model: Optional[str] = None,
         **kwargs: Any
     ) -> np.ndarray:
         """Synthesize speech from text.
@@ -57,56 +163,130 @@ class TTSEngine:
             text: Input text
             emotion: Emotion to apply
             intensity: Emotion intensity (0.0-1.0)
+            model: Model to synthesize with, or None for the default model
             **kwargs: Additional synthesis parameters
             
         Returns:
             Audio array as numpy
         """
-        if not self.model:
-            raise RuntimeError("No model initialized")
+        with self.pool.acquire(self.resolve_model(model)) as tts_model:
+            self._validate_emotion(tts_model, emotion)
+
+            # Synthesize
+            with span("model"):
+                audio = tts_model.synthesize(
+                    text=text,
+                    emotion=emotion,
+                    intensity=intensity,
+                    **kwargs
+                )
+
+        return audio
+
+    def synthesize_batch(
+        self,
+        texts: List[str],
+        emotion: str = "neutral",
+        intensity: float = 0.5,
+        model: Optional[str] = None,
+        **kwargs: Any
+    ) -> List[np.ndarray]:
+        """Synthesize several texts that share emotion and intensity.
+        
+        Uses the model's ``synthesize_batch`` entry point when it has one, so
+        the texts go through the model in a single invocation; otherwise
+        they are synthesized one after another.
+        
+        Args:
+            texts: Input texts
+            emotion: Emotion to apply
+            intensity: Emotion intensity (0.0-1.0)
+            model: Model to synthesize with, or None for the default model
+            **kwargs: Additional synthesis parameters
+            
+        Returns:
+            One audio array per text, in order
+        """
+        with self.pool.acquire(self.resolve_model(model)) as tts_model:
+            self._validate_emotion(tts_model, emotion)
+
+            with span("model"):
+                batch_fn = getattr(tts_model, "synthesize_batch", None)
+                if batch_fn is not None:
+                    return list(batch_fn(texts=texts, emotion=emotion, intensity=intensity, **kwargs))
 
-        if not self.model.is_loaded:
-            self.load_model()
+                return [
+                    tts_model.synthesize(text=text, emotion=emotion, intensity=intensity, **kwargs)
+                    for text in texts
+                ]
 
-        # Validate emotion
-        if not self.model.validate_emotion(emotion):
+    def _validate_emotion(self, tts_model: BaseTTSModel, emotion: str) -> None:
+        """Check that a model renders the emotion.
+        
+        Raises:
+            ValueError: If the emotion is not supported by the model
+        """
+        if not tts_model.validate_emotion(emotion):
             raise ValueError(
                 f"Emotion '{emotion}' not supported. "
-                f"Available: {', '.join(self.model.get_supported_emotions())}"
+                f"Available: {', '.join(tts_model.get_supported_emotions())}"
             )
 
-        # Synthesize
-        audio = self.model.synthesize(
-            text=text,
-            emotion=emotion,
-            intensity=intensity,
-            **kwargs
-        )
-
-        return audio
-
-    def get_sample_rate(self) -> int:
-        """Get current model's sample rate.
+    def get_sample_rate(self, model: Optional[str] = None) -> int:
+        """Get a model's sample rate.
         
+        Args:
+            model: Model name, or None for the default model
+            
         Returns:
             Sample rate in Hz
         """
-        if not self.model:
-            return self.settings.default_sample_rate
-        return self.model.get_sample_rate()
+        return self.get_model(model).get_sample_rate()
+
+    def supports_native_emotion(self, model: Optional[str] = None) -> bool:
+        """Check whether a model controls emotion itself.
+        
+        Models may declare this with a ``supports_native_emotion``
+        attribute; otherwise the built-in list of backends is used.
+        
+        Args:
+            model: Model name, or None for the default model
+            
+        Returns:
+            True if emotion prosody should not be applied in post-processing
+        """
+        name = self.resolve_model(model)
+        return bool(getattr(
+            self.pool.get(name),
+            "supports_native_emotion",
+            name in NATIVE_EMOTION_MODELS
+        ))
 
-    def get_supported_emotions(self) -> list[str]:
+    def get_supported_emotions(self, model: Optional[str] = None) -> list[str]:
         """Get list of supported emotions.
         
+        Args:
+            model: Model name, or None for the default model
+            
         Returns:
             List of emotion identifiers
         """
-        if not self.model:
-            return []
-        return self.model.get_supported_emotions()
+        return self.get_model(model).get_supported_emotions()
 
-    def unload_model(self) -> None:
-        """Unload model to free memory."""
-        if self.model:
-            self.model.unload_model()
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get residency statistics of the model pool (see ``ModelPool.get_stats``)."""
+        stats = self.pool.get_stats()
+        stats["default"] = self.default_model
+        stats["available"] = list(self.available_models)
+        return stats
 
+    def unload_model(self, model: Optional[str] = None) -> None:
+        """Unload models to free memory.
+        
+        Args:
+            model: Model to unload, or None for every model not in use
+        """
+        if model is None:
+            self.pool.unload_all()
+        else:
+            self.pool.unload(self.resolve_model(model))
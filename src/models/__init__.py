@@ -0,0 +1 @@
+"""TTS model implementations."""
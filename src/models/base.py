@@ -0,0 +1,97 @@
+"""Interface of TTS model backends."""
+
+from abc import ABC, abstractmethod
+from typing import Any
+
+import numpy as np
+
+# Emotions every backend is expected to render (see config/emotions.yaml)
+DEFAULT_EMOTIONS = ["neutral", "excited", "sad", "serious", "empathetic", "urgent"]
+
+
+class BaseTTSModel(ABC):
+    """Base class for TTS backends used by ``TTSEngine``.
+
+    Backends may additionally provide ``synthesize_batch(texts, emotion,
+    intensity, **kwargs)`` to render several texts in one invocation, and a
+    ``supports_native_emotion`` attribute; the engine falls back to
+    per-text synthesis and its built-in backend list otherwise.
+    """
+
+    model_name = "base"
+
+    def __init__(self, device: str = "cpu"):
+        """Initialize model.
+
+        Args:
+            device: Device to run on (cpu, cuda, mps)
+        """
+        self.device = device
+        self.is_loaded = False
+
+    @abstractmethod
+    def load_model(self) -> None:
+        """Load weights and prepare for synthesis."""
+
+    def unload_model(self) -> None:
+        """Release the model's resources."""
+        self.is_loaded = False
+
+    def memory_footprint(self) -> int:
+        """Estimate the memory the loaded model occupies.
+
+        Used by the engine's model pool to keep resident models within
+        their memory budget. Backends should report their weights and
+        buffers; 0 means unknown.
+
+        Returns:
+            Size in bytes
+        """
+        return 0
+
+    @abstractmethod
+    def synthesize(
+        self,
+        text: str,
+        emotion: str = "neutral",
+        intensity: float = 0.5,
+        **kwargs: Any
+    ) -> np.ndarray:
+        """Synthesize speech from text.
+
+        Args:
+            text: Input text
+            emotion: Emotion to apply
+            intensity: Emotion intensity (0.0-1.0)
+            **kwargs: Backend-specific parameters
+
+        Returns:
+            Mono float32 audio at ``get_sample_rate()``
+        """
+
+    @abstractmethod
+    def get_sample_rate(self) -> int:
+        """Get the sample rate of synthesized audio.
+
+        Returns:
+            Sample rate in Hz
+        """
+
+    def get_supported_emotions(self) -> list[str]:
+        """Get list of supported emotions.
+
+        Returns:
+            List of emotion identifiers
+        """
+        return list(DEFAULT_EMOTIONS)
+
+    def validate_emotion(self, emotion: str) -> bool:
+        """Check whether an emotion is supported.
+
+        Args:
+            emotion: Emotion identifier
+
+        Returns:
+            True if the emotion can be rendered
+        """
+        return emotion in self.get_supported_emotions()
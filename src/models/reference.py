@@ -0,0 +1,189 @@
+"""Deterministic parametric synthesizer for offline testing and benchmarks."""
+
+import threading
+import time
+import zlib
+from typing import Any, Dict, List
+
+import numpy as np
+
+from src.models.base import BaseTTSModel
+
+# First three formants (Hz) of the vowels; other voiced letters use a schwa
+VOWEL_FORMANTS = {
+    "a": (730.0, 1090.0, 2440.0),
+    "e": (530.0, 1840.0, 2480.0),
+    "i": (270.0, 2290.0, 3010.0),
+    "o": (570.0, 840.0, 2410.0),
+    "u": (300.0, 870.0, 2240.0),
+    "y": (270.0, 2290.0, 3010.0),
+}
+SCHWA_FORMANTS = (500.0, 1500.0, 2500.0)
+VOICED_CONSONANTS = set("bdgjlmnrvwz")
+
+# Relative amplitudes of the three formants
+FORMANT_GAINS = (1.0, 0.5, 0.25)
+
+# Each character's segment fades in and out over this many seconds
+TRANSITION_SECONDS = 0.01
+
+
+class ReferenceTTSModel(BaseTTSModel):
+    """Formant synthesizer that needs no weights, network or GPU.
+
+    Every character becomes a fixed-length segment: vowels are voiced with
+    their formants, voiced consonants with a schwa, other letters are
+    noise bursts and spaces and punctuation are silence. Segments are
+    rendered once per character and then only copied, so synthesis costs
+    little more than writing the output. The output is a pure function of
+    the text, so results are reproducible and cacheable, and its length is
+    ``seconds_per_char`` (rounded to whole samples) per character.
+
+    Inference cost can be simulated with a sleep of ``latency_ms`` per call
+    plus ``latency_ms_per_char`` per character. ``synthesize_batch`` pays
+    the per-call part once, like a real batched model. The sleep releases
+    the GIL, as GPU inference does, so worker pools and queues behave
+    realistically.
+    """
+
+    model_name = "reference"
+    supports_native_emotion = False
+
+    def __init__(
+        self,
+        device: str = "cpu",
+        sample_rate: int = 24000,
+        seconds_per_char: float = 0.06,
+        latency_ms: float = 0.0,
+        latency_ms_per_char: float = 0.0,
+        pitch_hz: float = 120.0
+    ):
+        """Initialize model.
+
+        Args:
+            device: Ignored; the synthesizer always runs on the CPU
+            sample_rate: Output sample rate in Hz
+            seconds_per_char: Audio length per input character
+            latency_ms: Simulated inference time per call
+            latency_ms_per_char: Simulated inference time per character
+            pitch_hz: Mean fundamental frequency
+        """
+        super().__init__(device=device)
+        self.sample_rate = sample_rate
+        self.seconds_per_char = seconds_per_char
+        self.latency_ms = latency_ms
+        self.latency_ms_per_char = latency_ms_per_char
+        self.pitch_hz = pitch_hz
+
+        # Rendered character segments, one row per distinct character
+        self._segment_length = max(1, int(round(seconds_per_char * sample_rate)))
+        self._templates: Dict[str, int] = {}
+        self._table = np.zeros((0, self._segment_length), dtype=np.float32)
+        self._lock = threading.Lock()
+
+    def load_model(self) -> None:
+        """Nothing to load; marks the model ready."""
+        self.is_loaded = True
+
+    def get_sample_rate(self) -> int:
+        return self.sample_rate
+
+    def memory_footprint(self) -> int:
+        """Size of the rendered character templates."""
+        return int(self._table.nbytes)
+
+    def synthesize(
+        self,
+        text: str,
+        emotion: str = "neutral",
+        intensity: float = 0.5,
+        **kwargs: Any
+    ) -> np.ndarray:
+        """Synthesize speech from text.
+
+        Emotion is not rendered by this model; the engine applies the
+        emotion's prosody in post-processing.
+
+        Args:
+            text: Input text
+            emotion: Emotion to apply (validated only)
+            intensity: Emotion intensity (unused)
+            **kwargs: Ignored
+
+        Returns:
+            Mono float32 audio, one segment per character
+        """
+        self._simulate_latency(len(text))
+        return self._render(text)
+
+    def synthesize_batch(
+        self,
+        texts: List[str],
+        emotion: str = "neutral",
+        intensity: float = 0.5,
+        **kwargs: Any
+    ) -> List[np.ndarray]:
+        """Synthesize several texts in one simulated model invocation.
+
+        Args:
+            texts: Input texts
+            emotion: Emotion to apply (validated only)
+            intensity: Emotion intensity (unused)
+            **kwargs: Ignored
+
+        Returns:
+            One audio array per text, in order
+        """
+        self._simulate_latency(sum(len(text) for text in texts))
+        return [self._render(text) for text in texts]
+
+    def _simulate_latency(self, chars: int) -> None:
+        """Sleep for the configured inference time."""
+        delay = (self.latency_ms + self.latency_ms_per_char * chars) / 1000
+        if delay > 0:
+            time.sleep(delay)
+
+    def _render(self, text: str) -> np.ndarray:
+        """Concatenate the segments of a text's characters."""
+        if not text:
+            return np.zeros(0, dtype=np.float32)
+        codes = [self._template_index(char) for char in text.lower()]
+        return self._table[codes].reshape(-1)
+
+    def _template_index(self, char: str) -> int:
+        """Row of a character's segment in the template table, rendering it if new."""
+        index = self._templates.get(char)
+        if index is None:
+            with self._lock:
+                index = self._templates.get(char)
+                if index is None:
+                    index = len(self._templates)
+                    self._table = np.vstack([self._table, self._render_segment(char)])
+                    self._templates[char] = index
+        return index
+
+    def _render_segment(self, char: str) -> np.ndarray:
+        """Render one character: formants, noise burst or silence."""
+        sr = self.sample_rate
+        n = self._segment_length
+        t = np.arange(n) / sr
+
+        if char in VOWEL_FORMANTS or char.isdigit() or char in VOICED_CONSONANTS:
+            # Formants excited by a glottal pulse train
+            pulse = 0.5 - 0.5 * np.cos(2 * np.pi * self.pitch_hz * t)
+            segment = np.zeros(n)
+            for frequency, gain in zip(VOWEL_FORMANTS.get(char, SCHWA_FORMANTS), FORMANT_GAINS):
+                segment += gain * np.sin(2 * np.pi * frequency * t)
+            segment *= 0.3 * pulse ** 3
+            if char in VOICED_CONSONANTS:
+                segment *= 0.6
+        elif char.isalpha():
+            # Unvoiced consonant: high-passed noise, reproducible per letter
+            rng = np.random.default_rng(zlib.crc32(char.encode("utf-8")))
+            segment = 0.05 * np.diff(rng.standard_normal(n + 1))
+        else:
+            return np.zeros(n, dtype=np.float32)
+
+        ramp = max(1, int(TRANSITION_SECONDS * sr))
+        fade = np.minimum(1.0, np.minimum(np.arange(n) + 1, np.arange(n, 0, -1)) / ramp)
+        return (segment * fade).astype(np.float32)
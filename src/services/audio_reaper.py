@@ -0,0 +1,179 @@
+"""Background expiry and disk quota enforcement for generated audio."""
+
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from src.core.audio_index import AudioIndex, IndexEntry
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class AudioReaper:
+    """Delete expired audio files and keep the directory under a byte quota.
+
+    Each pass removes files not used for ``ttl_seconds`` and then, while the
+    indexed total exceeds ``max_bytes``, the least recently used files. All
+    candidates come from the ``AudioIndex``; the directory is only scanned
+    once, on the first pass, to pick up files the index does not know.
+    """
+
+    def __init__(
+        self,
+        index: AudioIndex,
+        ttl_seconds: float,
+        max_bytes: int = 0,
+        interval_seconds: float = 300.0,
+        batch_size: int = 500,
+        clock: Callable[[], float] = time.time
+    ):
+        """Initialize reaper.
+
+        Args:
+            index: Index of the audio directory
+            ttl_seconds: Files unused for this long are deleted (0 disables expiry)
+            max_bytes: Maximum total size of indexed files (0 disables the quota)
+            interval_seconds: Time between passes when run in the background
+            batch_size: Files fetched from the index per query
+            clock: Time source, matching the index's
+        """
+        self.index = index
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._reconciled = False
+
+        # Statistics
+        self._passes = 0
+        self._failed_passes = 0
+        self._expired_files = 0
+        self._evicted_files = 0
+        self._bytes_reclaimed = 0
+        self._last_pass = 0.0
+        self._max_pass = 0.0
+
+    def run_pass(self) -> Dict[str, int]:
+        """Run one expiry and quota pass.
+
+        Returns:
+            Dictionary with files expired, files evicted and bytes reclaimed
+        """
+        start = time.perf_counter()
+
+        if not self._reconciled:
+            added, dropped = self.index.reconcile()
+            self._reconciled = True
+            if added or dropped:
+                logger.info(f"Audio index reconciled: {added} files added, {dropped} dropped")
+        else:
+            # Pick up files written or removed by other processes
+            self.index.recount()
+
+        expired = evicted = reclaimed = 0
+
+        if self.ttl_seconds > 0:
+            cutoff = self.clock() - self.ttl_seconds
+            while True:
+                entries = self.index.expired(cutoff, self.batch_size)
+                deleted, size = self._delete(entries)
+                if not deleted:
+                    break
+                reclaimed += size
+                expired += deleted
+
+        if self.max_bytes > 0:
+            _, total = self.index.totals()
+            while total > self.max_bytes:
+                victims = []
+                excess = total - self.max_bytes
+                for entry in self.index.least_recent(self.batch_size):
+                    if excess <= 0:
+                        break
+                    victims.append(entry)
+                    excess -= entry[1]
+                deleted, size = self._delete(victims)
+                if not deleted:
+                    break
+                total -= size
+                reclaimed += size
+                evicted += deleted
+
+        duration = time.perf_counter() - start
+        with self._lock:
+            self._passes += 1
+            self._expired_files += expired
+            self._evicted_files += evicted
+            self._bytes_reclaimed += reclaimed
+            self._last_pass = duration
+            self._max_pass = max(self._max_pass, duration)
+
+        if expired or evicted:
+            logger.info(
+                f"Audio reaper removed {expired} expired and {evicted} evicted files "
+                f"({reclaimed} bytes) in {duration * 1000:.1f} ms"
+            )
+        return {"expired": expired, "evicted": evicted, "bytes_reclaimed": reclaimed}
+
+    def _delete(self, entries: List[IndexEntry]) -> Tuple[int, int]:
+        """Delete files and their index entries.
+
+        Returns:
+            Tuple of (files deleted, bytes reclaimed)
+        """
+        reclaimed = 0
+        deleted = []
+        for entry in entries:
+            path, size, _ = entry
+            try:
+                (self.index.root / path).unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning(f"Failed to delete audio file {path}: {e}")
+                continue
+            deleted.append(entry)
+            reclaimed += size
+        self.index.forget(deleted)
+        return len(deleted), reclaimed
+
+    async def run(self) -> None:
+        """Run passes every ``interval_seconds`` until cancelled."""
+        logger.info(
+            f"Audio reaper started (ttl={self.ttl_seconds:.0f}s, "
+            f"max_bytes={self.max_bytes}, interval={self.interval_seconds:.0f}s)"
+        )
+        while True:
+            try:
+                await asyncio.to_thread(self.run_pass)
+            except Exception as e:
+                with self._lock:
+                    self._failed_passes += 1
+                logger.error(f"Audio reaper pass failed: {e}", exc_info=True)
+            await asyncio.sleep(self.interval_seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get reaper statistics.
+
+        Returns:
+            Dictionary with tracked usage, reclaimed files and bytes, and
+            pass durations
+        """
+        files, size = self.index.totals()
+        with self._lock:
+            return {
+                "files": files,
+                "bytes": size,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "passes": self._passes,
+                "failed_passes": self._failed_passes,
+                "expired_files": self._expired_files,
+                "evicted_files": self._evicted_files,
+                "bytes_reclaimed": self._bytes_reclaimed,
+                "last_pass_ms": round(self._last_pass * 1000, 3),
+                "max_pass_ms": round(self._max_pass * 1000, 3),
+            }
@@ -0,0 +1,270 @@
+"""Priority lanes with weighted fair queuing across tenants."""
+
+import itertools
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+INTERACTIVE = "interactive"
+BATCH = "batch"
+DEFAULT_LANES = (INTERACTIVE, BATCH)
+
+DEFAULT_TENANT = "anonymous"
+
+
+class QueueClosedError(Exception):
+    """Raised by ``FairQueue.put`` after the queue has been closed."""
+
+
+class LaneFullError(Exception):
+    """Raised by ``FairQueue.put`` when the lane is at capacity."""
+
+
+class LatencyWindow:
+    """Percentiles over the most recent samples."""
+
+    def __init__(self, size: int = 1024):
+        self._samples: Deque[float] = deque(maxlen=size)
+
+    def add(self, value: float) -> None:
+        self._samples.append(value)
+
+    def percentiles(self, points: Sequence[float] = (50, 95, 99)) -> Dict[str, float]:
+        """Get percentiles in milliseconds, keyed like ``p95``."""
+        if not self._samples:
+            return {f"p{p:g}": 0.0 for p in points}
+        values = np.percentile(np.fromiter(self._samples, dtype=float), points)
+        return {f"p{p:g}": round(float(v) * 1000, 3) for p, v in zip(points, values)}
+
+
+@dataclass
+class _Entry:
+    """A queued item with its scheduling tags."""
+
+    item: Any
+    tenant: str
+    start_tag: float
+    seq: int
+    deadline: Optional[float]
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class _Lane:
+    """Start-time fair queuing state for one priority lane."""
+
+    def __init__(self, name: str, max_size: int):
+        self.name = name
+        self.max_size = max_size
+        self.queues: Dict[str, Deque[_Entry]] = {}
+        self.last_finish: Dict[str, float] = {}
+        self.virtual_time = 0.0
+        self.depth = 0
+
+        # Statistics
+        self.enqueued = 0
+        self.dispatched = 0
+        self.expired = 0
+        self.rejected = 0
+        self.waits = LatencyWindow()
+        self.latencies = LatencyWindow()
+
+    def push(self, entry: _Entry, cost: float, weight: float) -> None:
+        start = max(self.virtual_time, self.last_finish.get(entry.tenant, 0.0))
+        entry.start_tag = start
+        self.last_finish[entry.tenant] = start + cost / weight
+        self.queues.setdefault(entry.tenant, deque()).append(entry)
+        self.depth += 1
+        self.enqueued += 1
+
+    def pop(self) -> _Entry:
+        """Remove the head with the smallest start tag across tenants."""
+        tenant, queue = min(
+            self.queues.items(),
+            key=lambda kv: (kv[1][0].start_tag, kv[1][0].seq)
+        )
+        entry = queue.popleft()
+        self.depth -= 1
+        self.virtual_time = max(self.virtual_time, entry.start_tag)
+
+        # Forget idle tenants whose tags no longer matter
+        if not queue:
+            del self.queues[tenant]
+            if self.last_finish.get(tenant, 0.0) <= self.virtual_time:
+                self.last_finish.pop(tenant, None)
+        return entry
+
+
+class FairQueue:
+    """Thread-safe queue with priority lanes and per-tenant fairness.
+
+    Lanes are served in strict priority order: an item from a later lane is
+    only handed out when every earlier lane is empty. Within a lane, tenants
+    (e.g. API keys) share service in proportion to their weights using
+    start-time fair queuing, where each item's ``cost`` (e.g. text length)
+    advances its tenant's virtual clock. Items whose deadline has passed
+    when they reach the head are removed and passed to ``on_expired``
+    instead of being handed out.
+    """
+
+    def __init__(
+        self,
+        lanes: Sequence[str] = DEFAULT_LANES,
+        max_size: int = 16,
+        weights: Optional[Dict[str, float]] = None,
+        on_expired: Optional[Callable[[Any], None]] = None
+    ):
+        """Initialize queue.
+
+        Args:
+            lanes: Lane names, highest priority first
+            max_size: Maximum number of queued items per lane
+            weights: Tenant weights (tenants not listed get 1.0)
+            on_expired: Called (outside the lock) with each expired item
+        """
+        self.lanes = list(lanes)
+        self.weights = dict(weights or {})
+        self.on_expired = on_expired
+
+        self._lanes = {name: _Lane(name, max_size) for name in self.lanes}
+        self._condition = threading.Condition()
+        self._seq = itertools.count()
+        self._closed = False
+
+    def put(
+        self,
+        item: Any,
+        lane: str = INTERACTIVE,
+        tenant: str = DEFAULT_TENANT,
+        cost: float = 1.0,
+        deadline: Optional[float] = None
+    ) -> None:
+        """Add an item.
+
+        Args:
+            item: Item to queue
+            lane: Lane name
+            tenant: Tenant the item is accounted to
+            cost: Relative amount of work (must be positive)
+            deadline: ``time.perf_counter()`` value after which the item is
+                dropped instead of being handed out
+
+        Raises:
+            ValueError: If the lane is unknown
+            LaneFullError: If the lane is at capacity
+            QueueClosedError: If the queue has been closed
+        """
+        if lane not in self._lanes:
+            raise ValueError(f"Unknown lane '{lane}'. Available: {', '.join(self.lanes)}")
+
+        weight = self.weights.get(tenant, 1.0)
+        with self._condition:
+            if self._closed:
+                raise QueueClosedError()
+            state = self._lanes[lane]
+            if state.depth >= state.max_size:
+                state.rejected += 1
+                raise LaneFullError(lane)
+            entry = _Entry(item=item, tenant=tenant, start_tag=0.0, seq=next(self._seq), deadline=deadline)
+            state.push(entry, max(cost, 1e-9), weight)
+            self._condition.notify()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Tuple[Any, str, float]]:
+        """Remove the next item, blocking until one is available.
+
+        Args:
+            timeout: Seconds to wait (None waits forever)
+
+        Returns:
+            Tuple of (item, lane, seconds waited), or None if the queue is
+            closed and empty or the timeout expired
+        """
+        end = None if timeout is None else time.monotonic() + timeout
+        while True:
+            expired: List[Any] = []
+            result = None
+            with self._condition:
+                while True:
+                    entry, lane = self._pop_ready(expired)
+                    if entry is not None or expired or self._closed:
+                        break
+                    remaining = None if end is None else end - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                if entry is not None:
+                    wait = time.perf_counter() - entry.enqueued_at
+                    self._lanes[lane].waits.add(wait)
+                    result = (entry.item, lane, wait)
+
+            for item in expired:
+                if self.on_expired:
+                    self.on_expired(item)
+
+            if result is not None or not expired:
+                return result
+
+    def _pop_ready(self, expired: List[Any]) -> Tuple[Optional[_Entry], Optional[str]]:
+        """Pop the next live entry, collecting expired ones (lock held)."""
+        now = time.perf_counter()
+        for name in self.lanes:
+            state = self._lanes[name]
+            while state.depth:
+                entry = state.pop()
+                if entry.deadline is not None and now > entry.deadline:
+                    state.expired += 1
+                    expired.append(entry.item)
+                    continue
+                state.dispatched += 1
+                return entry, name
+        return None, None
+
+    def record_latency(self, lane: str, seconds: float) -> None:
+        """Record end-to-end latency (queue wait plus run time) for a lane."""
+        with self._condition:
+            self._lanes[lane].latencies.add(seconds)
+
+    def close(self) -> None:
+        """Stop accepting items; ``get`` returns None once drained."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def qsize(self) -> int:
+        """Total number of queued items."""
+        with self._condition:
+            return sum(state.depth for state in self._lanes.values())
+
+    def depths(self) -> Dict[str, int]:
+        """Number of queued items per lane."""
+        with self._condition:
+            return {name: self._lanes[name].depth for name in self.lanes}
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-lane statistics.
+
+        Returns:
+            Per-lane depth, counters, active tenants and wait/latency
+            percentiles in milliseconds
+        """
+        with self._condition:
+            stats = {}
+            for name in self.lanes:
+                state = self._lanes[name]
+                waits = state.waits.percentiles()
+                latencies = state.latencies.percentiles()
+                stats[name] = {
+                    "depth": state.depth,
+                    "max_depth": state.max_size,
+                    "tenants": len(state.queues),
+                    "enqueued": state.enqueued,
+                    "dispatched": state.dispatched,
+                    "expired": state.expired,
+                    "rejected": state.rejected,
+                    **{f"wait_{k}_ms": v for k, v in waits.items()},
+                    **{f"latency_{k}_ms": v for k, v in latencies.items()},
+                }
+            return stats
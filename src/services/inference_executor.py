@@ -0,0 +1,291 @@
+"""Bounded worker pool for blocking synthesis work."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from src.services.fair_queue import (
+    DEFAULT_LANES,
+    DEFAULT_TENANT,
+    INTERACTIVE,
+    FairQueue,
+    LaneFullError,
+    QueueClosedError,
+)
+from src.utils.exceptions import DeadlineExceededException, QueueFullException
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class _WorkItem:
+    """A unit of work waiting for a free worker."""
+
+    fn: Callable[..., Any]
+    args: tuple
+    kwargs: dict
+    future: Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class InferenceExecutor:
+    """Run blocking synthesis calls on a fixed pool of worker threads.
+
+    Model inference and DSP release the GIL for most of their runtime, so
+    threads keep the event loop free without copying the model into other
+    processes. Submissions beyond ``max_queue_size`` pending items in a
+    lane are rejected immediately with ``QueueFullException`` instead of
+    piling up behind a saturated model.
+
+    Pending work is ordered by a ``FairQueue``: interactive work always goes
+    ahead of batch work, and within a lane tenants (API keys) are served in
+    proportion to their weights, so one caller's backlog cannot starve the
+    others. Work that is still queued when its deadline passes fails with
+    ``DeadlineExceededException`` without running.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_queue_size: int = 16,
+        lanes: Sequence[str] = DEFAULT_LANES,
+        tenant_weights: Optional[Dict[str, float]] = None
+    ):
+        """Initialize executor and start worker threads.
+        
+        Args:
+            max_workers: Number of worker threads
+            max_queue_size: Maximum number of pending (not yet running) items per lane
+            lanes: Priority lanes, highest priority first
+            tenant_weights: Fair-share weight per tenant (default 1.0)
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        if max_queue_size < 1:
+            raise ValueError(f"max_queue_size must be at least 1, got {max_queue_size}")
+
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+
+        self._queue = FairQueue(
+            lanes=lanes,
+            max_size=max_queue_size,
+            weights=tenant_weights,
+            on_expired=self._expire
+        )
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+        # Statistics
+        self._active = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._expired = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._last_wait = 0.0
+
+        self._threads: List[threading.Thread] = []
+        for index in range(max_workers):
+            thread = threading.Thread(
+                target=self._worker,
+                name=f"inference-worker-{index}",
+                daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Queue a callable for execution on a worker thread.
+        
+        Uses the interactive lane, the anonymous tenant and no deadline;
+        see ``schedule`` to choose those.
+        
+        Args:
+            fn: Callable to execute
+            *args: Positional arguments for the callable
+            **kwargs: Keyword arguments for the callable
+            
+        Returns:
+            Future resolved with the callable's result
+            
+        Raises:
+            QueueFullException: If the pending queue is full
+            RuntimeError: If the executor has been shut down
+        """
+        return self.schedule(fn, args=args, kwargs=kwargs)
+
+    def schedule(
+        self,
+        fn: Callable[..., Any],
+        args: tuple = (),
+        kwargs: Optional[dict] = None,
+        lane: str = INTERACTIVE,
+        tenant: str = DEFAULT_TENANT,
+        cost: float = 1.0,
+        timeout: Optional[float] = None
+    ) -> Future:
+        """Queue a callable in a specific lane on behalf of a tenant.
+        
+        Args:
+            fn: Callable to execute
+            args: Positional arguments for the callable
+            kwargs: Keyword arguments for the callable
+            lane: Priority lane
+            tenant: Tenant the work is accounted to for fair sharing
+            cost: Relative amount of work (e.g. text length)
+            timeout: Seconds the work may wait for a worker before it is
+                dropped (None waits indefinitely)
+            
+        Returns:
+            Future resolved with the callable's result, or failed with
+            ``DeadlineExceededException`` if it waited past ``timeout``
+            
+        Raises:
+            QueueFullException: If the lane is full
+            ValueError: If the lane is unknown
+            RuntimeError: If the executor has been shut down
+        """
+        if self._shutdown:
+            raise RuntimeError("Inference executor has been shut down")
+
+        item = _WorkItem(fn=fn, args=args, kwargs=kwargs or {}, future=Future())
+        deadline = None if timeout is None else item.enqueued_at + timeout
+        try:
+            self._queue.put(item, lane=lane, tenant=tenant, cost=cost, deadline=deadline)
+        except LaneFullError:
+            with self._lock:
+                self._rejected += 1
+            raise QueueFullException(
+                f"Inference queue is full ({self.max_queue_size} pending {lane} requests)"
+            )
+        except QueueClosedError:
+            raise RuntimeError("Inference executor has been shut down")
+        return item.future
+
+    async def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Execute a callable on the pool and await its result.
+        
+        Args:
+            fn: Callable to execute
+            *args: Positional arguments for the callable
+            **kwargs: Keyword arguments for the callable
+            
+        Returns:
+            The callable's return value
+        """
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def _expire(self, item: _WorkItem) -> None:
+        """Fail work that waited past its deadline."""
+        waited = time.perf_counter() - item.enqueued_at
+        if item.future.set_running_or_notify_cancel():
+            item.future.set_exception(DeadlineExceededException(
+                f"Request waited {waited * 1000:.0f} ms in the queue and passed its deadline"
+            ))
+        with self._lock:
+            self._expired += 1
+
+    def _worker(self) -> None:
+        """Worker loop: pull items until the queue is closed and drained."""
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                break
+            item, lane, wait = entry
+
+            if not item.future.set_running_or_notify_cancel():
+                continue
+
+            with self._lock:
+                self._active += 1
+                self._total_wait += wait
+                self._last_wait = wait
+                self._max_wait = max(self._max_wait, wait)
+
+            # Counted before the future resolves, so callers see the outcome
+            # in the statistics; failures are not counted as completed
+            try:
+                result = item.fn(*item.args, **item.kwargs)
+            except BaseException as e:
+                with self._lock:
+                    self._failed += 1
+                item.future.set_exception(e)
+            else:
+                with self._lock:
+                    self._completed += 1
+                item.future.set_result(result)
+            finally:
+                self._queue.record_latency(lane, time.perf_counter() - item.enqueued_at)
+                with self._lock:
+                    self._active -= 1
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of items waiting for a worker."""
+        return self._queue.qsize()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get executor statistics.
+        
+        Returns:
+            Dictionary with queue depth, worker usage, wait times and
+            per-lane depth and tail latency
+        """
+        with self._lock:
+            started = self._completed + self._failed + self._active
+            avg_wait = self._total_wait / started if started else 0.0
+            return {
+                "workers": self.max_workers,
+                "active": self._active,
+                "queue_depth": self._queue.qsize(),
+                "max_queue_size": self.max_queue_size,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "expired": self._expired,
+                "avg_wait_ms": round(avg_wait * 1000, 3),
+                "max_wait_ms": round(self._max_wait * 1000, 3),
+                "last_wait_ms": round(self._last_wait * 1000, 3),
+                "lanes": self._queue.get_stats(),
+            }
+
+    def get_counters(self) -> Dict[str, Any]:
+        """Get task counters and lane depths, without computing percentiles.
+        
+        Returns:
+            Dictionary with active workers, task outcomes and ``lanes``
+            mapping each lane to its depth
+        """
+        with self._lock:
+            counters = {
+                "active": self._active,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "expired": self._expired,
+            }
+        counters["lanes"] = self._queue.depths()
+        return counters
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work and terminate worker threads.
+        
+        Args:
+            wait: Whether to block until queued work has finished
+        """
+        if self._shutdown:
+            return
+        self._shutdown = True
+
+        self._queue.close()
+
+        if wait:
+            for thread in self._threads:
+                thread.join()
+        logger.info("Inference executor shut down")
@@ -0,0 +1,124 @@
+"""State of asynchronous synthesis jobs."""
+
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+JOB_QUEUED = "queued"
+JOB_PROCESSING = "processing"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+FINISHED_STATES = {JOB_COMPLETED, JOB_FAILED}
+
+
+@dataclass
+class Job:
+    """Snapshot of an asynchronous synthesis job."""
+
+    job_id: str
+    status: str = JOB_QUEUED
+    chunks_total: int = 0
+    chunks_done: int = 0
+    audio_url: Optional[str] = None
+    duration: Optional[float] = None
+    model_name: Optional[str] = None
+    cached: bool = False
+    error: Optional[str] = None
+    expires_at: Optional[datetime] = None
+    timings: Dict[str, float] = field(default_factory=dict)
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has completed or failed."""
+        return self.status in FINISHED_STATES
+
+
+class JobStore(ABC):
+    """Interface for job state storage.
+
+    Implementations must be safe to call from worker threads. ``get``
+    returns a snapshot, so callers never observe a job mid-update.
+    """
+
+    @abstractmethod
+    def create(self, job: Job) -> None:
+        """Add a new job.
+
+        Args:
+            job: Initial job state
+        """
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[Job]:
+        """Look up a job.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Snapshot of the job, or None if unknown
+        """
+
+    @abstractmethod
+    def update(self, job_id: str, **changes: Any) -> None:
+        """Change fields of a job and bump its ``updated_at``.
+
+        Args:
+            job_id: Job identifier
+            **changes: Field values to set
+        """
+
+
+class InMemoryJobStore(JobStore):
+    """Process-local job store.
+
+    Keeps at most ``max_jobs`` jobs; when full, the oldest finished jobs are
+    dropped first. Jobs still queued or running are never dropped.
+    """
+
+    def __init__(self, max_jobs: int = 10000):
+        """Initialize store.
+
+        Args:
+            max_jobs: Number of jobs to retain
+        """
+        self.max_jobs = max_jobs
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, job: Job) -> None:
+        with self._lock:
+            self._jobs[job.job_id] = replace(job)
+            self._evict()
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return replace(job) if job else None
+
+    def update(self, job_id: str, **changes: Any) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            for name, value in changes.items():
+                setattr(job, name, value)
+            job.updated_at = datetime.now()
+
+    def _evict(self) -> None:
+        """Drop the oldest finished jobs beyond capacity (lock held)."""
+        excess = len(self._jobs) - self.max_jobs
+        if excess <= 0:
+            return
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.finished][:excess]:
+            del self._jobs[job_id]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._jobs)
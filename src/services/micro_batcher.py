@@ -0,0 +1,295 @@
+"""Dynamic micro-batching of concurrent model calls."""
+
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from src.utils.logging import get_logger
+from src.utils.timing import Timings, current_timings
+
+logger = get_logger(__name__)
+
+# Batched model entry point: (texts, emotion, intensity, **kwargs) -> one output per text
+BatchFn = Callable[..., Sequence[Any]]
+
+
+@dataclass
+class _Request:
+    """A single text waiting to be batched."""
+
+    text: str
+    group: Hashable
+    params: Dict[str, Any]
+    future: Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+    timings: Optional[Timings] = None
+
+
+class MicroBatchScheduler:
+    """Collect concurrent synthesis calls and run them as shared batches.
+
+    Callers on any thread hand in texts with their synthesis parameters.
+    A single dispatcher thread groups pending texts that can share a model
+    invocation (same emotion, intensity and extra arguments) and runs a
+    group once it holds ``max_batch_size`` texts or its oldest text has
+    waited ``max_wait_ms``. Each caller gets back only its own outputs.
+
+    Running all model calls on the dispatcher thread also serializes access
+    to the model, so concurrent requests no longer contend for it. Callers
+    with active ``Timings`` get the batch's ``batch_wait`` and ``model``
+    time recorded there, since the model runs outside their own thread.
+    """
+
+    def __init__(self, batch_fn: BatchFn, max_batch_size: int = 8, max_wait_ms: float = 10.0):
+        """Initialize scheduler and start the dispatcher thread.
+
+        Args:
+            batch_fn: Batched entry point, called as
+                ``batch_fn(texts=..., emotion=..., intensity=..., **kwargs)``
+            max_batch_size: Maximum texts per model invocation
+            max_wait_ms: Longest time a text waits for others to join its batch
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1, got {max_batch_size}")
+        if max_wait_ms < 0:
+            raise ValueError(f"max_wait_ms must not be negative, got {max_wait_ms}")
+
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+
+        self._queue: "queue.Queue[Optional[_Request]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+        # Statistics
+        self._batches = 0
+        self._items = 0
+        self._failed_batches = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+        self._last_batch_size = 0
+
+        self._thread = threading.Thread(
+            target=self._dispatcher,
+            name="micro-batch-dispatcher",
+            daemon=True
+        )
+        self._thread.start()
+
+    def submit(
+        self,
+        texts: List[str],
+        emotion: str = "neutral",
+        intensity: float = 0.5,
+        **kwargs: Any
+    ) -> List[Future]:
+        """Queue texts for batched synthesis.
+
+        Args:
+            texts: Input texts
+            emotion: Emotion to apply
+            intensity: Emotion intensity (0.0-1.0)
+            **kwargs: Additional synthesis parameters (must be hashable)
+
+        Returns:
+            One future per text, resolved with that text's output
+
+        Raises:
+            RuntimeError: If the scheduler has been shut down
+        """
+        if self._shutdown:
+            raise RuntimeError("Micro-batch scheduler has been shut down")
+
+        group = (emotion, intensity, tuple(sorted(kwargs.items())))
+        params = {"emotion": emotion, "intensity": intensity, **kwargs}
+
+        timings = current_timings()
+        futures = []
+        for text in texts:
+            request = _Request(
+                text=text, group=group, params=params, future=Future(), timings=timings
+            )
+            self._queue.put(request)
+            futures.append(request.future)
+        return futures
+
+    def synthesize_batch(
+        self,
+        texts: List[str],
+        emotion: str = "neutral",
+        intensity: float = 0.5,
+        **kwargs: Any
+    ) -> List[Any]:
+        """Synthesize texts through the scheduler and wait for the results.
+
+        Args:
+            texts: Input texts
+            emotion: Emotion to apply
+            intensity: Emotion intensity (0.0-1.0)
+            **kwargs: Additional synthesis parameters
+
+        Returns:
+            One output per text, in order
+        """
+        futures = self.submit(texts, emotion=emotion, intensity=intensity, **kwargs)
+        return [future.result() for future in futures]
+
+    def _dispatcher(self) -> None:
+        """Dispatcher loop: gather requests into groups and run due groups."""
+        pending: "OrderedDict[Hashable, List[_Request]]" = OrderedDict()
+
+        while True:
+            timeout = None
+            if pending:
+                oldest = min(requests[0].enqueued_at for requests in pending.values())
+                timeout = max(0.0, oldest + self.max_wait - time.perf_counter())
+
+            try:
+                request = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                request = None
+            else:
+                if request is None:
+                    break
+
+            if request is not None:
+                requests = pending.setdefault(request.group, [])
+                requests.append(request)
+
+                # Take everything already waiting before deciding what is due
+                while len(requests) < self.max_batch_size:
+                    try:
+                        request = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if request is None:
+                        self._queue.put(None)
+                        break
+                    requests = pending.setdefault(request.group, [])
+                    requests.append(request)
+
+            now = time.perf_counter()
+            for group in list(pending):
+                requests = pending[group]
+                while len(requests) >= self.max_batch_size:
+                    self._run_batch(requests[:self.max_batch_size])
+                    del requests[:self.max_batch_size]
+                if requests and now >= requests[0].enqueued_at + self.max_wait:
+                    self._run_batch(requests)
+                    requests = []
+                if not requests:
+                    del pending[group]
+
+        # Finish anything still pending at shutdown
+        for requests in pending.values():
+            for start in range(0, len(requests), self.max_batch_size):
+                self._run_batch(requests[start:start + self.max_batch_size])
+
+    def _run_batch(self, requests: List[_Request]) -> None:
+        """Run one model invocation and hand each caller its output."""
+        requests = [r for r in requests if r.future.set_running_or_notify_cancel()]
+        if not requests:
+            return
+
+        start = time.perf_counter()
+        waits = [start - r.enqueued_at for r in requests]
+
+        error: Optional[BaseException] = None
+        try:
+            outputs = list(self.batch_fn(texts=[r.text for r in requests], **requests[0].params))
+            if len(outputs) != len(requests):
+                raise RuntimeError(
+                    f"Batched synthesis returned {len(outputs)} outputs for {len(requests)} texts"
+                )
+        except BaseException as e:
+            logger.error(f"Micro-batch of {len(requests)} failed: {e}")
+            error = e
+
+        # Callers read their Timings as soon as their future resolves, so
+        # everything is recorded before any future is resolved
+        latency = time.perf_counter() - start
+        self._record_timings(requests, start, latency)
+        with self._lock:
+            self._batches += 1
+            self._items += len(requests)
+            self._failed_batches += error is not None
+            self._total_wait += sum(waits)
+            self._max_wait = max(self._max_wait, max(waits))
+            self._total_latency += latency
+            self._max_latency = max(self._max_latency, latency)
+            self._last_batch_size = len(requests)
+
+        if error is not None:
+            for r in requests:
+                r.future.set_exception(error)
+        else:
+            for r, output in zip(requests, outputs):
+                r.future.set_result(output)
+
+    def _record_timings(self, requests: List[_Request], start: float, latency: float) -> None:
+        """Record batch wait and model time once per caller in the batch."""
+        earliest: Dict[int, Tuple[Timings, float]] = {}
+        for r in requests:
+            if r.timings is not None:
+                _, enqueued_at = earliest.get(id(r.timings), (r.timings, r.enqueued_at))
+                earliest[id(r.timings)] = (r.timings, min(enqueued_at, r.enqueued_at))
+        for timings, enqueued_at in earliest.values():
+            timings.record("batch_wait", (start - enqueued_at) * 1000)
+            timings.record("model", latency * 1000)
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of texts waiting to be picked up by the dispatcher."""
+        return self._queue.qsize()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduler statistics.
+
+        Returns:
+            Dictionary with batch counts, fill ratio, queue wait and batch latency
+        """
+        with self._lock:
+            batches = self._batches
+            return {
+                "max_batch_size": self.max_batch_size,
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+                "queue_depth": self._queue.qsize(),
+                "batches": batches,
+                "items": self._items,
+                "failed_batches": self._failed_batches,
+                "avg_batch_size": round(self._items / batches, 3) if batches else 0.0,
+                "last_batch_size": self._last_batch_size,
+                "fill_ratio": (
+                    round(self._items / (batches * self.max_batch_size), 4) if batches else 0.0
+                ),
+                "avg_queue_wait_ms": (
+                    round(self._total_wait / self._items * 1000, 3) if self._items else 0.0
+                ),
+                "max_queue_wait_ms": round(self._max_wait * 1000, 3),
+                "avg_batch_latency_ms": (
+                    round(self._total_latency / batches * 1000, 3) if batches else 0.0
+                ),
+                "max_batch_latency_ms": round(self._max_latency * 1000, 3),
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work and terminate the dispatcher thread.
+
+        Args:
+            wait: Whether to block until pending batches have run
+        """
+        if self._shutdown:
+            return
+        self._shutdown = True
+
+        self._queue.put(None)
+        if wait:
+            self._thread.join()
+        logger.info("Micro-batch scheduler shut down")
@@ -0,0 +1,331 @@
+"""Token-bucket rate limiting with in-process and shared-store backends."""
+
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+Clock = Callable[[], float]
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    """Outcome of a rate limit check."""
+
+    allowed: bool
+    remaining: float
+    retry_after: float = 0.0
+
+
+def text_cost(text_length: int, chars_per_token: int) -> float:
+    """Tokens charged for a request carrying ``text_length`` characters.
+
+    Args:
+        text_length: Total characters of text in the request
+        chars_per_token: Characters covered by one token (0 charges one
+            token per request regardless of length)
+
+    Returns:
+        Number of tokens, at least 1
+    """
+    if chars_per_token <= 0:
+        return 1.0
+    return float(max(1, math.ceil(text_length / chars_per_token)))
+
+
+def _take(
+    state: Optional[Tuple[float, float]],
+    now: float,
+    capacity: float,
+    refill_per_second: float,
+    cost: float
+) -> Tuple[Tuple[float, float], RateLimitDecision]:
+    """Refill a bucket up to ``now`` and try to take ``cost`` tokens.
+
+    Args:
+        state: (tokens, last update time), or None for a new (full) bucket
+        now: Current time in seconds
+        capacity: Bucket size
+        refill_per_second: Tokens added per second
+        cost: Tokens requested (capped at ``capacity`` so that any single
+            request can eventually pass)
+
+    Returns:
+        Tuple of (new state, decision)
+    """
+    tokens, updated = state if state is not None else (capacity, now)
+    tokens = min(capacity, tokens + max(0.0, now - updated) * refill_per_second)
+    cost = min(cost, capacity)
+
+    if tokens >= cost:
+        tokens -= cost
+        return (tokens, now), RateLimitDecision(allowed=True, remaining=tokens)
+
+    retry_after = (cost - tokens) / refill_per_second
+    return (tokens, now), RateLimitDecision(allowed=False, remaining=tokens, retry_after=retry_after)
+
+
+class RateLimiter(ABC):
+    """Interface for token-bucket rate limiters.
+
+    Each key owns a bucket of ``capacity`` tokens that refills continuously
+    at ``refill_per_second``. A request is allowed if its cost can be taken
+    from the bucket; otherwise the decision says how long to wait.
+    """
+
+    # Whether ``acquire`` may block on I/O (callers on an event loop should
+    # run it in a thread)
+    blocking = False
+
+    def __init__(self, capacity: float, refill_per_second: float, clock: Clock = time.monotonic):
+        """Initialize limiter.
+
+        Args:
+            capacity: Burst size in tokens
+            refill_per_second: Sustained rate in tokens per second
+            clock: Time source in seconds
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        if refill_per_second <= 0:
+            raise ValueError(f"refill_per_second must be positive, got {refill_per_second}")
+
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self.clock = clock
+
+    @abstractmethod
+    def acquire(self, key: str, cost: float = 1.0) -> RateLimitDecision:
+        """Try to take ``cost`` tokens from the bucket of ``key``.
+
+        Args:
+            key: Client identifier (API key or IP address)
+            cost: Tokens to take
+
+        Returns:
+            Decision with the remaining tokens and, if denied, the seconds
+            until the request would be allowed
+        """
+
+
+class InMemoryRateLimiter(RateLimiter):
+    """Process-local rate limiter.
+
+    Buckets live in a dictionary, so limits are per worker process. At most
+    ``max_keys`` buckets are kept; the least recently used are dropped,
+    which only ever resets an idle client to a full bucket.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_per_second: float,
+        clock: Clock = time.monotonic,
+        max_keys: int = 100000
+    ):
+        """Initialize limiter.
+
+        Args:
+            capacity: Burst size in tokens
+            refill_per_second: Sustained rate in tokens per second
+            clock: Time source in seconds
+            max_keys: Number of client buckets to retain
+        """
+        super().__init__(capacity, refill_per_second, clock)
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str, cost: float = 1.0) -> RateLimitDecision:
+        with self._lock:
+            state, decision = _take(
+                self._buckets.get(key), self.clock(), self.capacity, self.refill_per_second, cost
+            )
+            self._buckets[key] = state
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+            return decision
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._buckets)
+
+
+class SharedStore(ABC):
+    """Interface for a key-value store shared between processes.
+
+    Rate limiter state is updated with optimistic concurrency: read a value,
+    compute the new one, and write it only if nobody changed it meanwhile.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Read a value.
+
+        Args:
+            key: Store key
+
+        Returns:
+            Current value, or None if missing or expired
+        """
+
+    @abstractmethod
+    def compare_and_set(self, key: str, expected: Optional[str], value: str, ttl: float) -> bool:
+        """Write a value if the current one still equals ``expected``.
+
+        Args:
+            key: Store key
+            expected: Value previously read (None if it was missing)
+            value: New value
+            ttl: Seconds until the key expires
+
+        Returns:
+            Whether the value was written
+        """
+
+
+class InMemoryStore(SharedStore):
+    """Shared store held in process memory.
+
+    Behaves like a remote store but needs no server; useful for tests and
+    single-process deployments of ``SharedStoreRateLimiter``.
+    """
+
+    def __init__(self, clock: Clock = time.time):
+        """Initialize store.
+
+        Args:
+            clock: Time source used for key expiry
+        """
+        self.clock = clock
+        self._values: Dict[str, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            return self._current(key)
+
+    def compare_and_set(self, key: str, expected: Optional[str], value: str, ttl: float) -> bool:
+        with self._lock:
+            if self._current(key) != expected:
+                return False
+            self._values[key] = (value, self.clock() + ttl)
+            return True
+
+    def _current(self, key: str) -> Optional[str]:
+        """Value of a key unless it has expired (lock held)."""
+        entry = self._values.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if self.clock() >= expires_at:
+            del self._values[key]
+            return None
+        return value
+
+
+class RedisStore(SharedStore):
+    """Shared store backed by Redis.
+
+    Compare-and-set uses ``WATCH``/``MULTI``, so the ``redis`` package is
+    needed but no server-side scripting.
+    """
+
+    def __init__(self, url: str, prefix: str = "ratelimit:"):
+        """Connect to Redis.
+
+        Args:
+            url: Redis URL (e.g. ``redis://localhost:6379/0``)
+            prefix: Prefix for all keys written by this store
+
+        Raises:
+            ImportError: If the ``redis`` package is not installed
+        """
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError(
+                "The redis rate limit backend requires the 'redis' package (pip install redis)"
+            ) from e
+
+        self._redis = redis
+        self._client = redis.Redis.from_url(url, decode_responses=True)
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[str]:
+        return self._client.get(self.prefix + key)
+
+    def compare_and_set(self, key: str, expected: Optional[str], value: str, ttl: float) -> bool:
+        key = self.prefix + key
+        with self._client.pipeline() as pipe:
+            try:
+                pipe.watch(key)
+                if pipe.get(key) != expected:
+                    pipe.unwatch()
+                    return False
+                pipe.multi()
+                pipe.set(key, value, px=max(1, int(ttl * 1000)))
+                pipe.execute()
+                return True
+            except self._redis.WatchError:
+                return False
+
+
+class SharedStoreRateLimiter(RateLimiter):
+    """Rate limiter whose buckets live in a ``SharedStore``.
+
+    All API processes (and hosts) pointing at the same store enforce one
+    limit per client. Buckets expire from the store once they would have
+    refilled completely, so idle clients cost no storage. The default clock
+    is wall time, since the stored timestamps are compared across processes.
+    """
+
+    blocking = True
+
+    def __init__(
+        self,
+        store: SharedStore,
+        capacity: float,
+        refill_per_second: float,
+        clock: Clock = time.time,
+        max_retries: int = 5
+    ):
+        """Initialize limiter.
+
+        Args:
+            store: Shared store holding the buckets
+            capacity: Burst size in tokens
+            refill_per_second: Sustained rate in tokens per second
+            clock: Time source in seconds
+            max_retries: Attempts when concurrent updates conflict
+        """
+        super().__init__(capacity, refill_per_second, clock)
+        self.store = store
+        self.max_retries = max_retries
+        self._ttl = self.capacity / self.refill_per_second
+
+    def acquire(self, key: str, cost: float = 1.0) -> RateLimitDecision:
+        for _ in range(self.max_retries):
+            raw = self.store.get(key)
+            state = None
+            if raw is not None:
+                tokens, updated = raw.split(":")
+                state = (float(tokens), float(updated))
+
+            (tokens, updated), decision = _take(
+                state, self.clock(), self.capacity, self.refill_per_second, cost
+            )
+            if self.store.compare_and_set(key, raw, f"{tokens!r}:{updated!r}", self._ttl):
+                return decision
+
+        # Persistent contention on one key means the client is hammering it
+        logger.warning(f"Rate limit update for '{key}' kept conflicting, denying request")
+        return RateLimitDecision(allowed=False, remaining=0.0, retry_after=1 / self.refill_per_second)
@@ -1,49 +1,206 @@
 """High-level speech generation service."""
 
+import asyncio
+import io
+import threading
+import time
 import uuid
-from dataclasses import dataclass
+from concurrent.futures import Future
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
+import soundfile as sf
 
 from src.core.tts_engine import TTSEngine
 from src.core.text_processor import TextProcessor
 from src.core.audio_processor import AudioProcessor
 from src.core.emotion_controller import EmotionController
+from src.core.encoders import create_stream_encoder, encode, get_encoder_stats
+from src.core.audio_index import AudioIndex
+from src.core.synthesis_cache import ContentCache, make_cache_key, quantize, shard_path
+from src.services.audio_reaper import AudioReaper
+from src.services.fair_queue import BATCH, DEFAULT_TENANT, INTERACTIVE
+from src.services.inference_executor import InferenceExecutor
+from src.services.job_store import (
+    JOB_COMPLETED,
+    JOB_FAILED,
+    JOB_PROCESSING,
+    Job,
+    JobStore,
+)
+from src.services.micro_batcher import MicroBatchScheduler
+from src.utils.exceptions import QueueFullException
+from src.utils.logging import get_logger
+from src.utils.metrics import AGGREGATE_MAX, AGGREGATE_MIN, MetricsRegistry, ratio_of
+from src.utils.timing import STAGE_BUCKETS, Timings, new_timings, stage_stats
 from config.settings import Settings
 
+logger = get_logger(__name__)
+
+# How a synthesis result is delivered: as a stored file with a download URL,
+# as encoded bytes held in memory, or inline only when the clip is small
+RESPONSE_URL = "url"
+RESPONSE_INLINE = "inline"
+RESPONSE_AUTO = "auto"
+
+# Size of a canonical WAV header, added to the PCM payload estimate
+_WAV_HEADER_BYTES = 44
+
+# Bucket upper bounds of the real-time factor histogram (processing time
+# divided by audio duration; below 1 is faster than real time)
+RTF_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0)
+
+# Warm-up states; the service is ready for traffic only in WARMUP_READY
+WARMUP_PENDING = "pending"
+WARMUP_RUNNING = "running"
+WARMUP_READY = "ready"
+WARMUP_FAILED = "failed"
+
 
 @dataclass
 class SynthesisResult:
-    """Result of speech synthesis."""
+    """Result of speech synthesis.
+    
+    Either ``audio_path`` and ``audio_url`` point at a stored file, or
+    ``audio_data`` holds the encoded audio for an inline response.
+    """
     
     job_id: str
-    audio_path: str
-    audio_url: str
+    audio_path: Optional[str]
+    audio_url: Optional[str]
     duration: float
     model_name: str
     expires_at: Optional[datetime] = None
+    cached: bool = False
+    timings: Dict[str, float] = field(default_factory=dict)
+    audio_data: Optional[bytes] = None
+
+
+@dataclass
+class BatchItem:
+    """One entry of a batch synthesis request."""
+    
+    text: str
+    emotion: str = "neutral"
+    intensity: float = 0.5
+    voice_id: str = "default_documentary"
+    output_format: str = "wav"
+    sample_rate: int = 24000
+    options: Optional[dict] = None
+    model: Optional[str] = None
+
+
+@dataclass
+class BatchItemResult:
+    """Outcome of one batch entry; exactly one of result and error is set."""
+    
+    index: int
+    result: Optional[SynthesisResult] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class BatchResult:
+    """Result of batch synthesis, in request order."""
+    
+    batch_id: str
+    items: List[BatchItemResult]
+    group_count: int
+    model_name: Optional[str]
+
+
+@dataclass
+class _PendingItem:
+    """A validated batch entry that still needs synthesis."""
+    
+    index: int
+    job_id: str
+    text: str
+    output_format: str
+    options: dict
+    cache_key: Optional[str]
+
+
+@dataclass
+class SynthesisStream:
+    """Incrementally rendered speech."""
+    
+    media_type: str
+    chunk_count: int
+    chunks: AsyncIterator[bytes]
 
 
 class SpeechService:
     """High-level service for speech generation."""
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, metrics: Optional[MetricsRegistry] = None):
         """Initialize speech service.
         
         Args:
             settings: Application settings
+            metrics: Registry to report metrics to (a private one if omitted)
         """
+        self._created_at = time.perf_counter()
         self.settings = settings
         self.tts_engine = TTSEngine(settings)
         self.text_processor = TextProcessor(max_length=settings.max_text_length)
         self.audio_processor = AudioProcessor(sample_rate=settings.default_sample_rate)
         self.emotion_controller = EmotionController()
+        self.executor = InferenceExecutor(
+            max_workers=settings.inference_workers,
+            max_queue_size=settings.inference_queue_size,
+            tenant_weights=settings.tenant_weights
+        )
+        self.job_executor = InferenceExecutor(
+            max_workers=settings.job_workers,
+            max_queue_size=settings.job_queue_size,
+            tenant_weights=settings.tenant_weights
+        )
+        self.batcher: Optional[MicroBatchScheduler] = None
+        if settings.microbatch_enabled:
+            self.batcher = MicroBatchScheduler(
+                self.tts_engine.synthesize_batch,
+                max_batch_size=settings.microbatch_max_size,
+                max_wait_ms=settings.microbatch_max_wait_ms
+            )
         
         # Ensure output directory exists
         Path(settings.audio_output_dir).mkdir(parents=True, exist_ok=True)
+        
+        self.audio_index = AudioIndex(settings.audio_output_dir)
+        self.reaper = AudioReaper(
+            self.audio_index,
+            ttl_seconds=settings.audio_ttl_hours * 3600,
+            max_bytes=settings.audio_max_bytes,
+            interval_seconds=settings.reaper_interval_seconds
+        )
+        self.output_cache = ContentCache(
+            directory=settings.audio_output_dir,
+            memory_budget_bytes=settings.cache_memory_bytes,
+            index=self.audio_index
+        )
+        self.chunk_cache = ContentCache(
+            directory=Path(settings.audio_output_dir) / "chunks",
+            memory_budget_bytes=settings.chunk_cache_memory_bytes,
+            index=self.audio_index
+        )
+        self.metrics = metrics or MetricsRegistry()
+        self._register_metrics(self.metrics)
+        
+        self._stopping = threading.Event()
+        self._warmup: Dict[str, Any] = {
+            "state": WARMUP_PENDING,
+            "model_load_ms": None,
+            "warmup_ms": None,
+            "startup_ms": None,
+            "syntheses": 0,
+            "errors": 0,
+            "emotions_ms": {},
+            "first_request_ms": None,
+        }
 
     async def synthesize(
         self,
@@ -53,10 +210,24 @@ class SpeechService:
         voice_id: str = "default_documentary",
         output_format: str = "wav",
         sample_rate: int = 24000,
-        options: Optional[dict] = None
+        options: Optional[dict] = None,
+        tenant: str = DEFAULT_TENANT,
+        response_mode: str = RESPONSE_URL,
+        model: Optional[str] = None
     ) -> SynthesisResult:
         """Synthesize emotional speech from text.
         
+        Requests whose normalized text and parameters were rendered before
+        are answered from the synthesis cache without touching the engine.
+        Otherwise the blocking pipeline runs in the interactive lane of the
+        inference executor so the event loop stays responsive while
+        synthesis is in progress.
+        
+        With ``RESPONSE_INLINE`` the encoded audio is returned in
+        ``audio_data`` and never written to disk (it is only kept in the
+        cache's memory tier); ``RESPONSE_AUTO`` does so for clips up to
+        ``inline_audio_max_bytes`` and stores larger ones.
+        
         Args:
             text: Input text to synthesize
             emotion: Emotion to apply
@@ -65,73 +236,1047 @@ class SpeechService:
             output_format: Output format (wav, mp3, ogg)
             sample_rate: Target sample rate
             options: Additional options (normalize_audio, remove_silence, speed)
+            tenant: Caller the work is accounted to for fair queuing
+            response_mode: RESPONSE_URL, RESPONSE_INLINE or RESPONSE_AUTO
+            model: Model to synthesize with (None for the default model)
             
         Returns:
-            Synthesis result with audio path and metadata
+            Synthesis result with audio path or data, and metadata
+            
+        Raises:
+            ValueError: If text, emotion or model is invalid
+            QueueFullException: If the inference queue is full
+            DeadlineExceededException: If the request waited too long for a worker
         """
         # Generate job ID
         job_id = str(uuid.uuid4())
+        start = time.perf_counter()
+        timings = new_timings(self.settings.timing_enabled)
         
-        # Parse options
-        options = options or {}
-        normalize_audio = options.get("normalize_audio", True)
-        remove_silence = options.get("remove_silence", False)
-        speed = options.get("speed", 1.0)
+        with timings.span("prepare"):
+            model = self.tts_engine.resolve_model(model)
+            normalized_text, intensity, options = self._prepare_request(
+                text, emotion, intensity, options
+            )
+            cache_key = self._output_cache_key(
+                normalized_text, emotion, intensity, voice_id, sample_rate, output_format,
+                options, model
+            )
+        
+        with timings.span("cache_lookup"):
+            cached = self._lookup_memory(job_id, cache_key, output_format, model, response_mode)
+            if cached is None:
+                # The disk tier, audio headers and index are file and SQLite I/O
+                cached = await asyncio.to_thread(
+                    self._lookup_cached, job_id, cache_key, output_format, model, response_mode
+                )
+        if cached is not None:
+            cached.timings = self._collect_timings(timings)
+            self._observe_request(start, emotion, cached.model_name, "hit")
+            return cached
+        
+        future = self.executor.schedule(
+            self._synthesize_sync,
+            kwargs={
+                "job_id": job_id,
+                "normalized_text": normalized_text,
+                "emotion": emotion,
+                "intensity": intensity,
+                "voice_id": voice_id,
+                "output_format": output_format,
+                "sample_rate": sample_rate,
+                "options": options,
+                "cache_key": cache_key,
+                "model": model,
+                "response_mode": response_mode,
+                "timings": timings,
+                "queued_at": time.perf_counter(),
+            },
+            lane=INTERACTIVE,
+            tenant=tenant,
+            cost=len(normalized_text),
+            timeout=self._queue_timeout(INTERACTIVE)
+        )
+        result = await asyncio.wrap_future(future)
+        self._observe_request(start, emotion, result.model_name, "miss")
+        return result
+
+    def submit_job(
+        self,
+        job_store: JobStore,
+        text: str,
+        emotion: str = "neutral",
+        intensity: float = 0.5,
+        voice_id: str = "default_documentary",
+        output_format: str = "wav",
+        sample_rate: int = 24000,
+        options: Optional[dict] = None,
+        tenant: str = DEFAULT_TENANT,
+        model: Optional[str] = None
+    ) -> Job:
+        """Start synthesis in the background and return immediately.
         
+        The job runs on the job worker pool, which is separate from the
+        pool serving synchronous requests, and records its progress in
+        ``job_store`` as chunks done out of the total. Jobs are queued in
+        the batch lane and shared fairly between tenants. Cached results
+        complete the job right away. The cache lookup reads files, so call
+        this from a worker thread rather than an event loop.
+        
+        Args:
+            job_store: Store receiving the job's state
+            text: Input text to synthesize
+            emotion: Emotion to apply
+            intensity: Emotion intensity (0.0-1.0)
+            voice_id: Voice identifier
+            output_format: Output format (wav, mp3, ogg)
+            sample_rate: Target sample rate
+            options: Additional options (normalize_audio, remove_silence, speed)
+            tenant: Caller the work is accounted to for fair queuing
+            model: Model to synthesize with (None for the default model)
+            
+        Returns:
+            Initial state of the job
+            
+        Raises:
+            ValueError: If text, emotion or model is invalid
+            QueueFullException: If the job queue is full
+        """
+        job_id = str(uuid.uuid4())
+        
+        model = self.tts_engine.resolve_model(model)
+        normalized_text, intensity, options = self._prepare_request(
+            text, emotion, intensity, options
+        )
+        chunks_total = len(self.text_processor.chunk_text(
+            normalized_text, max_chunk_size=self.settings.synthesis_chunk_size
+        ))
+        
+        cache_key = self._output_cache_key(
+            normalized_text, emotion, intensity, voice_id, sample_rate, output_format,
+            options, model
+        )
+        cached = self._lookup_cached(job_id, cache_key, output_format, model)
+        if cached is not None:
+            job = Job(
+                job_id=job_id,
+                chunks_total=chunks_total,
+                chunks_done=chunks_total,
+                **self._job_result_fields(cached)
+            )
+            job_store.create(job)
+            return job
+        
+        job = Job(job_id=job_id, chunks_total=chunks_total)
+        job_store.create(job)
         try:
-            # Step 1: Process text
-            normalized_text = self.text_processor.normalize(text)
-            
-            # Step 2: Validate emotion
-            if not self.emotion_controller.validate_emotion(emotion):
-                available = list(self.emotion_controller.list_emotions().keys())
-                raise ValueError(
-                    f"Invalid emotion '{emotion}'. Available: {', '.join(available)}"
+            self.job_executor.schedule(
+                self._run_job_sync,
+                args=(job_store,),
+                kwargs={
+                    "job_id": job_id,
+                    "normalized_text": normalized_text,
+                    "emotion": emotion,
+                    "intensity": intensity,
+                    "voice_id": voice_id,
+                    "output_format": output_format,
+                    "sample_rate": sample_rate,
+                    "options": options,
+                    "cache_key": cache_key,
+                    "model": model,
+                },
+                lane=BATCH,
+                tenant=tenant,
+                cost=len(normalized_text)
+            )
+        except QueueFullException as e:
+            job_store.update(job_id, status=JOB_FAILED, error=str(e))
+            raise
+        return job
+
+    def _run_job_sync(self, job_store: JobStore, job_id: str, **kwargs: Any) -> None:
+        """Run a background job and record its outcome (see ``submit_job``)."""
+        job_store.update(job_id, status=JOB_PROCESSING)
+        
+        def on_progress(done: int, total: int) -> None:
+            job_store.update(job_id, chunks_done=done, chunks_total=total)
+        
+        try:
+            result = self._synthesize_sync(job_id=job_id, on_progress=on_progress, **kwargs)
+        except Exception as e:
+            logger.error(f"Job {job_id} failed: {e}", exc_info=True)
+            job_store.update(job_id, status=JOB_FAILED, error=str(e))
+            return
+        
+        job_store.update(job_id, **self._job_result_fields(result))
+
+    def _job_result_fields(self, result: SynthesisResult) -> Dict[str, Any]:
+        """Job fields describing a finished synthesis result."""
+        return {
+            "status": JOB_COMPLETED,
+            "audio_url": result.audio_url,
+            "duration": result.duration,
+            "model_name": result.model_name,
+            "cached": result.cached,
+            "expires_at": result.expires_at,
+            "timings": result.timings,
+        }
+
+    async def synthesize_batch(
+        self,
+        items: List[BatchItem],
+        tenant: str = DEFAULT_TENANT
+    ) -> BatchResult:
+        """Synthesize many texts, sharing model invocations between them.
+        
+        Items are validated and checked against the synthesis cache one by
+        one. The remaining items are grouped by (emotion, intensity, voice,
+        sample rate, model) and each group is rendered in the batch lane of the
+        inference executor with one batched engine call covering the
+        uncached chunks of all its texts. A failing item does not fail the
+        rest of the batch.
+        
+        Args:
+            items: Batch entries
+            tenant: Caller the work is accounted to for fair queuing
+            
+        Returns:
+            Per-item results in request order
+            
+        Raises:
+            QueueFullException: If the inference queue is full when the
+                batch starts
+            DeadlineExceededException: If the first group waited too long
+                for a worker
+        """
+        batch_id = str(uuid.uuid4())
+        results: Dict[int, BatchItemResult] = {}
+        groups: Dict[Tuple[str, float, str, int, str], List[_PendingItem]] = {}
+        
+        prepared = []
+        for index, item in enumerate(items):
+            try:
+                model = self.tts_engine.resolve_model(item.model)
+                normalized_text, intensity, options = self._prepare_request(
+                    item.text, item.emotion, item.intensity, item.options
                 )
+            except ValueError as e:
+                results[index] = BatchItemResult(index=index, error=str(e))
+                continue
             
-            # Step 3: Synthesize speech
-            audio = self.tts_engine.synthesize(
-                text=normalized_text,
-                emotion=emotion,
-                intensity=intensity
+            job_id = str(uuid.uuid4())
+            cache_key = self._output_cache_key(
+                normalized_text, item.emotion, intensity, item.voice_id,
+                item.sample_rate, item.output_format, options, model
             )
+            prepared.append((index, item, model, normalized_text, intensity, options, job_id, cache_key))
+        
+        # Cache lookups read files and the index, so they run off the event loop
+        cached_results = await asyncio.to_thread(lambda: [
+            self._lookup_cached(job_id, cache_key, item.output_format, model)
+            for _, item, model, _, _, _, job_id, cache_key in prepared
+        ])
+        
+        for entry, cached in zip(prepared, cached_results):
+            index, item, model, normalized_text, intensity, options, job_id, cache_key = entry
+            if cached is not None:
+                results[index] = BatchItemResult(index=index, result=cached)
+                continue
+            
+            group_key = (item.emotion, intensity, item.voice_id, item.sample_rate, model)
+            groups.setdefault(group_key, []).append(_PendingItem(
+                index=index,
+                job_id=job_id,
+                text=normalized_text,
+                output_format=item.output_format,
+                options=options,
+                cache_key=cache_key
+            ))
+        
+        # Reject up front if the executor is saturated; once the batch has
+        # started, later groups wait for queue space instead
+        futures = []
+        for group_key, pending in groups.items():
+            args = (group_key, pending)
+            cost = sum(len(p.text) for p in pending)
+            if not futures:
+                futures.append(self.executor.schedule(
+                    self._synthesize_group_sync,
+                    args=args,
+                    lane=BATCH,
+                    tenant=tenant,
+                    cost=cost,
+                    timeout=self._queue_timeout(BATCH)
+                ))
+            else:
+                futures.append(await self._submit_when_ready(
+                    self._synthesize_group_sync, args, lane=BATCH, tenant=tenant, cost=cost
+                ))
+        
+        for group_results in await asyncio.gather(*(asyncio.wrap_future(f) for f in futures)):
+            for item_result in group_results:
+                results[item_result.index] = item_result
+        
+        # Only named when every valid item used the same model
+        models = {entry[2] for entry in prepared}
+        return BatchResult(
+            batch_id=batch_id,
+            items=[results[index] for index in range(len(items))],
+            group_count=len(groups),
+            model_name=models.pop() if len(models) == 1 else None
+        )
+
+    def synthesize_stream(
+        self,
+        text: str,
+        emotion: str = "neutral",
+        intensity: float = 0.5,
+        voice_id: str = "default_documentary",
+        output_format: str = "wav",
+        sample_rate: int = 24000,
+        options: Optional[dict] = None,
+        tenant: str = DEFAULT_TENANT,
+        model: Optional[str] = None
+    ) -> SynthesisStream:
+        """Synthesize speech as a stream of encoded chunks.
+        
+        Input is validated and the first chunk is queued before this method
+        returns, so invalid requests and a full inference queue are reported
+        before any audio is sent. Chunks are rendered one at a time, each
+        only after the previous one has been consumed, which keeps memory use
+        independent of the text length.
+        
+        Args:
+            text: Input text to synthesize
+            emotion: Emotion to apply
+            intensity: Emotion intensity (0.0-1.0)
+            voice_id: Voice identifier
+            output_format: Stream format (wav, pcm, ogg, mp3)
+            sample_rate: Target sample rate
+            options: Additional options (normalize_audio, remove_silence, speed)
+            tenant: Caller the work is accounted to for fair queuing
+            model: Model to synthesize with (None for the default model)
+            
+        Returns:
+            Stream with media type, chunk count and the byte iterator
             
-            # Step 4: Post-process audio
+        Raises:
+            ValueError: If text, emotion, format or model is invalid
+            QueueFullException: If the inference queue is full
+            DeadlineExceededException: If the first chunk waited too long
+                for a worker (raised while iterating)
+        """
+        model = self.tts_engine.resolve_model(model)
+        normalized_text, intensity, options = self._prepare_request(
+            text, emotion, intensity, options
+        )
+        chunks = self.text_processor.chunk_text(
+            normalized_text, max_chunk_size=self.settings.synthesis_chunk_size
+        )
+        encoder = create_stream_encoder(output_format, sample_rate)
+        
+        model_sample_rate = self.tts_engine.get_sample_rate(model)
+        prosody = self._prosody(emotion, intensity, options, model)
+        
+        def render(chunk: str) -> bytes:
+            audio = self._render_chunk(chunk, emotion, intensity, voice_id, model)
+            audio = self.audio_processor.resample(audio, model_sample_rate, sample_rate)
             audio = self.audio_processor.process_pipeline(
                 audio=audio,
-                normalize=normalize_audio,
-                remove_silence=remove_silence,
-                speed=speed
+                normalize=options["normalize_audio"],
+                remove_silence=options["remove_silence"],
+                sample_rate=sample_rate,
+                **prosody
             )
+            return encoder.write(audio)
+        
+        first = self.executor.schedule(
+            render,
+            args=(chunks[0],),
+            lane=INTERACTIVE,
+            tenant=tenant,
+            cost=len(chunks[0]),
+            timeout=self._queue_timeout(INTERACTIVE)
+        )
+        
+        async def iterate() -> AsyncIterator[bytes]:
+            pending = first
+            for index in range(len(chunks)):
+                data = await asyncio.wrap_future(pending)
+                if data:
+                    yield data
+                if index + 1 < len(chunks):
+                    chunk = chunks[index + 1]
+                    pending = await self._submit_when_ready(
+                        render, (chunk,), lane=INTERACTIVE, tenant=tenant, cost=len(chunk)
+                    )
+            tail = await self.executor.run(encoder.close)
+            if tail:
+                yield tail
+        
+        return SynthesisStream(
+            media_type=encoder.media_type,
+            chunk_count=len(chunks),
+            chunks=iterate()
+        )
+
+    async def _submit_when_ready(
+        self,
+        fn: Callable[..., Any],
+        args: tuple,
+        lane: str,
+        tenant: str,
+        cost: float
+    ) -> Future:
+        """Queue work, waiting for space instead of failing when the queue is full.
+        
+        Used for follow-up chunks of a stream that has already started, where
+        rejecting the request is no longer possible. Follow-up work has no
+        deadline, so a started response is never cut off by the scheduler.
+        """
+        while True:
+            try:
+                return self.executor.schedule(fn, args=args, lane=lane, tenant=tenant, cost=cost)
+            except QueueFullException:
+                await asyncio.sleep(0.05)
+
+    def _queue_timeout(self, lane: str) -> Optional[float]:
+        """Seconds new work in a lane may wait for a worker (None for no deadline)."""
+        deadline_ms = {
+            INTERACTIVE: self.settings.interactive_deadline_ms,
+            BATCH: self.settings.batch_deadline_ms,
+        }[lane]
+        return deadline_ms / 1000 if deadline_ms > 0 else None
+
+    def _synthesize_sync(
+        self,
+        job_id: str,
+        normalized_text: str,
+        emotion: str,
+        intensity: float,
+        voice_id: str,
+        output_format: str,
+        sample_rate: int,
+        options: dict,
+        cache_key: Optional[str],
+        model: Optional[str] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        response_mode: str = RESPONSE_URL,
+        timings: Optional[Timings] = None,
+        queued_at: Optional[float] = None
+    ) -> SynthesisResult:
+        """Run the blocking synthesis pipeline (see ``synthesize``)."""
+        if timings is None:
+            timings = new_timings(self.settings.timing_enabled)
+        if queued_at is not None:
+            timings.record("queue", (time.perf_counter() - queued_at) * 1000)
+        
+        try:
+            # Step 1: Synthesize speech
+            start = time.perf_counter()
+            with timings.activate(), timings.span("inference"):
+                audio = self._render_chunks(
+                    text=normalized_text,
+                    emotion=emotion,
+                    intensity=intensity,
+                    voice_id=voice_id,
+                    model=model,
+                    on_progress=on_progress
+                )
             
-            # Step 5: Save audio
-            output_filename = f"{job_id}.{output_format}"
-            output_path = Path(self.settings.audio_output_dir) / output_filename
-            
-            self.audio_processor.save_audio(
+            return self._finish_sync(
+                job_id=job_id,
                 audio=audio,
-                output_path=output_path,
-                sample_rate=sample_rate
+                emotion=emotion,
+                intensity=intensity,
+                output_format=output_format,
+                sample_rate=sample_rate,
+                options=options,
+                cache_key=cache_key,
+                timings=timings,
+                model=model,
+                response_mode=response_mode,
+                render_seconds=time.perf_counter() - start
+            )
+            
+        except Exception as e:
+            raise RuntimeError(f"Speech synthesis failed: {str(e)}") from e
+
+    def _synthesize_group_sync(
+        self,
+        group_key: Tuple[str, float, str, int, str],
+        pending: List[_PendingItem]
+    ) -> List[BatchItemResult]:
+        """Render one batch group (see ``synthesize_batch``)."""
+        emotion, intensity, voice_id, sample_rate, model = group_key
+        
+        start = time.perf_counter()
+        try:
+            audios = self._render_batch(
+                [item.text for item in pending], emotion, intensity, voice_id, model
+            )
+        except Exception as e:
+            logger.error(f"Batch group synthesis failed: {e}", exc_info=True)
+            return [
+                BatchItemResult(index=item.index, error=f"Speech synthesis failed: {str(e)}")
+                for item in pending
+            ]
+        inference_ms = (time.perf_counter() - start) * 1000
+        share_seconds = inference_ms / 1000 / len(pending)
+        
+        results = []
+        for item, audio in zip(pending, audios):
+            timings = new_timings(self.settings.timing_enabled)
+            timings.record("inference", inference_ms)
+            try:
+                result = self._finish_sync(
+                    job_id=item.job_id,
+                    audio=audio,
+                    emotion=emotion,
+                    intensity=intensity,
+                    output_format=item.output_format,
+                    sample_rate=sample_rate,
+                    options=item.options,
+                    cache_key=item.cache_key,
+                    timings=timings,
+                    model=model,
+                    render_seconds=share_seconds
+                )
+                results.append(BatchItemResult(index=item.index, result=result))
+            except Exception as e:
+                logger.error(f"Batch item {item.index} failed: {e}", exc_info=True)
+                results.append(
+                    BatchItemResult(index=item.index, error=f"Speech synthesis failed: {str(e)}")
+                )
+        return results
+
+    def _finish_sync(
+        self,
+        job_id: str,
+        audio: np.ndarray,
+        emotion: str,
+        intensity: float,
+        output_format: str,
+        sample_rate: int,
+        options: dict,
+        cache_key: Optional[str],
+        timings: Timings,
+        model: Optional[str] = None,
+        response_mode: str = RESPONSE_URL,
+        render_seconds: float = 0.0
+    ) -> SynthesisResult:
+        """Resample, post-process and save (or encode in memory) raw model audio.
+        
+        ``render_seconds`` is the model time already spent on this audio,
+        counted with the finishing work towards its real-time factor.
+        """
+        start = time.perf_counter()
+        with timings.activate():
+            # Step 2: Resample from the model's native rate
+            with timings.span("resample"):
+                audio = self.audio_processor.resample(
+                    audio, self.tts_engine.get_sample_rate(model), sample_rate
+                )
+            
+            # Step 3: Post-process audio
+            with timings.span("postprocess"):
+                audio = self.audio_processor.process_pipeline(
+                    audio=audio,
+                    normalize=options["normalize_audio"],
+                    remove_silence=options["remove_silence"],
+                    sample_rate=sample_rate,
+                    **self._prosody(emotion, intensity, options, model)
+                )
+        
+        duration = len(audio) / sample_rate
+        if self._deliver_inline(response_mode, len(audio)):
+            # Step 4: Encode in memory for an inline response
+            with timings.span("encode"):
+                buffer = io.BytesIO()
+                encode(audio, output_format, sample_rate, buffer)
+                data = buffer.getvalue()
+                if cache_key is not None:
+                    self.output_cache.remember(cache_key, output_format, data)
+            
+            result = self._build_inline_result(
+                job_id=job_id, data=data, duration=duration, model=model
+            )
+            result.timings = self._collect_timings(timings)
+            self._observe_output(
+                emotion, result.model_name, duration, render_seconds + time.perf_counter() - start
             )
+            return result
+        
+        # Step 4: Save audio
+        with timings.span("save"):
+            if cache_key is not None:
+                output_path = self.output_cache.store_file(
+                    cache_key,
+                    output_format,
+                    lambda f: encode(audio, output_format, sample_rate, f)
+                )
+            else:
+                output_path = shard_path(self.settings.audio_output_dir, f"{job_id}.{output_format}")
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                self.audio_processor.save_audio(
+                    audio=audio,
+                    output_path=output_path,
+                    sample_rate=sample_rate,
+                    output_format=output_format
+                )
+                self.audio_index.record(output_path, output_path.stat().st_size)
+        
+        result = self._build_result(
+            job_id=job_id,
+            output_path=output_path,
+            duration=duration,
+            model=model
+        )
+        result.timings = self._collect_timings(timings)
+        self._observe_output(
+            emotion, result.model_name, duration, render_seconds + time.perf_counter() - start
+        )
+        return result
+    
+    def _observe_request(self, start: float, emotion: str, model: str, cache: str) -> None:
+        """Report the latency of a finished synthesis request."""
+        seconds = time.perf_counter() - start
+        self._synthesis_seconds.observe(seconds, (emotion, model, cache))
+        if self._warmup["first_request_ms"] is None:
+            self._warmup["first_request_ms"] = round(seconds * 1000, 3)
+    
+    def _observe_output(self, emotion: str, model: str, duration: float, seconds: float) -> None:
+        """Report rendered audio and its real-time factor."""
+        labels = (emotion, model)
+        self._audio_seconds.inc(labels, duration)
+        if duration > 0:
+            self._synthesis_rtf.observe(seconds / duration, labels)
+    
+    def _collect_timings(self, timings: Timings) -> Dict[str, float]:
+        """Finish a request's timings: add them to the stage histogram and return them."""
+        durations = timings.as_dict()
+        for stage, ms in durations.items():
+            self._stage_seconds.observe(ms / 1000, (stage,))
+        return durations
+    
+    def _deliver_inline(self, response_mode: str, samples: int) -> bool:
+        """Whether a freshly rendered clip is returned inline.
+        
+        In auto mode the clip's size as 16-bit PCM WAV is the estimate; the
+        compressed formats are never larger.
+        """
+        if response_mode == RESPONSE_INLINE:
+            return True
+        if response_mode == RESPONSE_AUTO:
+            return samples * 2 + _WAV_HEADER_BYTES <= self.settings.inline_audio_max_bytes
+        return False
+
+    def _render_chunks(
+        self,
+        text: str,
+        emotion: str,
+        intensity: float,
+        voice_id: str,
+        model: Optional[str] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> np.ndarray:
+        """Synthesize text sentence-chunk by chunk and stitch the results.
+        
+        Each chunk's raw model output is cached under its own content hash,
+        so re-rendering an edited script only synthesizes the chunks that
+        changed.
+        
+        Args:
+            text: Normalized input text
+            emotion: Emotion to apply
+            intensity: Emotion intensity (0.0-1.0)
+            voice_id: Voice identifier
+            model: Model to synthesize with (None for the default model)
+            on_progress: Optional callback receiving (chunks done, chunks
+                total); chunks are then rendered ``job_progress_chunks``
+                at a time so progress can be reported in between
             
-            # Step 6: Calculate metadata
-            duration = len(audio) / sample_rate
-            expires_at = datetime.now() + timedelta(hours=self.settings.audio_ttl_hours)
+        Returns:
+            Raw audio at the model's sample rate
+        """
+        if on_progress is None:
+            return self._render_batch([text], emotion, intensity, voice_id, model)[0]
+        
+        chunks = self.text_processor.chunk_text(
+            text, max_chunk_size=self.settings.synthesis_chunk_size
+        )
+        step = self.settings.job_progress_chunks
+        segments: List[np.ndarray] = []
+        on_progress(0, len(chunks))
+        for start in range(0, len(chunks), step):
+            segments.extend(self._render_chunk_batch(
+                chunks[start:start + step], emotion, intensity, voice_id, model
+            ))
+            on_progress(len(segments), len(chunks))
+        
+        if len(segments) == 1:
+            return segments[0]
+        return np.concatenate(segments)
+
+    def _render_batch(
+        self,
+        texts: List[str],
+        emotion: str,
+        intensity: float,
+        voice_id: str,
+        model: Optional[str] = None
+    ) -> List[np.ndarray]:
+        """Chunk several texts and render all their chunks together.
+        
+        Args:
+            texts: Normalized input texts
+            emotion: Emotion to apply
+            intensity: Emotion intensity (0.0-1.0)
+            voice_id: Voice identifier
+            model: Model to synthesize with (None for the default model)
+            
+        Returns:
+            Raw audio for each text at the model's sample rate
+        """
+        chunked = [
+            self.text_processor.chunk_text(text, max_chunk_size=self.settings.synthesis_chunk_size)
+            for text in texts
+        ]
+        rendered = self._render_chunk_batch(
+            [chunk for chunks in chunked for chunk in chunks], emotion, intensity, voice_id, model
+        )
+        
+        audios = []
+        position = 0
+        for chunks in chunked:
+            segments = rendered[position:position + len(chunks)]
+            position += len(chunks)
+            audios.append(segments[0] if len(segments) == 1 else np.concatenate(segments))
+        return audios
+
+    def _render_chunk(
+        self,
+        chunk: str,
+        emotion: str,
+        intensity: float,
+        voice_id: str,
+        model: Optional[str] = None
+    ) -> np.ndarray:
+        """Synthesize a single chunk, reusing cached PCM when available.
+        
+        Args:
+            chunk: Chunk text
+            emotion: Emotion to apply
+            intensity: Emotion intensity (0.0-1.0)
+            voice_id: Voice identifier
+            model: Model to synthesize with (None for the default model)
             
-            # Generate URL (for production, use CDN)
-            audio_url = f"/audio/{output_filename}"
+        Returns:
+            Raw audio at the model's sample rate
+        """
+        return self._render_chunk_batch([chunk], emotion, intensity, voice_id, model)[0]
+
+    def _render_chunk_batch(
+        self,
+        chunks: List[str],
+        emotion: str,
+        intensity: float,
+        voice_id: str,
+        model: Optional[str] = None
+    ) -> List[np.ndarray]:
+        """Synthesize chunks with one engine call for those not cached.
+        
+        Repeated chunks are synthesized once.
+        
+        Args:
+            chunks: Chunk texts
+            emotion: Emotion to apply
+            intensity: Emotion intensity (0.0-1.0)
+            voice_id: Voice identifier
+            model: Model to synthesize with (None for the default model)
             
-            return SynthesisResult(
-                job_id=job_id,
-                audio_path=str(output_path),
-                audio_url=audio_url,
-                duration=duration,
-                model_name=self.tts_engine.model.model_name if self.tts_engine.model else "unknown",
-                expires_at=expires_at
+        Returns:
+            Raw audio for each chunk at the model's sample rate
+        """
+        audio_by_chunk: Dict[str, np.ndarray] = {}
+        keys: Dict[str, str] = {}
+        missing = []
+        
+        for chunk in dict.fromkeys(chunks):
+            if self.settings.cache_enabled:
+                keys[chunk] = make_cache_key(
+                    text=chunk,
+                    emotion=emotion,
+                    intensity=intensity,
+                    voice_id=voice_id,
+                    model=self._model_name(model)
+                )
+                data = self.chunk_cache.load(keys[chunk], "f32")
+                if data is not None:
+                    audio_by_chunk[chunk] = np.frombuffer(data, dtype=np.float32)
+                    continue
+            missing.append(chunk)
+        
+        if missing:
+            if self.batcher:
+                # Through the micro-batcher, chunks from concurrent requests
+                # share model invocations. The model is loaded here first: a
+                # cold load on the single dispatcher thread would hold up
+                # requests for every other model
+                with self.tts_engine.keep_loaded(model):
+                    rendered = self.batcher.synthesize_batch(
+                        texts=missing, emotion=emotion, intensity=intensity, model=model
+                    )
+            else:
+                rendered = self.tts_engine.synthesize_batch(
+                    texts=missing, emotion=emotion, intensity=intensity, model=model
+                )
+            for chunk, audio in zip(missing, rendered):
+                audio = np.asarray(audio, dtype=np.float32)
+                if self.settings.cache_enabled:
+                    self.chunk_cache.store(keys[chunk], "f32", audio.tobytes())
+                audio_by_chunk[chunk] = audio
+        
+        return [audio_by_chunk[chunk] for chunk in chunks]
+
+    def _output_cache_key(
+        self,
+        normalized_text: str,
+        emotion: str,
+        intensity: float,
+        voice_id: str,
+        sample_rate: int,
+        output_format: str,
+        options: dict,
+        model: Optional[str] = None
+    ) -> Optional[str]:
+        """Build the synthesis cache key, or None when caching is disabled."""
+        if not self.settings.cache_enabled:
+            return None
+        return make_cache_key(
+            text=normalized_text,
+            emotion=emotion,
+            intensity=intensity,
+            voice_id=voice_id,
+            sample_rate=sample_rate,
+            output_format=output_format,
+            options=options,
+            model=self._model_name(model)
+        )
+
+    def _lookup_memory(
+        self,
+        job_id: str,
+        cache_key: Optional[str],
+        output_format: str,
+        model: Optional[str] = None,
+        response_mode: str = RESPONSE_URL
+    ) -> Optional[SynthesisResult]:
+        """Answer an inline request from the cache's memory tier, if possible.
+        
+        Does no file or index I/O, so it runs on the event loop; the use is
+        recorded in the index from a thread. Returns None when the disk
+        tier has to be consulted (see ``_lookup_cached``).
+        """
+        if cache_key is None or response_mode == RESPONSE_URL:
+            return None
+        max_bytes = None if response_mode == RESPONSE_INLINE else self.settings.inline_audio_max_bytes
+        data = self.output_cache.peek(cache_key, output_format, max_bytes=max_bytes)
+        if data is None:
+            return None
+        asyncio.get_running_loop().run_in_executor(
+            None, self.output_cache.touch, cache_key, output_format
+        )
+        return self._build_inline_result(
+            job_id=job_id,
+            data=data,
+            duration=sf.info(io.BytesIO(data)).duration,
+            model=model,
+            cached=True
+        )
+
+    def _lookup_cached(
+        self,
+        job_id: str,
+        cache_key: Optional[str],
+        output_format: str,
+        model: Optional[str] = None,
+        response_mode: str = RESPONSE_URL
+    ) -> Optional[SynthesisResult]:
+        """Return a result for an already rendered request, if cached.
+        
+        Inline modes read the cached bytes (from memory when possible)
+        instead of materializing a file; in auto mode entries larger than
+        ``inline_audio_max_bytes`` are served as a file after all. Reads
+        files and writes the index, so async callers run it in a thread.
+        """
+        if cache_key is None:
+            return None
+        if response_mode != RESPONSE_URL:
+            data = self.output_cache.load(cache_key, output_format)
+            if data is None:
+                return None
+            if response_mode == RESPONSE_INLINE or len(data) <= self.settings.inline_audio_max_bytes:
+                return self._build_inline_result(
+                    job_id=job_id,
+                    data=data,
+                    duration=sf.info(io.BytesIO(data)).duration,
+                    model=model,
+                    cached=True
+                )
+        cached_path = self.output_cache.lookup(cache_key, output_format)
+        if cached_path is None:
+            return None
+        return self._build_result(
+            job_id=job_id,
+            output_path=cached_path,
+            duration=sf.info(str(cached_path)).duration,
+            model=model,
+            cached=True
+        )
+
+    def _prepare_request(
+        self,
+        text: str,
+        emotion: str,
+        intensity: float,
+        options: Optional[dict]
+    ) -> Tuple[str, float, dict]:
+        """Validate and normalize request parameters.
+        
+        Args:
+            text: Input text
+            emotion: Emotion to apply
+            intensity: Requested emotion intensity
+            options: Options provided by the caller
+            
+        Returns:
+            Tuple of (normalized text, quantized intensity, resolved options)
+            
+        Raises:
+            ValueError: If text or emotion is invalid
+        """
+        # Parse options
+        options = self._resolve_options(options)
+        intensity = quantize(intensity, self.settings.cache_intensity_step)
+        
+        # Process text
+        normalized_text = self.text_processor.normalize(text)
+        
+        # Validate emotion
+        if not self.emotion_controller.validate_emotion(emotion):
+            available = list(self.emotion_controller.list_emotions().keys())
+            raise ValueError(
+                f"Invalid emotion '{emotion}'. Available: {', '.join(available)}"
             )
+        
+        return normalized_text, intensity, options
+
+    def _resolve_options(self, options: Optional[dict]) -> dict:
+        """Fill in defaults for synthesis options.
+        
+        Args:
+            options: Options provided by the caller
             
-        except Exception as e:
-            raise RuntimeError(f"Speech synthesis failed: {str(e)}") from e
+        Returns:
+            Complete options dictionary
+        """
+        options = options or {}
+        return {
+            "normalize_audio": options.get("normalize_audio", True),
+            "remove_silence": options.get("remove_silence", False),
+            "speed": options.get("speed", 1.0),
+        }
+
+    def _prosody(
+        self,
+        emotion: str,
+        intensity: float,
+        options: dict,
+        model: Optional[str] = None
+    ) -> Dict[str, float]:
+        """Resolve speed, pitch and energy for the post-processing pipeline.
+        
+        Backends with native emotion control already render the emotion's
+        prosody, so only the requested speed applies to them. For the others
+        the emotion's scales (interpolated by intensity) are applied as DSP.
+        """
+        prosody = {"speed": options["speed"], "pitch_scale": 1.0, "energy_scale": 1.0}
+        if not self.tts_engine.supports_native_emotion(model):
+            params = self.emotion_controller.apply_emotion_parameters(emotion, intensity)
+            prosody["speed"] *= params.get("tempo_scale", 1.0)
+            prosody["pitch_scale"] = params.get("pitch_scale", 1.0)
+            prosody["energy_scale"] = params.get("energy_scale", 1.0)
+        return prosody
+
+    def _build_result(
+        self,
+        job_id: str,
+        output_path: Path,
+        duration: float,
+        model: Optional[str] = None,
+        cached: bool = False
+    ) -> SynthesisResult:
+        """Assemble a synthesis result for an audio file.
+        
+        Args:
+            job_id: Job identifier
+            output_path: Path of the audio file
+            duration: Audio duration in seconds
+            model: Model that rendered the audio (None for the default model)
+            cached: Whether the audio was served from the cache
+            
+        Returns:
+            Synthesis result
+        """
+        expires_at = datetime.now() + timedelta(hours=self.settings.audio_ttl_hours)
+        
+        # Generate URL (for production, use CDN)
+        audio_url = f"/audio/{output_path.name}"
+        
+        return SynthesisResult(
+            job_id=job_id,
+            audio_path=str(output_path),
+            audio_url=audio_url,
+            duration=duration,
+            model_name=self._model_name(model),
+            expires_at=expires_at,
+            cached=cached
+        )
+
+    def _build_inline_result(
+        self,
+        job_id: str,
+        data: bytes,
+        duration: float,
+        model: Optional[str] = None,
+        cached: bool = False
+    ) -> SynthesisResult:
+        """Assemble a synthesis result carrying encoded audio.
+        
+        Args:
+            job_id: Job identifier
+            data: Encoded audio
+            duration: Audio duration in seconds
+            model: Model that rendered the audio (None for the default model)
+            cached: Whether the audio was served from the cache
+            
+        Returns:
+            Synthesis result without a file or URL
+        """
+        return SynthesisResult(
+            job_id=job_id,
+            audio_path=None,
+            audio_url=None,
+            duration=duration,
+            model_name=self._model_name(model),
+            cached=cached,
+            audio_data=data
+        )
+
+    def _model_name(self, model: Optional[str] = None) -> str:
+        """Get the name a model reports (the default model if None)."""
+        return self.tts_engine.get_model(model).model_name
 
     def list_emotions(self) -> dict:
         """Get available emotions with metadata.
@@ -151,19 +1296,240 @@ class SpeechService:
             for emotion_id, config in emotions.items()
         }
 
+    def get_stats(self) -> dict:
+        """Get runtime statistics for the synthesis pipeline.
+        
+        Returns:
+            Statistics dictionary keyed by component
+        """
+        stats = {
+            "inference": self.executor.get_stats(),
+            "jobs": self.job_executor.get_stats(),
+            "storage": self.reaper.get_stats(),
+            "cache": self.output_cache.get_stats(),
+            "chunk_cache": self.chunk_cache.get_stats(),
+            "encoders": get_encoder_stats(),
+            "stages": stage_stats(self._stage_seconds),
+            "warmup": self.get_warmup_status(),
+            "models": self.tts_engine.get_pool_stats()
+        }
+        if self.batcher:
+            stats["batching"] = self.batcher.get_stats()
+        return stats
+
+    def _register_metrics(self, registry: MetricsRegistry) -> None:
+        """Define the service's metrics and sample its state when they are read.
+
+        Requests update their histograms and counters as they finish; queue
+        depth, cache counters, disk usage and model state are already kept
+        by the components and are only read when metrics are collected.
+        Collection reads plain counters only (no percentiles, no database
+        queries), so a scrape stays cheap however much audio is stored.
+        """
+        self._synthesis_seconds = registry.histogram(
+            "tts_synthesis_duration_seconds",
+            "Time to answer a synthesis request, including queueing",
+            ("emotion", "model", "cache")
+        )
+        self._synthesis_rtf = registry.histogram(
+            "tts_synthesis_real_time_factor",
+            "Processing time divided by the duration of the audio produced",
+            ("emotion", "model"),
+            buckets=RTF_BUCKETS
+        )
+        self._stage_seconds = registry.histogram(
+            "tts_stage_duration_seconds",
+            "Time spent in each stage of a synthesis request",
+            ("stage",),
+            buckets=STAGE_BUCKETS
+        )
+        self._audio_seconds = registry.counter(
+            "tts_audio_seconds_total", "Seconds of audio synthesized", ("emotion", "model")
+        )
+        tasks = registry.counter(
+            "tts_executor_tasks_total", "Synthesis tasks by outcome", ("pool", "outcome")
+        )
+        busy = registry.gauge("tts_workers_busy", "Workers currently synthesizing", ("pool",))
+        queue_depth = registry.gauge(
+            "tts_queue_depth", "Requests waiting for a worker or a model call", ("pool", "lane")
+        )
+        lookups = registry.counter(
+            "tts_cache_lookups_total", "Synthesis cache lookups by result", ("cache", "result")
+        )
+        registry.gauge(
+            "tts_cache_hit_ratio",
+            "Share of synthesis cache lookups answered from memory or disk",
+            ("cache",),
+            derive=ratio_of(
+                "tts_cache_lookups_total",
+                "tts_cache_lookups_total",
+                numerator_filter=lambda labels: labels[1] != "miss",
+                group_by=lambda labels: labels[:1]
+            )
+        )
+        storage_bytes = registry.gauge(
+            "tts_audio_storage_bytes", "Size of the stored audio files", aggregate=AGGREGATE_MAX
+        )
+        storage_files = registry.gauge(
+            "tts_audio_storage_files", "Number of stored audio files", aggregate=AGGREGATE_MAX
+        )
+        storage_limit = registry.gauge(
+            "tts_audio_storage_limit_bytes",
+            "Disk quota of the audio directory (0 = unlimited)",
+            aggregate=AGGREGATE_MAX
+        )
+        model_loaded = registry.gauge(
+            "tts_model_loaded",
+            "Whether the model is resident (in every worker)",
+            ("model",),
+            aggregate=AGGREGATE_MIN
+        )
+
+        def collect() -> None:
+            for pool, executor in (("inference", self.executor), ("jobs", self.job_executor)):
+                counters = executor.get_counters()
+                busy.set(counters["active"], (pool,))
+                for outcome in ("completed", "failed", "rejected", "expired"):
+                    tasks.set(counters[outcome], (pool, outcome))
+                for lane, depth in counters["lanes"].items():
+                    queue_depth.set(depth, (pool, lane))
+            if self.batcher:
+                queue_depth.set(self.batcher.queue_depth, ("microbatch", "model"))
+
+            for name, cache in (("output", self.output_cache), ("chunk", self.chunk_cache)):
+                stats = cache.get_stats()
+                lookups.set(stats["memory_hits"], (name, "memory_hit"))
+                lookups.set(stats["disk_hits"], (name, "disk_hit"))
+                lookups.set(stats["misses"], (name, "miss"))
+
+            files, size = self.audio_index.totals()
+            storage_bytes.set(size)
+            storage_files.set(files)
+            storage_limit.set(self.reaper.max_bytes)
+            for name in self.tts_engine.available_models:
+                model_loaded.set(float(self.tts_engine.get_model(name).is_loaded), (name,))
+
+        registry.add_collector(collect)
+
+    def warm_up(self) -> Dict[str, Any]:
+        """Load the model and exercise the pipeline before taking traffic.
+        
+        The first synthesis otherwise pays for lazy initialization in the
+        model, allocator growth and building resampling filters. With
+        ``warmup_enabled`` the warm-up text is synthesized once for every
+        configured emotion, resampled to every supported rate
+        (which also builds the emotion's pitch-shift filters) and encoded
+        in every format. The results bypass the caches and the request
+        metrics. ``is_ready`` turns true when this finishes.
+        
+        Returns:
+            Warm-up status (see ``get_warmup_status``)
+        """
+        self._warmup["state"] = WARMUP_RUNNING
+        start = time.perf_counter()
+        try:
+            self.tts_engine.load_model()
+        except Exception as e:
+            logger.error(f"Failed to load TTS model: {e}")
+            self._warmup["state"] = WARMUP_FAILED
+            return self.get_warmup_status()
+        self._warmup["model_load_ms"] = round((time.perf_counter() - start) * 1000, 3)
+        
+        if self.settings.warmup_enabled:
+            warmup_start = time.perf_counter()
+            self._run_warmup()
+            self._warmup["warmup_ms"] = round((time.perf_counter() - warmup_start) * 1000, 3)
+        
+        self._warmup["startup_ms"] = round((time.perf_counter() - self._created_at) * 1000, 3)
+        self._warmup["state"] = WARMUP_READY
+        logger.info(
+            f"TTS model ready: load {self._warmup['model_load_ms']} ms, "
+            f"warm-up {self._warmup['warmup_ms']} ms, {self._warmup['syntheses']} syntheses"
+        )
+        return self.get_warmup_status()
+
+    def _run_warmup(self) -> None:
+        """Synthesize the warm-up text for each emotion (see ``warm_up``).
+        
+        Voices are not warmed separately: the voice does not reach the
+        model, it only keys the caches.
+        """
+        model_rate = self.tts_engine.get_sample_rate()
+        supported = set(self.tts_engine.get_supported_emotions())
+        emotions = self.settings.warmup_emotions or list(self.emotion_controller.list_emotions())
+        synthesize_batch = (
+            self.batcher.synthesize_batch if self.batcher else self.tts_engine.synthesize_batch
+        )
+        encoded = False
+        
+        for emotion in emotions:
+            if emotion not in supported:
+                continue
+            if self._stopping.is_set():
+                return
+            started = time.perf_counter()
+            try:
+                text, intensity, options = self._prepare_request(
+                    self.settings.warmup_text, emotion, 0.5, None
+                )
+                with self.tts_engine.keep_loaded():
+                    raw = synthesize_batch(texts=[text], emotion=emotion, intensity=intensity)[0]
+                raw = np.asarray(raw, dtype=np.float32)
+                for sample_rate in self.settings.warmup_sample_rates:
+                    audio = self.audio_processor.resample(raw, model_rate, sample_rate)
+                    audio = self.audio_processor.process_pipeline(
+                        audio=audio,
+                        normalize=options["normalize_audio"],
+                        remove_silence=options["remove_silence"],
+                        sample_rate=sample_rate,
+                        **self._prosody(emotion, intensity, options)
+                    )
+                    # Encoders do not depend on the emotion
+                    if not encoded:
+                        for output_format in self.settings.warmup_formats:
+                            encode(audio, output_format, sample_rate, io.BytesIO())
+                encoded = True
+                self._warmup["syntheses"] += 1
+            except Exception as e:
+                logger.warning(f"Warm-up failed for emotion '{emotion}': {e}")
+                self._warmup["errors"] += 1
+            self._warmup["emotions_ms"][emotion] = round((time.perf_counter() - started) * 1000, 3)
+
+    def is_ready(self) -> bool:
+        """Whether the model is loaded and warm-up has finished."""
+        return self._warmup["state"] == WARMUP_READY
+
+    def get_warmup_status(self) -> Dict[str, Any]:
+        """Get warm-up state and startup measurements.
+        
+        Returns:
+            Dictionary with the state, model load, warm-up and total startup
+            time (ms since the service was created), per-emotion warm-up
+            time and the latency of the first synthesis request served
+        """
+        status = dict(self._warmup)
+        status["emotions_ms"] = dict(self._warmup["emotions_ms"])
+        return status
+
+    def shutdown(self) -> None:
+        """Release background resources."""
+        self._stopping.set()
+        self.executor.shutdown(wait=False)
+        self.job_executor.shutdown(wait=False)
+        if self.batcher:
+            self.batcher.shutdown(wait=False)
+
     def get_model_info(self) -> dict:
-        """Get information about the loaded model.
+        """Get information about the default model.
         
         Returns:
             Model information dictionary
         """
-        if not self.tts_engine.model:
-            return {"loaded": False}
-        
+        model = self.tts_engine.get_model()
         return {
-            "loaded": self.tts_engine.model.is_loaded,
-            "name": self.tts_engine.model.model_name,
-            "device": self.tts_engine.model.device,
+            "loaded": model.is_loaded,
+            "name": model.model_name,
+            "device": model.device,
             "sample_rate": self.tts_engine.get_sample_rate(),
             "supported_emotions": self.tts_engine.get_supported_emotions()
         }
@@ -35,3 +35,13 @@ class RateLimitException(TTSException):
     """Raised when rate limit is exceeded."""
     pass
 
+
+
+class QueueFullException(TTSException):
+    """Raised when the inference queue cannot accept more work."""
+    pass
+
+
+class DeadlineExceededException(TTSException):
+    """Raised when queued work passes its deadline before it can start."""
+    pass
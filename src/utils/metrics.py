@@ -0,0 +1,452 @@
+"""Prometheus-style metrics with low-contention updates and multi-process aggregation."""
+
+import bisect
+import glob
+import json
+import math
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Metric types
+COUNTER = "counter"
+GAUGE = "gauge"
+HISTOGRAM = "histogram"
+
+# How gauges of several processes combine: summed (per-process quantities
+# such as queue depth), or the max/min (shared or all-or-nothing state)
+AGGREGATE_SUM = "sum"
+AGGREGATE_MAX = "max"
+AGGREGATE_MIN = "min"
+
+# Default upper bounds (seconds) of latency histogram buckets
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = Tuple[str, ...]
+
+
+class _Family:
+    """Definition and process-local values of one metric."""
+
+    def __init__(
+        self,
+        registry: "MetricsRegistry",
+        kind: str,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        buckets: Sequence[float] = (),
+        aggregate: str = AGGREGATE_SUM,
+        derive: Optional[Callable[[Dict[str, Dict[Labels, Any]]], Dict[Labels, float]]] = None
+    ):
+        self._registry = registry
+        self.kind = kind
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self.aggregate = aggregate
+        self.derive = derive
+        # Values set by collectors at snapshot time (rare writes)
+        self._sampled: Dict[Labels, float] = {}
+
+
+class Counter(_Family):
+    """Monotonic counter.
+
+    ``inc`` touches only the calling thread's shard. ``set`` records a
+    total kept elsewhere (e.g. an existing stats counter) and is meant for
+    collectors.
+    """
+
+    def inc(self, labels: Labels = (), amount: float = 1.0) -> None:
+        """Add ``amount`` to the series with these label values."""
+        shard = self._registry._shard()
+        key = (self.name, labels)
+        shard[key] = shard.get(key, 0.0) + amount
+
+    def set(self, value: float, labels: Labels = ()) -> None:
+        """Report a total counted elsewhere."""
+        self._sampled[labels] = value
+
+
+class Gauge(_Family):
+    """Point-in-time value, set by collectors when metrics are read."""
+
+    def set(self, value: float, labels: Labels = ()) -> None:
+        """Set the series with these label values."""
+        self._sampled[labels] = value
+
+
+class Histogram(_Family):
+    """Cumulative-bucket histogram (values in seconds or any unit)."""
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        """Record one value in the calling thread's shard."""
+        shard = self._registry._shard()
+        key = (self.name, labels)
+        counts = shard.get(key)
+        if counts is None:
+            # One slot per bucket, one for +Inf, then the sum
+            counts = shard[key] = [0.0] * (len(self.buckets) + 2)
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    def series(self) -> Dict[Labels, List[float]]:
+        """This process's values by label set, without running collectors.
+
+        Returns:
+            Per-bucket counts (the last for +Inf) followed by the sum
+        """
+        with self._registry._lock:
+            shards = list(self._registry._shards)
+        merged: Dict[Labels, List[float]] = {}
+        for shard in shards:
+            for (name, labels), value in list(shard.items()):
+                if name != self.name:
+                    continue
+                current = merged.get(labels)
+                merged[labels] = [a + b for a, b in zip(current, value)] if current else list(value)
+        return merged
+
+
+class MetricsRegistry:
+    """Registry of metrics rendered in the Prometheus text format.
+
+    Hot-path updates (``Counter.inc``, ``Histogram.observe``) write to a
+    shard owned by the calling thread, so they take no lock and never wait
+    for a scrape; shards are only merged when metrics are read.
+    Collectors registered with ``add_collector`` run at read time to
+    sample state that is already tracked elsewhere (queue depth, cache
+    counters), so that state costs nothing between scrapes.
+
+    With ``multiproc_dir`` set, every process (e.g. each uvicorn worker)
+    writes its snapshot to ``metrics-<pid>.json`` in that shared directory
+    every ``flush_seconds`` and whenever it serves a scrape, and rendering
+    merges all snapshots: counters and histograms are summed over every
+    process that ever wrote one, gauges are combined over live processes
+    only. Clear the directory when the deployment starts.
+    """
+
+    def __init__(self, multiproc_dir: Optional[str] = None, flush_seconds: float = 5.0):
+        """Initialize registry.
+
+        Args:
+            multiproc_dir: Directory shared by all worker processes, or None
+                to report this process only
+            flush_seconds: Interval between snapshot writes in multi-process mode
+        """
+        self.multiproc_dir = multiproc_dir
+        self.flush_seconds = flush_seconds
+        self._families: Dict[str, _Family] = {}
+        self._collectors: List[Callable[[], None]] = []
+        self._shards: List[Dict[Tuple[str, Labels], Any]] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._flusher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        if multiproc_dir:
+            Path(multiproc_dir).mkdir(parents=True, exist_ok=True)
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Define a counter."""
+        return self._register(Counter(self, COUNTER, name, documentation, labelnames))
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        aggregate: str = AGGREGATE_SUM,
+        derive: Optional[Callable[[Dict[str, Dict[Labels, Any]]], Dict[Labels, float]]] = None
+    ) -> Gauge:
+        """Define a gauge.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Label names, in the order values are passed
+            aggregate: How values of several processes combine
+            derive: Compute the gauge from the other merged metrics instead
+                (e.g. a ratio of two counters, which cannot be aggregated
+                itself); receives values keyed by metric name and labels
+        """
+        return self._register(
+            Gauge(self, GAUGE, name, documentation, labelnames, aggregate=aggregate, derive=derive)
+        )
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        """Define a histogram with increasing bucket upper bounds."""
+        return self._register(
+            Histogram(self, HISTOGRAM, name, documentation, labelnames, buckets=buckets)
+        )
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Run ``collector`` whenever metrics are read, to set sampled values."""
+        self._collectors.append(collector)
+
+    def _register(self, family: _Family) -> Any:
+        if family.name in self._families:
+            raise ValueError(f"Metric already registered: {family.name}")
+        self._families[family.name] = family
+        return family
+
+    def _shard(self) -> Dict[Tuple[str, Labels], Any]:
+        """The calling thread's shard, created on first use."""
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = {}
+            with self._lock:
+                self._shards.append(shard)
+        return shard
+
+    def snapshot(self) -> Dict[str, Dict[Labels, Any]]:
+        """Current values of this process, keyed by metric name and labels.
+
+        Counters and gauges map to numbers; histograms map to per-bucket
+        counts (the last for +Inf) followed by the sum.
+        """
+        for collector in list(self._collectors):
+            try:
+                collector()
+            except Exception as e:
+                logger.warning(f"Metrics collector failed: {e}")
+
+        values: Dict[str, Dict[Labels, Any]] = {name: {} for name in self._families}
+        with self._lock:
+            shards = list(self._shards)
+        for shard in shards:
+            for (name, labels), value in list(shard.items()):
+                series = values[name]
+                if isinstance(value, list):
+                    current = series.get(labels)
+                    series[labels] = (
+                        [a + b for a, b in zip(current, value)] if current else list(value)
+                    )
+                else:
+                    series[labels] = series.get(labels, 0.0) + value
+        for family in self._families.values():
+            for labels, value in list(family._sampled.items()):
+                values[family.name][labels] = values[family.name].get(labels, 0.0) + value
+        return values
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        values = self.snapshot()
+        if self.multiproc_dir:
+            self._write(values)
+            values = self._merge_processes()
+
+        lines: List[str] = []
+        for family in self._families.values():
+            series = family.derive(values) if family.derive else values.get(family.name, {})
+            lines.append(f"# HELP {family.name} {_escape_help(family.documentation)}")
+            lines.append(f"# TYPE {family.name} {family.kind}")
+            for labels in sorted(series):
+                pairs = list(zip(family.labelnames, labels))
+                value = series[labels]
+                if family.kind != HISTOGRAM:
+                    lines.append(f"{family.name}{_format_labels(pairs)} {_format_value(value)}")
+                    continue
+                cumulative = 0.0
+                for bound, count in zip(list(family.buckets) + [math.inf], value[:-1]):
+                    cumulative += count
+                    bucket_labels = pairs + [("le", _format_value(bound))]
+                    lines.append(
+                        f"{family.name}_bucket{_format_labels(bucket_labels)} {_format_value(cumulative)}"
+                    )
+                lines.append(f"{family.name}_sum{_format_labels(pairs)} {_format_value(value[-1])}")
+                lines.append(f"{family.name}_count{_format_labels(pairs)} {_format_value(cumulative)}")
+        return "\n".join(lines) + "\n"
+
+    def flush(self) -> None:
+        """Write this process's snapshot for other workers (multi-process mode)."""
+        if self.multiproc_dir:
+            self._write(self.snapshot())
+
+    def start(self) -> None:
+        """Start writing snapshots periodically (multi-process mode only)."""
+        if not self.multiproc_dir or self._flusher is not None:
+            return
+        self._stop.clear()
+        self._flusher = threading.Thread(target=self._flush_loop, name="metrics-flush", daemon=True)
+        self._flusher.start()
+
+    def stop(self) -> None:
+        """Stop periodic writes and write a final snapshot."""
+        if self._flusher is None:
+            return
+        self._stop.set()
+        self._flusher.join(timeout=self.flush_seconds)
+        self._flusher = None
+        self.flush()
+
+    def _flush_loop(self) -> None:
+        while not self._stop.wait(self.flush_seconds):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning(f"Failed to write metrics snapshot: {e}")
+
+    def _write(self, values: Dict[str, Dict[Labels, Any]]) -> None:
+        """Atomically replace this process's snapshot file."""
+        path = Path(self.multiproc_dir) / f"metrics-{os.getpid()}.json"
+        temp = path.with_name(f".{path.name}.tmp")
+        payload = {
+            "pid": os.getpid(),
+            "written_at": time.time(),
+            "metrics": {
+                name: [[list(labels), value] for labels, value in series.items()]
+                for name, series in values.items()
+            },
+        }
+        temp.write_text(json.dumps(payload))
+        os.replace(temp, path)
+
+    def _merge_processes(self) -> Dict[str, Dict[Labels, Any]]:
+        """Combine the snapshots of every process in ``multiproc_dir``."""
+        merged: Dict[str, Dict[Labels, Any]] = {name: {} for name in self._families}
+        gauges: Dict[str, Dict[Labels, List[float]]] = {}
+        for path in glob.glob(os.path.join(self.multiproc_dir, "metrics-*.json")):
+            try:
+                with open(path) as f:
+                    payload = json.load(f)
+            except (OSError, ValueError):
+                continue
+            alive = _pid_alive(payload.get("pid", 0))
+            for name, series in payload.get("metrics", {}).items():
+                family = self._families.get(name)
+                if family is None:
+                    continue
+                target = merged[name]
+                for labels, value in series:
+                    labels = tuple(labels)
+                    if family.kind == GAUGE:
+                        if alive:
+                            gauges.setdefault(name, {}).setdefault(labels, []).append(value)
+                    elif family.kind == HISTOGRAM:
+                        current = target.get(labels)
+                        if current is not None and len(current) != len(value):
+                            continue
+                        target[labels] = (
+                            [a + b for a, b in zip(current, value)] if current else list(value)
+                        )
+                    else:
+                        target[labels] = target.get(labels, 0.0) + value
+
+        combine = {AGGREGATE_SUM: sum, AGGREGATE_MAX: max, AGGREGATE_MIN: min}
+        for name, series in gauges.items():
+            aggregate = combine[self._families[name].aggregate]
+            merged[name] = {labels: aggregate(found) for labels, found in series.items()}
+        return merged
+
+
+def ratio_of(
+    numerator: str,
+    denominator: str,
+    numerator_filter: Optional[Callable[[Labels], bool]] = None,
+    group_by: Callable[[Labels], Labels] = lambda labels: labels
+) -> Callable[[Dict[str, Dict[Labels, Any]]], Dict[Labels, float]]:
+    """Build a ``derive`` function computing a ratio of two merged counters.
+
+    Args:
+        numerator: Counter summed into the numerator
+        denominator: Counter summed into the denominator
+        numerator_filter: Only count numerator series whose labels match
+        group_by: Map series labels to the labels of the derived gauge
+
+    Returns:
+        Function returning the ratio per group (0.0 for an empty denominator)
+    """
+    def derive(values: Mapping[str, Mapping[Labels, Any]]) -> Dict[Labels, float]:
+        top: Dict[Labels, float] = {}
+        bottom: Dict[Labels, float] = {}
+        for labels, value in values.get(numerator, {}).items():
+            if numerator_filter is None or numerator_filter(labels):
+                top[group_by(labels)] = top.get(group_by(labels), 0.0) + value
+        for labels, value in values.get(denominator, {}).items():
+            bottom[group_by(labels)] = bottom.get(group_by(labels), 0.0) + value
+        return {
+            group: (top.get(group, 0.0) / total if total else 0.0)
+            for group, total in bottom.items()
+        }
+    return derive
+
+
+def histogram_quantile(buckets: Sequence[float], counts: Sequence[float], q: float) -> float:
+    """Estimate a quantile from per-bucket counts, like PromQL's ``histogram_quantile``.
+
+    Args:
+        buckets: Increasing bucket upper bounds
+        counts: Count of each bucket, followed by the +Inf bucket
+        q: Quantile between 0 and 1
+
+    Returns:
+        Value interpolated within the bucket holding the quantile; the
+        highest finite bound if that is the +Inf bucket (0.0 when empty)
+    """
+    total = sum(counts)
+    if total == 0:
+        return 0.0
+    rank = q * total
+    seen = 0.0
+    for index, count in enumerate(counts):
+        if count and seen + count >= rank:
+            if index == len(buckets):
+                break
+            lower = buckets[index - 1] if index > 0 else 0.0
+            return lower + (buckets[index] - lower) * (rank - seen) / count
+        seen += count
+    return buckets[-1]
+
+
+def _pid_alive(pid: int) -> bool:
+    """Whether a process with this id is running."""
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(pairs: Sequence[Tuple[str, str]]) -> str:
+    if not pairs:
+        return ""
+    body = ",".join(f'{name}="{_escape_label(str(value))}"' for name, value in pairs)
+    return "{" + body + "}"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
@@ -0,0 +1,182 @@
+"""Lightweight stage timing: per-request spans and per-stage statistics."""
+
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Mapping, Optional
+
+from src.utils.metrics import Histogram, histogram_quantile
+
+# Upper bounds (ms) of the histogram buckets; the last bucket is unbounded
+DEFAULT_BUCKETS_MS = (
+    0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000
+)
+
+# The same bounds in seconds, for the ``tts_stage_duration_seconds`` metric
+STAGE_BUCKETS = tuple(ms / 1000 for ms in DEFAULT_BUCKETS_MS)
+
+_current: ContextVar[Optional["Timings"]] = ContextVar("timings", default=None)
+
+
+class _Span:
+    """Context manager adding its elapsed time to a stage."""
+
+    __slots__ = ("_timings", "_name", "_start")
+
+    def __init__(self, timings: "Timings", name: str):
+        self._timings = timings
+        self._name = name
+
+    def __enter__(self) -> "_Span":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._timings.record(self._name, (time.perf_counter() - self._start) * 1000)
+
+
+class _NullContext:
+    """Context manager that does nothing (disabled timing)."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullContext":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+_NULL = _NullContext()
+
+
+class _Activation:
+    """Context manager making a ``Timings`` the current one."""
+
+    __slots__ = ("_timings", "_token")
+
+    def __init__(self, timings: "Timings"):
+        self._timings = timings
+
+    def __enter__(self) -> "Timings":
+        self._token = _current.set(self._timings)
+        return self._timings
+
+    def __exit__(self, *exc: Any) -> None:
+        _current.reset(self._token)
+
+
+class Timings:
+    """Durations of the named stages of one unit of work, in milliseconds.
+
+    Stages are timed with ``span(name)``; a stage timed more than once (e.g.
+    once per chunk) accumulates. Code that has no reference to the request
+    (audio processing, the engine) times itself with the module-level
+    ``span``, which records into the ``Timings`` activated for the current
+    thread or task.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self._durations: Dict[str, float] = {}
+
+    def span(self, name: str) -> Any:
+        """Time a ``with`` block as stage ``name``."""
+        return _Span(self, name)
+
+    def record(self, name: str, ms: float) -> None:
+        """Add a duration measured elsewhere to stage ``name``."""
+        self._durations[name] = self._durations.get(name, 0.0) + ms
+
+    def activate(self) -> Any:
+        """Make this the current ``Timings`` inside a ``with`` block."""
+        return _Activation(self)
+
+    def as_dict(self) -> Dict[str, float]:
+        """Stage durations in milliseconds, in the order stages first ran."""
+        return {name: round(ms, 3) for name, ms in self._durations.items()}
+
+
+class _DisabledTimings(Timings):
+    """``Timings`` that records nothing, for when timing is turned off."""
+
+    enabled = False
+
+    def span(self, name: str) -> Any:
+        return _NULL
+
+    def record(self, name: str, ms: float) -> None:
+        return None
+
+    def activate(self) -> Any:
+        return _NULL
+
+
+DISABLED = _DisabledTimings()
+
+
+def new_timings(enabled: bool = True) -> Timings:
+    """A fresh recorder, or the shared no-op one when timing is disabled."""
+    return Timings() if enabled else DISABLED
+
+
+def current_timings() -> Optional[Timings]:
+    """The ``Timings`` activated for the current thread or task, if any."""
+    return _current.get()
+
+
+def span(name: str) -> Any:
+    """Time a ``with`` block as stage ``name`` of the current ``Timings``.
+
+    A no-op when no recorder is active, so library code can be instrumented
+    unconditionally.
+    """
+    timings = _current.get()
+    if timings is None:
+        return _NULL
+    return timings.span(name)
+
+
+def server_timing(durations: Mapping[str, float]) -> str:
+    """Format stage durations as a ``Server-Timing`` header value.
+
+    Args:
+        durations: Stage name to milliseconds
+
+    Returns:
+        Header value, e.g. ``inference;dur=812.4, encode;dur=5.1``
+    """
+    return ", ".join(f"{name};dur={ms:.3f}" for name, ms in durations.items())
+
+
+def stage_stats(histogram: Histogram) -> Dict[str, Dict[str, Any]]:
+    """Summarize a stage histogram of this process in milliseconds.
+
+    Args:
+        histogram: Histogram labelled by ``stage``, with ``STAGE_BUCKETS``
+
+    Returns:
+        Count, sum, mean and quantile estimates per stage, with ``buckets``
+        mapping ``le`` bounds (ms) to cumulative counts
+    """
+    stats = {}
+    for (stage,), value in histogram.series().items():
+        counts, total = value[:-1], value[-1] * 1000
+        count = int(sum(counts))
+        cumulative = {}
+        running = 0
+        for bound, bucket in zip(list(DEFAULT_BUCKETS_MS) + ["+Inf"], counts):
+            running += int(bucket)
+            cumulative[str(bound)] = running
+        quantiles = {
+            f"p{int(q * 100)}_ms": round(histogram_quantile(DEFAULT_BUCKETS_MS, counts, q), 3)
+            for q in (0.50, 0.95, 0.99)
+        }
+        stats[stage] = {
+            "count": count,
+            "sum_ms": round(total, 3),
+            "mean_ms": round(total / count, 3) if count else 0.0,
+            **quantiles,
+            "buckets": cumulative,
+        }
+    return stats
@@ -0,0 +1,82 @@
+"""API audio download tests."""
+
+import pytest
+from fastapi.testclient import TestClient
+from src.api.main import app
+
+client = TestClient(app)
+
+
+@pytest.fixture(scope="module")
+def audio_path():
+    """Synthesize a file and return its download path."""
+    response = client.post("/v1/speech/synthesize", json={"text": "Range requests are handy."})
+    assert response.status_code == 200
+    return "/v1/speech" + response.json()["audio_url"]
+
+
+class TestAudioDownload:
+    """Test suite for audio downloads."""
+    
+    def test_full_download_headers(self, audio_path):
+        """Test validators and cache headers on a full download."""
+        response = client.get(audio_path)
+        assert response.status_code == 200
+        assert response.headers["accept-ranges"] == "bytes"
+        assert response.headers["etag"].startswith('"')
+        assert "last-modified" in response.headers
+        assert "immutable" in response.headers["cache-control"]
+    
+    def test_byte_range(self, audio_path):
+        """Test that a range request returns only the requested bytes."""
+        full = client.get(audio_path).content
+        
+        response = client.get(audio_path, headers={"Range": "bytes=10-109"})
+        assert response.status_code == 206
+        assert response.content == full[10:110]
+        assert response.headers["content-range"] == f"bytes 10-109/{len(full)}"
+        
+        response = client.get(audio_path, headers={"Range": "bytes=-20"})
+        assert response.content == full[-20:]
+    
+    def test_unsatisfiable_range(self, audio_path):
+        """Test that a range past the end returns 416."""
+        size = len(client.get(audio_path).content)
+        response = client.get(audio_path, headers={"Range": f"bytes={size}-"})
+        assert response.status_code == 416
+        assert response.headers["content-range"] == f"bytes */{size}"
+    
+    def test_if_none_match(self, audio_path):
+        """Test that a matching ETag returns 304 without a body."""
+        etag = client.get(audio_path).headers["etag"]
+        
+        response = client.get(audio_path, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        
+        response = client.get(audio_path, headers={"If-None-Match": '"other"'})
+        assert response.status_code == 200
+    
+    def test_if_modified_since(self, audio_path):
+        """Test conditional requests by modification date."""
+        last_modified = client.get(audio_path).headers["last-modified"]
+        response = client.get(audio_path, headers={"If-Modified-Since": last_modified})
+        assert response.status_code == 304
+    
+    def test_stale_if_range_sends_whole_file(self, audio_path):
+        """Test that a range for an outdated copy returns the whole file."""
+        full = client.get(audio_path).content
+        response = client.get(audio_path, headers={"Range": "bytes=0-9", "If-Range": '"stale"'})
+        assert response.status_code == 200
+        assert response.content == full
+    
+    def test_hidden_files_not_served(self):
+        """Test that the storage index cannot be downloaded."""
+        response = client.get("/v1/speech/audio/.index.sqlite3")
+        assert response.status_code == 404
+    
+    def test_directories_not_served(self, audio_path):
+        """Test that directories of the audio store are not found."""
+        response = client.get("/v1/speech/audio/chunks")
+        assert response.status_code == 404
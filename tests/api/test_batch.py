@@ -0,0 +1,62 @@
+"""API batch synthesis endpoint tests."""
+
+from fastapi.testclient import TestClient
+from src.api.main import app
+
+client = TestClient(app)
+
+
+class TestBatchEndpoint:
+    """Test suite for the batch synthesis endpoint."""
+    
+    def test_batch_manifest(self):
+        """Test that every item gets a result in request order."""
+        items = [
+            {"text": "The first line.", "emotion": "serious"},
+            {"text": "The second line.", "emotion": "serious"},
+            {"text": "The third line.", "emotion": "excited", "output_format": "ogg"}
+        ]
+        response = client.post("/v1/speech/batch", json={"items": items})
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["status"] == "completed"
+        assert data["total"] == 3
+        assert data["succeeded"] == 3
+        assert data["groups"] <= 2
+        assert [item["index"] for item in data["items"]] == [0, 1, 2]
+        assert data["items"][2]["audio_url"].endswith(".ogg")
+    
+    def test_repeated_batch_hits_cache(self):
+        """Test that re-submitting a batch is served from the cache."""
+        items = [{"text": "A line worth repeating."}]
+        client.post("/v1/speech/batch", json={"items": items})
+        
+        response = client.post("/v1/speech/batch", json={"items": items})
+        assert response.json()["items"][0]["cache_hit"] is True
+    
+    def test_empty_batch_rejected(self):
+        """Test that an empty batch fails validation."""
+        response = client.post("/v1/speech/batch", json={"items": []})
+        assert response.status_code == 422
+    
+    def test_oversized_batch_rejected(self):
+        """Test that batches above the configured limit are rejected."""
+        items = [{"text": "Hi."}] * 501
+        response = client.post("/v1/speech/batch", json={"items": items})
+        assert response.status_code == 400
+        assert response.json()["detail"]["code"] == "BATCH_TOO_LARGE"
+    
+    def test_unknown_model_fails_only_its_item(self):
+        """Test that items select models and an unknown model fails only that item."""
+        items = [
+            {"text": "A line for the default model.", "model": "reference"},
+            {"text": "A line for a missing model.", "model": "no-such-model"}
+        ]
+        response = client.post("/v1/speech/batch", json={"items": items})
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["status"] == "partial"
+        assert data["items"][0]["model"] == "reference"
+        assert "no-such-model" in data["items"][1]["error"]
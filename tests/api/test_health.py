@@ -2,6 +2,7 @@
 
 import pytest
 from fastapi.testclient import TestClient
+from src.api.dependencies import get_speech_service
 from src.api.main import app
 
 client = TestClient(app)
@@ -36,4 +37,24 @@ class TestHealthEndpoints:
         assert "name" in data
         assert "version" in data
         assert "docs" in data
+    
+    def test_stats(self):
+        """Test that stats report each pipeline component."""
+        response = client.get("/v1/health/stats")
+        assert response.status_code == 200
+        stats = response.json()
+        assert {"inference", "jobs", "storage", "cache", "stages", "warmup", "models"} <= set(stats)
+        for stage in stats["stages"].values():
+            assert {"count", "sum_ms", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "buckets"} <= set(stage)
 
+    def test_ready_after_warm_up(self):
+        """Test that readiness reports ready once warm-up has finished."""
+        service = get_speech_service()
+        if not service.is_ready():
+            response = client.get("/v1/health/ready")
+            assert response.status_code == 503
+            service.warm_up()
+        
+        response = client.get("/v1/health/ready")
+        assert response.status_code == 200
+        assert client.get("/v1/health/stats").json()["warmup"]["state"] == "ready"
@@ -0,0 +1,80 @@
+"""API tests for inline synthesis responses."""
+
+import base64
+import io
+
+import soundfile as sf
+from fastapi.testclient import TestClient
+from src.api.main import app
+
+client = TestClient(app)
+
+
+class TestInlineResponse:
+    """Test suite for the synthesize response modes."""
+
+    def test_default_returns_url(self):
+        """Test that audio is stored and linked unless asked otherwise."""
+        response = client.post("/v1/speech/synthesize", json={"text": "Stored as a file."})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["audio_url"] is not None
+        assert data["audio_base64"] is None
+
+    def test_base64(self):
+        """Test that base64 mode embeds playable audio and no URL."""
+        response = client.post(
+            "/v1/speech/synthesize?response_mode=base64",
+            json={"text": "Returned inline as base64."}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["audio_url"] is None
+        audio = base64.b64decode(data["audio_base64"])
+        info = sf.info(io.BytesIO(audio))
+        assert info.samplerate == 24000
+        assert abs(info.duration - data["duration_seconds"]) < 0.01
+
+    def test_binary(self):
+        """Test that binary mode returns the audio as the body."""
+        response = client.post(
+            "/v1/speech/synthesize?response_mode=binary",
+            json={"text": "Returned as the raw body.", "output_format": "ogg"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "audio/ogg"
+        assert response.headers["x-job-id"]
+        assert response.headers["x-cache-hit"] == "false"
+        assert sf.info(io.BytesIO(response.content)).format == "OGG"
+
+    def test_binary_cache_hit_matches(self):
+        """Test that a repeated inline request is served from the cache."""
+        body = {"text": "Cached in memory only.", "emotion": "sad"}
+        first = client.post("/v1/speech/synthesize?response_mode=binary", json=body)
+        second = client.post("/v1/speech/synthesize?response_mode=binary", json=body)
+        assert second.headers["x-cache-hit"] == "true"
+        assert second.content == first.content
+
+        # The same content can still be requested as a file
+        stored = client.post("/v1/speech/synthesize?response_mode=url", json=body)
+        download = client.get("/v1/speech" + stored.json()["audio_url"])
+        assert download.content == first.content
+
+    def test_auto_inlines_short_clips(self):
+        """Test that auto mode returns a short clip inline."""
+        response = client.post(
+            "/v1/speech/synthesize?response_mode=auto",
+            json={"text": "Short.", "sample_rate": 16000}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["audio_url"] is None
+        assert data["audio_base64"]
+
+    def test_invalid_mode(self):
+        """Test that an unknown response mode is rejected."""
+        response = client.post(
+            "/v1/speech/synthesize?response_mode=inline",
+            json={"text": "Not a mode."}
+        )
+        assert response.status_code == 422
@@ -0,0 +1,57 @@
+"""API background job endpoint tests."""
+
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from src.api.main import app
+from src.api.dependencies import get_job_store
+from src.services.job_store import InMemoryJobStore
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def job_store():
+    """Provide a fresh job store for each test."""
+    store = InMemoryJobStore()
+    app.dependency_overrides[get_job_store] = lambda: store
+    yield store
+    app.dependency_overrides.pop(get_job_store, None)
+
+
+def wait_for_job(job_id, timeout=30.0):
+    """Poll a job until it has finished."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        data = client.get(f"/v1/speech/jobs/{job_id}").json()
+        if data["status"] in ("completed", "failed"):
+            return data
+        time.sleep(0.05)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+class TestJobEndpoints:
+    """Test suite for background job endpoints."""
+    
+    def test_job_lifecycle(self, job_store):
+        """Test submitting a job and polling it to completion."""
+        text = "This is the first sentence of a long narration. " * 30
+        response = client.post("/v1/speech/jobs", json={"text": text})
+        assert response.status_code == 202
+        
+        data = response.json()
+        assert data["status"] in ("queued", "completed")
+        assert data["status_url"] == f"/v1/speech/jobs/{data['job_id']}"
+        assert job_store.get(data["job_id"]) is not None
+        
+        final = wait_for_job(data["job_id"])
+        assert final["status"] == "completed"
+        assert final["audio_url"].startswith("/audio/")
+        assert final["progress"]["chunks_done"] == final["progress"]["chunks_total"]
+    
+    def test_unknown_job(self, job_store):
+        """Test that unknown job IDs return 404."""
+        response = client.get("/v1/speech/jobs/does-not-exist")
+        assert response.status_code == 404
+        assert response.json()["detail"]["code"] == "JOB_NOT_FOUND"
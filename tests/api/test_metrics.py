@@ -0,0 +1,39 @@
+"""API tests for the metrics endpoint."""
+
+import uuid
+
+from fastapi.testclient import TestClient
+from src.api.main import app
+
+client = TestClient(app)
+
+
+class TestMetricsEndpoint:
+    """Test suite for /metrics."""
+
+    def test_exposition(self):
+        """Test that routes and synthesis are reported in the text format."""
+        response = client.post(
+            "/v1/speech/synthesize",
+            json={"text": f"Counted by the metrics endpoint {uuid.uuid4()}.", "emotion": "serious"}
+        )
+        assert response.status_code == 200
+        client.get("/v1/speech/jobs/not-a-job")
+        client.get("/v1/speech/jobs/jobs")
+        client.get("/v1/no-such-route")
+
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        text = response.text
+        assert 'http_requests_total{method="POST",route="/v1/speech/synthesize",status="200"}' in text
+        assert 'route="/v1/speech/jobs/{job_id}",status="404"}' in text
+        assert "/v1/speech/jobs/jobs" not in text
+        assert 'http_requests_total{method="GET",route="unmatched",status="404"}' in text
+        assert 'tts_synthesis_duration_seconds_count{emotion="serious",model="reference"' in text
+        assert 'tts_synthesis_real_time_factor_bucket{emotion="serious",model="reference",le="+Inf"}' in text
+        assert 'tts_queue_depth{pool="inference",lane="interactive"}' in text
+        assert 'tts_cache_hit_ratio{cache="output"}' in text
+        assert 'tts_stage_duration_seconds_count{stage="inference"}' in text
+        assert "tts_audio_storage_bytes " in text
+        assert 'tts_model_loaded{model="reference"}' in text
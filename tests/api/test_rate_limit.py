@@ -0,0 +1,67 @@
+"""API rate limiting tests."""
+
+import pytest
+from fastapi.testclient import TestClient
+from src.api.main import app
+from src.api.dependencies import get_api_keys, get_rate_limiter
+from src.services.rate_limiter import InMemoryRateLimiter
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def limiter():
+    """Install a small rate limiter for the test."""
+    limiter = InMemoryRateLimiter(capacity=3, refill_per_second=0.01)
+    app.dependency_overrides[get_rate_limiter] = lambda: limiter
+    app.dependency_overrides[get_api_keys] = lambda: frozenset({"a", "b"})
+    yield limiter
+    app.dependency_overrides.pop(get_rate_limiter, None)
+    app.dependency_overrides.pop(get_api_keys, None)
+
+
+class TestRateLimit:
+    """Test suite for rate limiting."""
+    
+    def test_exceeding_limit_returns_429(self, limiter):
+        """Test that requests beyond the budget are rejected with Retry-After."""
+        for _ in range(3):
+            response = client.post("/v1/speech/synthesize", json={"text": "Hello there."})
+            assert response.status_code == 200
+        
+        response = client.post("/v1/speech/synthesize", json={"text": "Hello there."})
+        assert response.status_code == 429
+        assert response.json()["detail"]["code"] == "RATE_LIMIT_EXCEEDED"
+        assert int(response.headers["Retry-After"]) >= 1
+    
+    def test_long_text_costs_more(self, limiter):
+        """Test that a long text uses up more of the budget than a short one."""
+        response = client.post("/v1/speech/synthesize", json={"text": "Long sentence here. " * 60})
+        assert response.status_code == 200
+        
+        response = client.post("/v1/speech/synthesize", json={"text": "Hello there."})
+        assert response.status_code == 429
+    
+    def test_api_keys_limited_separately(self, limiter):
+        """Test that each API key has its own budget."""
+        for _ in range(3):
+            client.post("/v1/speech/synthesize", json={"text": "Hi."}, headers={"X-API-Key": "a"})
+        
+        blocked = client.post("/v1/speech/synthesize", json={"text": "Hi."}, headers={"X-API-Key": "a"})
+        other = client.post("/v1/speech/synthesize", json={"text": "Hi."}, headers={"X-API-Key": "b"})
+        assert blocked.status_code == 429
+        assert other.status_code == 200
+    
+    def test_unknown_keys_share_the_ip_budget(self, limiter):
+        """Test that rotating unrecognized API keys does not escape the limit."""
+        for n in range(3):
+            response = client.post(
+                "/v1/speech/synthesize", json={"text": "Hi."}, headers={"X-API-Key": f"made-up-{n}"}
+            )
+            assert response.status_code == 200
+        
+        response = client.post(
+            "/v1/speech/synthesize", json={"text": "Hi."}, headers={"X-API-Key": "made-up-3"}
+        )
+        assert response.status_code == 429
+        assert len(limiter) == 1
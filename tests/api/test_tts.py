@@ -0,0 +1,29 @@
+"""API tests for the synthesis endpoints."""
+
+import uuid
+
+from fastapi.testclient import TestClient
+from src.api.main import app
+
+client = TestClient(app)
+
+
+class TestSynthesizeEndpoint:
+    """Test suite for /v1/speech/synthesize."""
+
+    def test_stage_timings(self):
+        """Test that synthesis reports stage timings and aggregates them in stats."""
+        response = client.post(
+            "/v1/speech/synthesize",
+            json={"text": f"Timing every stage of request {uuid.uuid4()}."}
+        )
+        assert response.status_code == 200
+        stages = response.json()["metadata"]["stage_timings_ms"]
+        assert {"prepare", "cache_lookup", "inference", "save"} <= set(stages)
+
+        header = response.headers["server-timing"]
+        assert header.split(", ")[0].startswith("prepare;dur=")
+        assert len(header.split(", ")) == len(stages)
+
+        stats = client.get("/v1/health/stats").json()
+        assert stats["stages"]["inference"]["count"] >= 1
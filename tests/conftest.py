@@ -1,5 +1,6 @@
 """Pytest configuration and fixtures."""
 
+import os
 import pytest
 from pathlib import Path
 import sys
@@ -7,6 +8,13 @@ import sys
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# API tests share one client address; tests that cover rate limiting
+# install their own limiter
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+
+# API tests run against the built-in synthesizer, which needs no downloads
+os.environ.setdefault("MODEL_NAME", "reference")
+
 from config.settings import Settings
 
 
@@ -3,6 +3,7 @@
 import pytest
 import numpy as np
 from src.core.audio_processor import AudioProcessor
+from src.utils.timing import Timings
 
 
 class TestAudioProcessor:
@@ -27,15 +28,44 @@ class TestAudioProcessor:
     def test_remove_silence(self):
         """Test silence removal."""
         processor = AudioProcessor()
-        # Create audio with silence
+        # Create audio with 0.5s of silence
         audio = np.concatenate([
-            np.random.randn(1000) * 0.5,  # Sound
-            np.zeros(1000),  # Silence
-            np.random.randn(1000) * 0.5  # Sound
+            np.random.randn(4800) * 0.5,  # Sound
+            np.zeros(12000),  # Silence
+            np.random.randn(4800) * 0.5  # Sound
         ]).astype(np.float32)
         
         result = processor.remove_silence(audio)
         assert len(result) < len(audio)
+        # Only the silent span is removed (minus frames touching the sound)
+        assert 9600 <= len(result) <= 9600 + 2 * 480
+    
+    def test_remove_silence_keeps_short_pauses(self):
+        """Test that pauses shorter than min_silence_duration are kept."""
+        processor = AudioProcessor()
+        audio = np.concatenate([
+            np.random.randn(4800) * 0.5,
+            np.zeros(2400),  # 0.1s pause
+            np.random.randn(4800) * 0.5
+        ]).astype(np.float32)
+        
+        result = processor.remove_silence(audio, min_silence_duration=0.3)
+        assert len(result) == len(audio)
+        
+        result = processor.remove_silence(audio, min_silence_duration=0.05)
+        assert len(result) < len(audio)
+    
+    def test_remove_silence_all_silent(self):
+        """Test that fully silent audio is removed entirely."""
+        processor = AudioProcessor()
+        result = processor.remove_silence(np.zeros(24000, dtype=np.float32))
+        assert len(result) == 0
+    
+    def test_remove_silence_short_input(self):
+        """Test that input shorter than one frame is returned unchanged."""
+        processor = AudioProcessor()
+        audio = np.zeros(100, dtype=np.float32)
+        assert len(processor.remove_silence(audio)) == 100
     
     def test_change_speed(self):
         """Test speed change."""
@@ -44,11 +74,21 @@ class TestAudioProcessor:
         
         # Speed up
         faster = processor.change_speed(audio, speed=1.5)
-        assert len(faster) < len(audio)
+        assert len(faster) == int(len(audio) / 1.5)
         
         # Slow down
         slower = processor.change_speed(audio, speed=0.75)
-        assert len(slower) > len(audio)
+        assert len(slower) == int(len(audio) / 0.75)
+    
+    def test_change_speed_preserves_pitch(self):
+        """Test that speed change does not shift pitch."""
+        processor = AudioProcessor()
+        t = np.arange(24000) / 24000
+        audio = (0.5 * np.sin(2 * np.pi * 300 * t)).astype(np.float32)
+        
+        faster = processor.change_speed(audio, speed=1.25)[2048:-2048]
+        spectrum = np.abs(np.fft.rfft(faster * np.hanning(len(faster))))
+        assert abs(np.argmax(spectrum) * 24000 / len(faster) - 300) < 3
     
     def test_save_and_load_audio(self, tmp_path):
         """Test saving and loading audio."""
@@ -81,4 +121,43 @@ class TestAudioProcessor:
         assert len(processed) > 0
         assert processed.max() <= 1.0
         assert processed.min() >= -1.0
-
+    
+    def test_process_pipeline_prosody_timings(self):
+        """Test that the pipeline reports the stages it ran."""
+        processor = AudioProcessor()
+        audio = np.random.randn(24000).astype(np.float32) * 0.1
+        timings = Timings()
+        
+        with timings.activate():
+            processed = processor.process_pipeline(
+                audio,
+                speed=1.1,
+                pitch_scale=1.15,
+                energy_scale=1.25
+            )
+        
+        assert len(processed) == int(len(audio) / 1.1)
+        assert set(timings.as_dict()) == {"time_stretch", "normalize", "energy"}
+    
+    def test_shift_pitch(self):
+        """Test that pitch shift scales frequency and keeps duration."""
+        processor = AudioProcessor()
+        t = np.arange(24000) / 24000
+        audio = (0.5 * np.sin(2 * np.pi * 300 * t)).astype(np.float32)
+        
+        shifted = processor.shift_pitch(audio, 1.2)
+        assert len(shifted) == len(audio)
+        
+        segment = shifted[2048:-2048]
+        spectrum = np.abs(np.fft.rfft(segment * np.hanning(len(segment))))
+        assert abs(np.argmax(spectrum) * 24000 / len(segment) - 360) < 4
+    
+    def test_apply_energy(self):
+        """Test energy scaling and clipping."""
+        processor = AudioProcessor()
+        audio = np.full(100, 0.5, dtype=np.float32)
+        
+        louder = processor.apply_energy(audio, 1.44)
+        assert np.allclose(louder, 0.6)
+        assert louder.dtype == np.float32
+        assert processor.apply_energy(audio, 9.0).max() == 1.0
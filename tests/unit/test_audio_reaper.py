@@ -0,0 +1,162 @@
+"""Unit tests for AudioIndex and AudioReaper."""
+
+import asyncio
+
+import pytest
+from src.core.audio_index import AudioIndex
+from src.services.audio_reaper import AudioReaper
+
+
+class FakeClock:
+    """Manually advanced time source."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Provide a fake clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def index(tmp_path, clock):
+    """Provide an index over a temporary directory."""
+    index = AudioIndex(tmp_path, clock=clock)
+    yield index
+    index.close()
+
+
+def write(index, name, size):
+    """Create a file of the given size and record it."""
+    path = index.root / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    index.record(path, size)
+    return path
+
+
+class TestAudioIndex:
+    """Test suite for AudioIndex."""
+    
+    def test_record_and_totals(self, index):
+        """Test that recorded files are counted."""
+        write(index, "a.wav", 10)
+        write(index, "chunks/b.f32", 20)
+        assert index.totals() == (2, 30)
+    
+    def test_running_totals(self, index, tmp_path):
+        """Test that totals follow this index's writes and recount picks up others'."""
+        write(index, "a.wav", 10)
+        write(index, "a.wav", 4)
+        assert index.totals() == (1, 4)
+        
+        other = AudioIndex(tmp_path)
+        write(other, "b.wav", 6)
+        other.close()
+        assert index.totals() == (1, 4)
+        assert index.recount() == (2, 10)
+        
+        index.forget(index.least_recent(2))
+        assert index.totals() == (0, 0)
+    
+    def test_touch_updates_order(self, index, clock):
+        """Test that used files move to the back of the LRU order."""
+        first = write(index, "a.wav", 1)
+        clock.now += 1
+        write(index, "b.wav", 1)
+        clock.now += 1
+        index.touch(first)
+        
+        assert [entry[0] for entry in index.least_recent(2)] == ["b.wav", "a.wav"]
+    
+    def test_forget_skips_reused_entries(self, index, clock):
+        """Test that entries used after being selected are kept."""
+        path = write(index, "a.wav", 1)
+        entries = index.least_recent(1)
+        clock.now += 1
+        index.touch(path)
+        
+        index.forget(entries)
+        assert index.totals() == (1, 1)
+    
+    def test_reconcile(self, index):
+        """Test that a scan adds unknown files and drops missing ones."""
+        (index.root / "untracked.wav").write_bytes(b"abc")
+        (index.root / ".tmp-partial").write_bytes(b"abc")
+        gone = write(index, "gone.wav", 5)
+        gone.unlink()
+        
+        assert index.reconcile() == (1, 1)
+        assert index.totals() == (1, 3)
+
+
+class TestAudioReaper:
+    """Test suite for AudioReaper."""
+    
+    def test_expires_unused_files(self, index, clock):
+        """Test that files unused for the TTL are deleted."""
+        old = write(index, "old.wav", 100)
+        clock.now += 50
+        fresh = write(index, "fresh.wav", 100)
+        clock.now += 60
+        
+        reaper = AudioReaper(index, ttl_seconds=100, clock=clock)
+        assert reaper.run_pass() == {"expired": 1, "evicted": 0, "bytes_reclaimed": 100}
+        assert not old.exists()
+        assert fresh.exists()
+    
+    def test_quota_evicts_least_recently_used(self, index, clock):
+        """Test that the oldest files go first when over the byte quota."""
+        paths = []
+        for name in ["a.wav", "b.wav", "c.wav", "d.wav"]:
+            paths.append(write(index, name, 100))
+            clock.now += 1
+        index.touch(paths[0])
+        
+        reaper = AudioReaper(index, ttl_seconds=0, max_bytes=250, batch_size=1)
+        result = reaper.run_pass()
+        
+        assert result == {"expired": 0, "evicted": 2, "bytes_reclaimed": 200}
+        assert [p.exists() for p in paths] == [True, False, False, True]
+        assert index.totals() == (2, 200)
+    
+    def test_first_pass_picks_up_untracked_files(self, index, clock):
+        """Test that files written before the index existed are reaped."""
+        (index.root / "legacy.wav").write_bytes(b"x" * 10)
+        
+        reaper = AudioReaper(index, ttl_seconds=0, max_bytes=5)
+        assert reaper.run_pass()["evicted"] == 1
+        assert not (index.root / "legacy.wav").exists()
+    
+    def test_stats(self, index, clock):
+        """Test that reclaimed bytes and pass durations are reported."""
+        write(index, "a.wav", 100)
+        clock.now += 10
+        reaper = AudioReaper(index, ttl_seconds=5, max_bytes=1000, clock=clock)
+        reaper.run_pass()
+        
+        stats = reaper.get_stats()
+        assert stats["passes"] == 1
+        assert stats["expired_files"] == 1
+        assert stats["bytes_reclaimed"] == 100
+        assert stats["files"] == 0
+        assert stats["last_pass_ms"] >= 0.0
+    
+    def test_run_until_cancelled(self, index):
+        """Test that the background loop runs passes until cancelled."""
+        reaper = AudioReaper(index, ttl_seconds=0, interval_seconds=0.01)
+        
+        async def main():
+            task = asyncio.create_task(reaper.run())
+            await asyncio.sleep(0.1)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        
+        asyncio.run(main())
+        assert reaper.get_stats()["passes"] >= 2
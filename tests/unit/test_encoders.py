@@ -0,0 +1,104 @@
+"""Unit tests for audio encoders."""
+
+import io
+
+import pytest
+import numpy as np
+import soundfile as sf
+from src.core.encoders import create_stream_encoder, encode, get_encoder_stats, get_format, to_pcm16
+
+
+def _encode_blocks(output_format, blocks, sample_rate=24000):
+    """Stream blocks through an encoder and return all bytes."""
+    encoder = create_stream_encoder(output_format, sample_rate)
+    data = b"".join(encoder.write(block) for block in blocks)
+    return data + encoder.close()
+
+
+class TestStreamEncoders:
+    """Test suite for streaming encoders."""
+    
+    def test_to_pcm16(self):
+        """Test float to 16-bit PCM conversion."""
+        data = to_pcm16(np.array([0.0, 1.0, -1.0, 2.0]))
+        assert np.frombuffer(data, dtype="<i2").tolist() == [0, 32767, -32767, 32767]
+    
+    def test_pcm_stream(self):
+        """Test raw PCM stream length."""
+        blocks = [np.zeros(100), np.zeros(50)]
+        assert len(_encode_blocks("pcm", blocks)) == 300
+    
+    def test_wav_stream_decodes(self):
+        """Test that a streamed WAV is readable."""
+        blocks = [np.random.randn(2400) * 0.1 for _ in range(3)]
+        audio, sample_rate = sf.read(io.BytesIO(_encode_blocks("wav", blocks, 16000)))
+        assert sample_rate == 16000
+        assert len(audio) == 7200
+    
+    def test_wav_stream_empty_has_header(self):
+        """Test that an empty WAV stream still has a header."""
+        assert _encode_blocks("wav", []).startswith(b"RIFF")
+    
+    def test_ogg_stream_emits_incrementally(self):
+        """Test that Ogg output is produced before the stream is closed."""
+        encoder = create_stream_encoder("ogg", 24000)
+        first = encoder.write(np.random.randn(24000).astype(np.float32) * 0.1)
+        rest = encoder.write(np.random.randn(24000).astype(np.float32) * 0.1) + encoder.close()
+        assert len(first) > 0
+        
+        audio, sample_rate = sf.read(io.BytesIO(first + rest))
+        assert sample_rate == 24000
+        assert len(audio) == 48000
+    
+    def test_mp3_stream_emits_incrementally(self):
+        """Test that MP3 frames are produced before the stream is closed."""
+        encoder = create_stream_encoder("mp3", 24000)
+        first = encoder.write(np.random.randn(24000).astype(np.float32) * 0.1)
+        assert first.startswith(b"\xff")
+        assert len(encoder.close()) > 0
+    
+    def test_unknown_format_raises_error(self):
+        """Test that unsupported stream formats raise ValueError."""
+        with pytest.raises(ValueError, match="cannot be streamed"):
+            create_stream_encoder("flac", 24000)
+
+
+class TestEncode:
+    """Test suite for whole-file encoding."""
+    
+    @pytest.mark.parametrize("output_format,container", [
+        ("wav", "WAV"), ("mp3", "MP3"), ("ogg", "OGG")
+    ])
+    def test_encode_format(self, output_format, container):
+        """Test that each format is encoded in its own container."""
+        audio = np.random.randn(24000) * 0.1
+        buffer = io.BytesIO()
+        
+        num_bytes = encode(audio, output_format, 24000, buffer)
+        assert num_bytes == len(buffer.getvalue())
+        
+        info = sf.info(io.BytesIO(buffer.getvalue()))
+        assert info.format == container
+        assert info.samplerate == 24000
+        assert abs(info.duration - 1.0) < 0.01
+    
+    def test_encode_to_file(self, tmp_path):
+        """Test encoding straight into an open file."""
+        path = tmp_path / "out.ogg"
+        with open(path, "w+b") as f:
+            encode(np.zeros(4800), "ogg", 24000, f)
+        assert sf.info(str(path)).frames == 4800
+    
+    def test_unknown_format_raises_error(self):
+        """Test that unregistered formats raise ValueError."""
+        with pytest.raises(ValueError, match="Unsupported output format"):
+            get_format("flac")
+    
+    def test_stats_recorded(self):
+        """Test that encodes are counted in the encoder stats."""
+        before = get_encoder_stats().get("wav", {}).get("count", 0)
+        encode(np.zeros(2400), "wav", 24000, io.BytesIO())
+        
+        stats = get_encoder_stats()["wav"]
+        assert stats["count"] == before + 1
+        assert stats["bytes_per_audio_second"] > 0
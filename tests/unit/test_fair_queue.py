@@ -0,0 +1,128 @@
+"""Unit tests for FairQueue."""
+
+import threading
+import time
+
+import pytest
+from src.services.fair_queue import (
+    BATCH,
+    INTERACTIVE,
+    FairQueue,
+    LaneFullError,
+    QueueClosedError,
+)
+
+
+def drain(fair_queue):
+    """Remove all items without blocking."""
+    items = []
+    while True:
+        entry = fair_queue.get(timeout=0)
+        if entry is None:
+            return items
+        items.append(entry[0])
+
+
+class TestFairQueue:
+    """Test suite for FairQueue."""
+    
+    def test_interactive_lane_served_first(self):
+        """Test that batch work only runs when no interactive work waits."""
+        fair_queue = FairQueue()
+        fair_queue.put("b1", lane=BATCH)
+        fair_queue.put("i1", lane=INTERACTIVE)
+        fair_queue.put("b2", lane=BATCH)
+        fair_queue.put("i2", lane=INTERACTIVE)
+        
+        assert drain(fair_queue) == ["i1", "i2", "b1", "b2"]
+    
+    def test_tenants_interleaved(self):
+        """Test that a backlog from one tenant does not block another."""
+        fair_queue = FairQueue()
+        for index in range(4):
+            fair_queue.put(f"a{index}", tenant="a")
+        fair_queue.put("b0", tenant="b")
+        fair_queue.put("b1", tenant="b")
+        
+        assert drain(fair_queue) == ["a0", "b0", "a1", "b1", "a2", "a3"]
+    
+    def test_weights_share_service(self):
+        """Test that a tenant with twice the weight gets twice the service."""
+        fair_queue = FairQueue(max_size=64, weights={"gold": 2.0})
+        for index in range(12):
+            fair_queue.put(("gold", index), tenant="gold")
+            fair_queue.put(("free", index), tenant="free")
+        
+        first = drain(fair_queue)[:12]
+        assert sum(1 for tenant, _ in first if tenant == "gold") == 8
+    
+    def test_cost_accounts_for_work(self):
+        """Test that expensive items consume more of a tenant's share."""
+        fair_queue = FairQueue()
+        fair_queue.put("long", tenant="a", cost=3.0)
+        fair_queue.put("long2", tenant="a", cost=3.0)
+        for index in range(3):
+            fair_queue.put(f"short{index}", tenant="b", cost=1.0)
+        
+        assert drain(fair_queue) == ["long", "short0", "short1", "short2", "long2"]
+    
+    def test_expired_items_dropped(self):
+        """Test that items past their deadline are handed to on_expired."""
+        expired = []
+        fair_queue = FairQueue(on_expired=expired.append)
+        fair_queue.put("stale", deadline=time.perf_counter() - 1)
+        fair_queue.put("fresh", deadline=time.perf_counter() + 60)
+        
+        assert drain(fair_queue) == ["fresh"]
+        assert expired == ["stale"]
+        assert fair_queue.get_stats()[INTERACTIVE]["expired"] == 1
+    
+    def test_lane_capacity(self):
+        """Test that a full lane rejects without affecting other lanes."""
+        fair_queue = FairQueue(max_size=1)
+        fair_queue.put("b1", lane=BATCH)
+        with pytest.raises(LaneFullError):
+            fair_queue.put("b2", lane=BATCH)
+        fair_queue.put("i1", lane=INTERACTIVE)
+        
+        stats = fair_queue.get_stats()
+        assert stats[BATCH]["rejected"] == 1
+        assert stats[BATCH]["depth"] == 1
+        assert stats[INTERACTIVE]["depth"] == 1
+    
+    def test_unknown_lane(self):
+        """Test rejection of unknown lanes."""
+        with pytest.raises(ValueError, match="Unknown lane"):
+            FairQueue().put("x", lane="bulk")
+    
+    def test_close_drains_then_stops(self):
+        """Test that closing hands out queued items before returning None."""
+        fair_queue = FairQueue()
+        fair_queue.put("last")
+        fair_queue.close()
+        
+        with pytest.raises(QueueClosedError):
+            fair_queue.put("late")
+        assert fair_queue.get()[0] == "last"
+        assert fair_queue.get() is None
+    
+    def test_get_blocks_until_put(self):
+        """Test that get wakes up when an item arrives."""
+        fair_queue = FairQueue()
+        threading.Timer(0.05, fair_queue.put, args=("late",)).start()
+        
+        item, lane, waited = fair_queue.get(timeout=5)
+        assert item == "late"
+        assert lane == INTERACTIVE
+        assert waited >= 0.0
+    
+    def test_latency_percentiles(self):
+        """Test per-lane latency percentiles."""
+        fair_queue = FairQueue()
+        for ms in range(1, 101):
+            fair_queue.record_latency(BATCH, ms / 1000)
+        
+        stats = fair_queue.get_stats()[BATCH]
+        assert stats["latency_p50_ms"] == pytest.approx(50.5)
+        assert stats["latency_p99_ms"] == pytest.approx(99.01)
+        assert fair_queue.get_stats()[INTERACTIVE]["latency_p95_ms"] == 0.0
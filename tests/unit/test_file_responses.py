@@ -0,0 +1,38 @@
+"""Unit tests for file response helpers."""
+
+import pytest
+from src.api.file_responses import parse_range
+
+
+class TestParseRange:
+    """Test suite for parse_range."""
+    
+    def test_closed_range(self):
+        """Test a range with start and end."""
+        assert parse_range("bytes=0-99", 1000) == (0, 99)
+    
+    def test_open_ended_range(self):
+        """Test a range to the end of the file."""
+        assert parse_range("bytes=900-", 1000) == (900, 999)
+    
+    def test_suffix_range(self):
+        """Test a range covering the last bytes."""
+        assert parse_range("bytes=-100", 1000) == (900, 999)
+        assert parse_range("bytes=-5000", 1000) == (0, 999)
+    
+    def test_end_clamped_to_size(self):
+        """Test that an end past the file is clamped."""
+        assert parse_range("bytes=500-5000", 1000) == (500, 999)
+    
+    def test_unsatisfiable(self):
+        """Test ranges starting beyond the file."""
+        with pytest.raises(ValueError):
+            parse_range("bytes=1000-", 1000)
+        with pytest.raises(ValueError):
+            parse_range("bytes=10-5", 1000)
+    
+    def test_unsupported_ranges_ignored(self):
+        """Test that other units, multiple ranges and garbage send the whole file."""
+        assert parse_range("items=0-1", 1000) is None
+        assert parse_range("bytes=0-1,5-9", 1000) is None
+        assert parse_range("bytes=abc", 1000) is None
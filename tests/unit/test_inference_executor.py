@@ -0,0 +1,148 @@
+"""Unit tests for InferenceExecutor."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from src.services.inference_executor import InferenceExecutor
+from src.utils.exceptions import DeadlineExceededException, QueueFullException
+
+
+class TestInferenceExecutor:
+    """Test suite for InferenceExecutor."""
+    
+    def test_submit_returns_result(self):
+        """Test that submitted work runs and resolves its future."""
+        executor = InferenceExecutor(max_workers=1, max_queue_size=4)
+        future = executor.submit(lambda x, y: x + y, 2, y=3)
+        assert future.result(timeout=5) == 5
+        executor.shutdown()
+    
+    def test_run_awaits_result(self):
+        """Test awaiting work from the event loop."""
+        executor = InferenceExecutor(max_workers=1, max_queue_size=4)
+        result = asyncio.run(executor.run(lambda: "done"))
+        assert result == "done"
+        executor.shutdown()
+    
+    def test_exception_propagates(self):
+        """Test that worker exceptions are raised to the caller."""
+        executor = InferenceExecutor(max_workers=1, max_queue_size=4)
+        
+        def fail():
+            raise ValueError("boom")
+        
+        future = executor.submit(fail)
+        with pytest.raises(ValueError, match="boom"):
+            future.result(timeout=5)
+        stats = executor.get_stats()
+        assert stats["failed"] == 1
+        assert stats["completed"] == 0
+        executor.shutdown()
+    
+    def test_queue_full_rejects(self):
+        """Test backpressure when the pending queue is full."""
+        executor = InferenceExecutor(max_workers=1, max_queue_size=1)
+        started = threading.Event()
+        release = threading.Event()
+        
+        def block():
+            started.set()
+            release.wait(timeout=5)
+        
+        running = executor.submit(block)
+        assert started.wait(timeout=5)
+        queued = executor.submit(lambda: None)
+        
+        with pytest.raises(QueueFullException):
+            executor.submit(lambda: None)
+        
+        stats = executor.get_stats()
+        assert stats["active"] == 1
+        assert stats["queue_depth"] == 1
+        assert stats["rejected"] == 1
+        
+        release.set()
+        running.result(timeout=5)
+        queued.result(timeout=5)
+        executor.shutdown()
+    
+    def test_stats_track_wait_time(self):
+        """Test that completed work is reflected in statistics."""
+        executor = InferenceExecutor(max_workers=2, max_queue_size=8)
+        futures = [executor.submit(lambda: None) for _ in range(4)]
+        for future in futures:
+            future.result(timeout=5)
+        executor.shutdown()
+        
+        stats = executor.get_stats()
+        assert stats["completed"] == 4
+        assert stats["avg_wait_ms"] >= 0.0
+        assert stats["max_wait_ms"] >= stats["avg_wait_ms"]
+        
+        counters = executor.get_counters()
+        assert counters["completed"] == 4
+        assert counters["active"] == 0
+        assert counters["lanes"] == {"interactive": 0, "batch": 0}
+    
+    def test_invalid_configuration_raises_error(self):
+        """Test that invalid pool sizes raise ValueError."""
+        with pytest.raises(ValueError):
+            InferenceExecutor(max_workers=0)
+        with pytest.raises(ValueError):
+            InferenceExecutor(max_queue_size=0)
+    
+    def test_schedule_prefers_interactive_lane(self):
+        """Test that queued interactive work overtakes queued batch work."""
+        executor = InferenceExecutor(max_workers=1, max_queue_size=4)
+        started = threading.Event()
+        release = threading.Event()
+        order = []
+        
+        def block():
+            started.set()
+            release.wait(timeout=5)
+        
+        running = executor.submit(block)
+        assert started.wait(timeout=5)
+        futures = [
+            executor.schedule(order.append, args=("batch",), lane="batch"),
+            executor.schedule(order.append, args=("interactive",), lane="interactive"),
+        ]
+        
+        release.set()
+        running.result(timeout=5)
+        for future in futures:
+            future.result(timeout=5)
+        executor.shutdown()
+        
+        assert order == ["interactive", "batch"]
+        lanes = executor.get_stats()["lanes"]
+        assert lanes["batch"]["dispatched"] == 1
+        assert lanes["interactive"]["latency_p99_ms"] > 0.0
+    
+    def test_schedule_deadline_exceeded(self):
+        """Test that work waiting past its deadline fails without running."""
+        executor = InferenceExecutor(max_workers=1, max_queue_size=4)
+        started = threading.Event()
+        release = threading.Event()
+        ran = []
+        
+        def block():
+            started.set()
+            release.wait(timeout=5)
+        
+        running = executor.submit(block)
+        assert started.wait(timeout=5)
+        late = executor.schedule(ran.append, args=("late",), timeout=0.01)
+        time.sleep(0.05)
+        release.set()
+        
+        with pytest.raises(DeadlineExceededException):
+            late.result(timeout=5)
+        running.result(timeout=5)
+        executor.shutdown()
+        
+        assert ran == []
+        assert executor.get_stats()["expired"] == 1
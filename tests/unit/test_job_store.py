@@ -0,0 +1,54 @@
+"""Unit tests for the job store."""
+
+from src.services.job_store import (
+    JOB_COMPLETED,
+    JOB_PROCESSING,
+    InMemoryJobStore,
+    Job,
+)
+
+
+class TestInMemoryJobStore:
+    """Test suite for InMemoryJobStore."""
+    
+    def test_create_and_get(self):
+        """Test storing and retrieving a job."""
+        store = InMemoryJobStore()
+        store.create(Job(job_id="a", chunks_total=3))
+        
+        job = store.get("a")
+        assert job.status == "queued"
+        assert job.chunks_total == 3
+        assert store.get("missing") is None
+    
+    def test_update(self):
+        """Test updating fields and the update timestamp."""
+        store = InMemoryJobStore()
+        store.create(Job(job_id="a"))
+        before = store.get("a").updated_at
+        
+        store.update("a", status=JOB_PROCESSING, chunks_done=2)
+        job = store.get("a")
+        assert job.status == JOB_PROCESSING
+        assert job.chunks_done == 2
+        assert job.updated_at >= before
+    
+    def test_get_returns_snapshot(self):
+        """Test that returned jobs do not change after later updates."""
+        store = InMemoryJobStore()
+        store.create(Job(job_id="a"))
+        snapshot = store.get("a")
+        
+        store.update("a", chunks_done=5)
+        assert snapshot.chunks_done == 0
+    
+    def test_evicts_oldest_finished_jobs(self):
+        """Test that only finished jobs are dropped when over capacity."""
+        store = InMemoryJobStore(max_jobs=2)
+        store.create(Job(job_id="running"))
+        store.create(Job(job_id="done", status=JOB_COMPLETED))
+        store.create(Job(job_id="new"))
+        
+        assert len(store) == 2
+        assert store.get("done") is None
+        assert store.get("running") is not None
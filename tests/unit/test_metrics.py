@@ -0,0 +1,117 @@
+"""Unit tests for the metrics registry."""
+
+import json
+import os
+import threading
+
+from src.utils.metrics import AGGREGATE_MAX, MetricsRegistry, ratio_of
+
+
+def _write_process(directory, pid, metrics):
+    """Write a snapshot file as another worker process would."""
+    payload = {"pid": pid, "written_at": 0, "metrics": metrics}
+    (directory / f"metrics-{pid}.json").write_text(json.dumps(payload))
+
+
+class TestMetricsRegistry:
+    """Test suite for MetricsRegistry."""
+
+    def test_counter_merges_thread_shards(self):
+        """Test that increments from many threads are all counted."""
+        registry = MetricsRegistry()
+        requests = registry.counter("requests_total", "Requests", ("route",))
+
+        def work():
+            for _ in range(1000):
+                requests.inc(("/a",))
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        requests.inc(("/b",), 2.5)
+
+        assert registry.snapshot()["requests_total"] == {("/a",): 4000, ("/b",): 2.5}
+        text = registry.render()
+        assert "# TYPE requests_total counter" in text
+        assert 'requests_total{route="/a"} 4000' in text
+        assert 'requests_total{route="/b"} 2.5' in text
+
+    def test_histogram_exposition(self):
+        """Test cumulative buckets, sum and count."""
+        registry = MetricsRegistry()
+        latency = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.7, 3.0):
+            latency.observe(value)
+
+        lines = registry.render().splitlines()
+        assert 'latency_seconds_bucket{le="0.1"} 1' in lines
+        assert 'latency_seconds_bucket{le="1"} 3' in lines
+        assert 'latency_seconds_bucket{le="+Inf"} 4' in lines
+        assert "latency_seconds_sum 4.25" in lines
+        assert "latency_seconds_count 4" in lines
+
+    def test_collectors_and_derived_gauges(self):
+        """Test that collectors run at read time and ratios derive from counters."""
+        registry = MetricsRegistry()
+        depth = registry.gauge("queue_depth", "Queue depth")
+        lookups = registry.counter("lookups_total", "Lookups", ("result",))
+        registry.gauge(
+            "hit_ratio",
+            "Hit ratio",
+            derive=ratio_of(
+                "lookups_total",
+                "lookups_total",
+                numerator_filter=lambda labels: labels[0] == "hit",
+                group_by=lambda labels: ()
+            )
+        )
+        queue = [1, 2, 3]
+
+        def collect():
+            depth.set(len(queue))
+            lookups.set(3, ("hit",))
+            lookups.set(1, ("miss",))
+
+        registry.add_collector(collect)
+        lines = registry.render().splitlines()
+        assert "queue_depth 3" in lines
+        assert "hit_ratio 0.75" in lines
+
+    def test_label_escaping(self):
+        """Test that label values are escaped."""
+        registry = MetricsRegistry()
+        registry.counter("errors_total", "Errors", ("message",)).inc(('say "hi"\n',))
+        assert 'errors_total{message="say \\"hi\\"\\n"} 1' in registry.render()
+
+    def test_multiprocess_aggregation(self, tmp_path):
+        """Test that counters sum over all workers and gauges over live ones."""
+        registry = MetricsRegistry(multiproc_dir=str(tmp_path))
+        requests = registry.counter("requests_total", "Requests")
+        latency = registry.histogram("latency_seconds", "Latency", buckets=(1.0,))
+        depth = registry.gauge("queue_depth", "Queue depth")
+        disk = registry.gauge("disk_bytes", "Disk usage", aggregate=AGGREGATE_MAX)
+        requests.inc(amount=2)
+        latency.observe(0.5)
+        registry.add_collector(lambda: (depth.set(1), disk.set(100)))
+
+        # A live sibling worker and one that has exited
+        _write_process(tmp_path, os.getppid(), {
+            "requests_total": [[[], 3]],
+            "latency_seconds": [[[], [0, 1, 2.0]]],
+            "queue_depth": [[[], 4]],
+            "disk_bytes": [[[], 100]],
+        })
+        _write_process(tmp_path, 2 ** 22 + 1, {
+            "requests_total": [[[], 5]],
+            "queue_depth": [[[], 7]],
+        })
+
+        lines = registry.render().splitlines()
+        assert "requests_total 10" in lines
+        assert 'latency_seconds_bucket{le="1"} 1' in lines
+        assert "latency_seconds_count 2" in lines
+        assert "queue_depth 5" in lines
+        assert "disk_bytes 100" in lines
+        assert (tmp_path / f"metrics-{os.getpid()}.json").exists()
@@ -0,0 +1,102 @@
+"""Unit tests for MicroBatchScheduler."""
+
+import threading
+
+import pytest
+from src.services.micro_batcher import MicroBatchScheduler
+
+
+class RecordingModel:
+    """Batched entry point that records each invocation."""
+    
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+    
+    def __call__(self, texts, emotion, intensity):
+        with self.lock:
+            self.calls.append((list(texts), emotion, intensity))
+        return [f"{emotion}:{text}" for text in texts]
+
+
+class TestMicroBatchScheduler:
+    """Test suite for MicroBatchScheduler."""
+    
+    def test_results_returned_to_callers(self):
+        """Test that each caller gets its own outputs in order."""
+        model = RecordingModel()
+        scheduler = MicroBatchScheduler(model, max_batch_size=4, max_wait_ms=5)
+        
+        assert scheduler.synthesize_batch(["a", "b"], emotion="sad") == ["sad:a", "sad:b"]
+        scheduler.shutdown()
+    
+    def test_concurrent_callers_share_batch(self):
+        """Test that texts submitted within the wait window run together."""
+        model = RecordingModel()
+        scheduler = MicroBatchScheduler(model, max_batch_size=8, max_wait_ms=200)
+        
+        futures = []
+        for text in ["a", "b", "c"]:
+            futures.extend(scheduler.submit([text], emotion="neutral", intensity=0.5))
+        
+        assert [f.result(timeout=5) for f in futures] == ["neutral:a", "neutral:b", "neutral:c"]
+        assert len(model.calls) == 1
+        assert scheduler.get_stats()["fill_ratio"] == pytest.approx(3 / 8)
+        scheduler.shutdown()
+    
+    def test_full_batch_runs_without_waiting(self):
+        """Test that a full batch is dispatched before the wait expires."""
+        model = RecordingModel()
+        scheduler = MicroBatchScheduler(model, max_batch_size=2, max_wait_ms=60000)
+        
+        futures = scheduler.submit(["a", "b", "c", "d"])
+        assert [f.result(timeout=5) for f in futures] == [
+            "neutral:a", "neutral:b", "neutral:c", "neutral:d"
+        ]
+        assert [len(call[0]) for call in model.calls] == [2, 2]
+        scheduler.shutdown()
+    
+    def test_incompatible_requests_not_mixed(self):
+        """Test that different emotions or intensities use separate batches."""
+        model = RecordingModel()
+        scheduler = MicroBatchScheduler(model, max_batch_size=8, max_wait_ms=50)
+        
+        futures = (
+            scheduler.submit(["a"], emotion="sad")
+            + scheduler.submit(["b"], emotion="excited")
+            + scheduler.submit(["c"], emotion="sad", intensity=0.9)
+        )
+        assert [f.result(timeout=5) for f in futures] == ["sad:a", "excited:b", "sad:c"]
+        assert len(model.calls) == 3
+        scheduler.shutdown()
+    
+    def test_exception_propagates(self):
+        """Test that a failing batch fails every caller in it."""
+        def fail(texts, emotion, intensity):
+            raise ValueError("boom")
+        
+        scheduler = MicroBatchScheduler(fail, max_batch_size=4, max_wait_ms=1)
+        with pytest.raises(ValueError, match="boom"):
+            scheduler.synthesize_batch(["a"])
+        assert scheduler.get_stats()["failed_batches"] == 1
+        scheduler.shutdown()
+    
+    def test_stats(self):
+        """Test that batch metrics are reported."""
+        scheduler = MicroBatchScheduler(RecordingModel(), max_batch_size=2, max_wait_ms=1)
+        scheduler.synthesize_batch(["a", "b"])
+        
+        stats = scheduler.get_stats()
+        assert stats["batches"] == 1
+        assert stats["items"] == 2
+        assert stats["fill_ratio"] == 1.0
+        assert stats["avg_queue_wait_ms"] >= 0
+        assert stats["avg_batch_latency_ms"] >= 0
+        scheduler.shutdown()
+    
+    def test_submit_after_shutdown_raises(self):
+        """Test that a shut-down scheduler rejects work."""
+        scheduler = MicroBatchScheduler(RecordingModel())
+        scheduler.shutdown()
+        with pytest.raises(RuntimeError):
+            scheduler.submit(["a"])
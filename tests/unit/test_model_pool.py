@@ -0,0 +1,291 @@
+"""Unit tests for the model pool and per-request model selection."""
+
+import asyncio
+import threading
+import time
+
+import numpy as np
+import pytest
+from config.settings import Settings
+from src.core.model_pool import ModelPool
+from src.core.tts_engine import MODEL_BACKENDS, TTSEngine
+from src.models.base import BaseTTSModel
+from src.models.reference import ReferenceTTSModel
+from src.services.speech_service import BatchItem, SpeechService
+
+
+class _FakeModel(BaseTTSModel):
+    """Model that records loads and can hold its load until released."""
+
+    def __init__(self, name: str, footprint: int = 0):
+        super().__init__()
+        self.model_name = name
+        self.footprint = footprint
+        self.loads = 0
+        self.unloads = 0
+        self.release_load = threading.Event()
+        self.release_load.set()
+
+    def load_model(self) -> None:
+        self.release_load.wait(timeout=5)
+        self.loads += 1
+        self.is_loaded = True
+
+    def unload_model(self) -> None:
+        self.unloads += 1
+        super().unload_model()
+
+    def memory_footprint(self) -> int:
+        return self.footprint
+
+    def synthesize(self, text, emotion="neutral", intensity=0.5, **kwargs):
+        return np.zeros(len(text), dtype=np.float32)
+
+    def get_sample_rate(self) -> int:
+        return 16000
+
+
+class AltReferenceModel(ReferenceTTSModel):
+    """A second backend for selection tests (the tree ships one real backend)."""
+
+    model_name = "reference_alt"
+
+    def __init__(self, device: str = "cpu"):
+        super().__init__(device=device, sample_rate=16000)
+
+
+class SlowReferenceModel(ReferenceTTSModel):
+    """A backend whose load takes a noticeable time."""
+
+    model_name = "reference_slow"
+
+    def load_model(self) -> None:
+        time.sleep(0.5)
+        super().load_model()
+
+
+def _make_pool(budget: int, sizes=None, footprints=None):
+    """Pool of fake models; returns the pool and the created models by name."""
+    models = {}
+
+    def factory(name):
+        models[name] = _FakeModel(name, (footprints or {}).get(name, 0))
+        return models[name]
+
+    return ModelPool(factory, memory_budget_bytes=budget, sizes=sizes), models
+
+
+class TestModelPool:
+    """Test suite for ModelPool."""
+
+    def test_evicts_least_recently_used(self):
+        """Test that loading past the budget unloads the least recently used model."""
+        pool, models = _make_pool(250, sizes={"a": 100, "b": 100, "c": 100})
+        pool.load("a")
+        pool.load("b")
+        with pool.acquire("a"):
+            pass
+
+        pool.load("c")
+        assert pool.resident() == ["a", "c"]
+        assert models["b"].unloads == 1
+
+        stats = pool.get_stats()
+        assert stats["evictions"] == 1
+        assert stats["resident_bytes"] == 200
+        assert stats["misses"] == 3
+        assert stats["hits"] == 1
+
+    def test_measured_footprint(self):
+        """Test that undeclared sizes are measured after loading."""
+        pool, _ = _make_pool(150, footprints={"a": 100, "b": 100})
+        pool.load("a")
+        assert pool.get_stats()["models"]["a"]["size_bytes"] == 100
+
+        pool.load("b")
+        assert pool.resident() == ["b"]
+
+    def test_in_use_model_not_evicted(self):
+        """Test that a load waits for a pinned model instead of evicting it."""
+        pool, models = _make_pool(100, sizes={"a": 100, "b": 100})
+        release = threading.Event()
+        pinned = threading.Event()
+
+        def hold_a():
+            with pool.acquire("a"):
+                pinned.set()
+                release.wait(timeout=5)
+
+        holder = threading.Thread(target=hold_a)
+        holder.start()
+        pinned.wait(timeout=5)
+        loader = threading.Thread(target=pool.load, args=("b",))
+        loader.start()
+
+        time.sleep(0.1)
+        assert models["a"].is_loaded
+        assert not models["b"].is_loaded
+
+        release.set()
+        holder.join(timeout=5)
+        loader.join(timeout=5)
+        assert pool.resident() == ["b"]
+
+    def test_concurrent_measured_loads_do_not_deadlock(self):
+        """Test that concurrent loads that end up over budget do not wait on each other."""
+        pool, models = _make_pool(150, footprints={"a": 100, "b": 100})
+        # Measure both sizes, then reload both at once: each load starts
+        # before the other model is resident and ends after it is
+        pool.load("a")
+        pool.load("b")
+        pool.unload_all()
+        barrier = threading.Barrier(2)
+
+        def synchronized(load):
+            barrier.wait(timeout=5)
+            load()
+            barrier.wait(timeout=5)
+
+        for name in ("a", "b"):
+            model = pool.get(name)
+            model.load_model = lambda load=model.load_model: synchronized(load)
+
+        loaders = [
+            threading.Thread(target=pool.load, args=(name,), daemon=True) for name in ("a", "b")
+        ]
+        for loader in loaders:
+            loader.start()
+        for loader in loaders:
+            loader.join(timeout=5)
+
+        assert not any(loader.is_alive() for loader in loaders)
+        assert all(model.loads == 2 for model in models.values())
+        assert pool.resident()
+
+    def test_load_does_not_block_resident_models(self):
+        """Test that requests for a resident model proceed while another loads."""
+        pool, models = _make_pool(0)
+        pool.load("a")
+        pool.get("b").release_load.clear()
+
+        loader = threading.Thread(target=pool.load, args=("b",))
+        loader.start()
+        time.sleep(0.05)
+
+        start = time.perf_counter()
+        with pool.acquire("a") as model:
+            assert model is models["a"]
+        assert time.perf_counter() - start < 0.05
+        assert not models["b"].is_loaded
+
+        models["b"].release_load.set()
+        loader.join(timeout=5)
+        assert models["b"].is_loaded
+
+    def test_concurrent_acquires_load_once(self):
+        """Test that simultaneous first requests share one load."""
+        pool, models = _make_pool(0)
+        threads = [threading.Thread(target=pool.load, args=("a",)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert models["a"].loads == 1
+
+
+class TestModelSelection:
+    """Test suite for per-request model selection."""
+
+    @pytest.fixture
+    def settings(self, tmp_path, monkeypatch):
+        """Settings with a second model enabled and room for one resident model."""
+        monkeypatch.setitem(
+            MODEL_BACKENDS, "reference_alt", ("tests.unit.test_model_pool", "AltReferenceModel")
+        )
+        return Settings(
+            model_name="reference",
+            enabled_models=["reference_alt"],
+            model_memory_budget_bytes=100,
+            model_memory_bytes={"reference": 100, "reference_alt": 100},
+            audio_output_dir=str(tmp_path)
+        )
+
+    def test_engine_routes_to_selected_model(self, settings):
+        """Test that each request is served by the model it names."""
+        engine = TTSEngine(settings)
+        default = engine.synthesize("abc", emotion="sad")
+        selected = engine.synthesize("abc", emotion="sad", model="reference_alt")
+
+        assert len(default) / engine.get_sample_rate() == pytest.approx(
+            len(selected) / engine.get_sample_rate("reference_alt")
+        )
+        assert engine.get_sample_rate("reference_alt") == 16000
+        assert engine.get_pool_stats()["resident"] == ["reference_alt"]
+
+        with pytest.raises(ValueError):
+            engine.synthesize("abc", model="bark")
+
+    def test_service_results_name_the_model(self, settings):
+        """Test that results, cache keys and rates follow the selected model."""
+        service = SpeechService(settings)
+        try:
+            default = asyncio.run(service.synthesize("A short line.", sample_rate=22050))
+            selected = asyncio.run(
+                service.synthesize("A short line.", sample_rate=22050, model="reference_alt")
+            )
+            assert default.model_name == "reference"
+            assert selected.model_name == "reference_alt"
+            assert not selected.cached
+            assert selected.duration == pytest.approx(default.duration, abs=0.01)
+            assert service.get_stats()["models"]["evictions"] == 1
+        finally:
+            service.shutdown()
+
+    def test_batch_names_each_items_model(self, settings):
+        """Test that a batch names one model only when all its items used it."""
+        service = SpeechService(settings)
+        try:
+            mixed = asyncio.run(service.synthesize_batch([
+                BatchItem(text="A line for the default model."),
+                BatchItem(text="A line for the other model.", model="reference_alt")
+            ]))
+            assert [item.result.model_name for item in mixed.items] == ["reference", "reference_alt"]
+            assert mixed.model_name is None
+
+            single = asyncio.run(service.synthesize_batch([
+                BatchItem(text="Only the other model.", model="reference_alt")
+            ]))
+            assert single.model_name == "reference_alt"
+        finally:
+            service.shutdown()
+
+    def test_cold_load_does_not_hold_up_other_models(self, tmp_path, monkeypatch):
+        """Test that requests for a resident model are served while another loads."""
+        monkeypatch.setitem(
+            MODEL_BACKENDS, "reference_slow", ("tests.unit.test_model_pool", "SlowReferenceModel")
+        )
+        service = SpeechService(Settings(
+            model_name="reference",
+            enabled_models=["reference_slow"],
+            microbatch_enabled=True,
+            cache_enabled=False,
+            audio_output_dir=str(tmp_path)
+        ))
+        try:
+            service.tts_engine.load_model()
+            loader = threading.Thread(
+                target=asyncio.run,
+                args=(service.synthesize("Waiting for a cold model.", model="reference_slow"),)
+            )
+            loader.start()
+            time.sleep(0.1)
+
+            start = time.perf_counter()
+            asyncio.run(service.synthesize("Served by the resident model."))
+            assert time.perf_counter() - start < 0.3
+            assert not service.tts_engine.get_model("reference_slow").is_loaded
+
+            loader.join(timeout=5)
+            assert service.tts_engine.get_model("reference_slow").is_loaded
+        finally:
+            service.shutdown()
@@ -0,0 +1,158 @@
+"""Unit tests for rate limiters."""
+
+import pytest
+from src.services.rate_limiter import (
+    InMemoryRateLimiter,
+    InMemoryStore,
+    SharedStoreRateLimiter,
+    text_cost,
+)
+
+
+class FakeClock:
+    """Manually advanced time source."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Provide a fake clock."""
+    return FakeClock()
+
+
+@pytest.fixture(params=["memory", "shared"])
+def make_limiter(request, clock):
+    """Provide a factory for each limiter backend."""
+    def make(capacity, refill_per_second):
+        if request.param == "memory":
+            return InMemoryRateLimiter(capacity, refill_per_second, clock=clock)
+        return SharedStoreRateLimiter(
+            InMemoryStore(clock=clock), capacity, refill_per_second, clock=clock
+        )
+    return make
+
+
+class TestRateLimiter:
+    """Test suite shared by all rate limiter backends."""
+    
+    def test_burst_then_deny(self, make_limiter):
+        """Test that a full bucket allows a burst and then denies."""
+        limiter = make_limiter(capacity=3, refill_per_second=1.0)
+        for _ in range(3):
+            assert limiter.acquire("client").allowed
+        
+        decision = limiter.acquire("client")
+        assert not decision.allowed
+        assert decision.retry_after == pytest.approx(1.0)
+    
+    def test_refill_over_time(self, make_limiter, clock):
+        """Test that tokens come back at the refill rate."""
+        limiter = make_limiter(capacity=2, refill_per_second=0.5)
+        assert limiter.acquire("client", cost=2).allowed
+        
+        clock.now += 1.0
+        assert not limiter.acquire("client").allowed
+        clock.now += 1.0
+        decision = limiter.acquire("client")
+        assert decision.allowed
+        assert decision.remaining == pytest.approx(0.0)
+    
+    def test_refill_capped_at_capacity(self, make_limiter, clock):
+        """Test that idle time does not accumulate beyond the burst size."""
+        limiter = make_limiter(capacity=2, refill_per_second=1.0)
+        limiter.acquire("client")
+        clock.now += 3600
+        
+        assert limiter.acquire("client", cost=2).allowed
+        assert not limiter.acquire("client").allowed
+    
+    def test_keys_are_independent(self, make_limiter):
+        """Test that one client's usage does not affect another."""
+        limiter = make_limiter(capacity=1, refill_per_second=1.0)
+        assert limiter.acquire("a").allowed
+        assert not limiter.acquire("a").allowed
+        assert limiter.acquire("b").allowed
+    
+    def test_cost_capped_at_capacity(self, make_limiter):
+        """Test that a request costing more than the bucket can still pass."""
+        limiter = make_limiter(capacity=5, refill_per_second=1.0)
+        assert limiter.acquire("client", cost=50).allowed
+        assert limiter.acquire("client").retry_after == pytest.approx(1.0)
+    
+    def test_invalid_configuration(self):
+        """Test that non-positive limits are rejected."""
+        with pytest.raises(ValueError):
+            InMemoryRateLimiter(capacity=0, refill_per_second=1.0)
+        with pytest.raises(ValueError):
+            InMemoryRateLimiter(capacity=1, refill_per_second=0)
+
+
+class TestInMemoryRateLimiter:
+    """Test suite for InMemoryRateLimiter."""
+    
+    def test_evicts_least_recently_used(self, clock):
+        """Test that the number of buckets is bounded."""
+        limiter = InMemoryRateLimiter(1, 1.0, clock=clock, max_keys=2)
+        limiter.acquire("a")
+        limiter.acquire("b")
+        limiter.acquire("a")
+        limiter.acquire("c")
+        
+        assert len(limiter) == 2
+        # "b" was dropped and starts over with a full bucket
+        assert limiter.acquire("b").allowed
+
+
+class TestSharedStoreRateLimiter:
+    """Test suite for SharedStoreRateLimiter."""
+    
+    def test_limit_shared_between_instances(self, clock):
+        """Test that limiters on the same store enforce one limit."""
+        store = InMemoryStore(clock=clock)
+        first = SharedStoreRateLimiter(store, 2, 1.0, clock=clock)
+        second = SharedStoreRateLimiter(store, 2, 1.0, clock=clock)
+        
+        assert first.acquire("client").allowed
+        assert second.acquire("client").allowed
+        assert not first.acquire("client").allowed
+    
+    def test_idle_buckets_expire(self, clock):
+        """Test that buckets leave the store once fully refilled."""
+        store = InMemoryStore(clock=clock)
+        limiter = SharedStoreRateLimiter(store, 4, 2.0, clock=clock)
+        limiter.acquire("client")
+        assert store.get("client") is not None
+        
+        clock.now += 2.0
+        assert store.get("client") is None
+    
+    def test_conflicting_updates_deny(self, clock):
+        """Test that persistent write conflicts deny instead of over-admitting."""
+        class ConflictingStore(InMemoryStore):
+            def compare_and_set(self, key, expected, value, ttl):
+                return False
+        
+        limiter = SharedStoreRateLimiter(ConflictingStore(clock=clock), 2, 1.0, clock=clock)
+        decision = limiter.acquire("client")
+        assert not decision.allowed
+        assert decision.retry_after == pytest.approx(1.0)
+
+
+class TestTextCost:
+    """Test suite for text_cost."""
+    
+    def test_cost_by_length(self):
+        """Test that longer texts cost more tokens."""
+        assert text_cost(0, 500) == 1.0
+        assert text_cost(500, 500) == 1.0
+        assert text_cost(501, 500) == 2.0
+        assert text_cost(5000, 500) == 10.0
+    
+    def test_flat_cost(self):
+        """Test that zero characters per token charges per request."""
+        assert text_cost(5000, 0) == 1.0
@@ -0,0 +1,65 @@
+"""Unit tests for the reference TTS model."""
+
+import time
+
+import numpy as np
+import pytest
+from config.settings import Settings
+from src.core.tts_engine import TTSEngine
+from src.models.reference import ReferenceTTSModel
+
+
+class TestReferenceTTSModel:
+    """Test suite for ReferenceTTSModel."""
+
+    def test_length_per_character(self):
+        """Test that output length is fixed per character."""
+        model = ReferenceTTSModel(sample_rate=16000, seconds_per_char=0.05)
+        audio = model.synthesize("Hello, world.")
+        assert audio.dtype == np.float32
+        assert len(audio) == 13 * 800
+        assert np.abs(audio).max() <= 1.0
+        assert len(model.synthesize("")) == 0
+
+    def test_deterministic(self):
+        """Test that the same text always renders the same audio."""
+        text = "Deterministic output, every time."
+        first = ReferenceTTSModel().synthesize(text)
+        assert np.array_equal(first, ReferenceTTSModel().synthesize(text))
+        assert not np.array_equal(first, ReferenceTTSModel().synthesize(text.upper() + "!"))
+
+    def test_voiced_and_silent_segments(self):
+        """Test that vowels carry energy and spaces are silent."""
+        model = ReferenceTTSModel(seconds_per_char=0.02)
+        audio = model.synthesize("a a").reshape(3, -1)
+        assert np.abs(audio[0]).max() > 0.1
+        assert np.abs(audio[1]).max() == 0.0
+        assert np.array_equal(audio[0], audio[2])
+
+    def test_simulated_latency(self):
+        """Test that batches pay the per-call latency once."""
+        model = ReferenceTTSModel(latency_ms=30.0)
+        start = time.perf_counter()
+        results = model.synthesize_batch(["one", "two", "three"])
+        elapsed = time.perf_counter() - start
+        assert [len(r) for r in results] == [len(model.synthesize(t)) for t in ("one", "two", "three")]
+        assert 0.03 <= elapsed < 0.09
+
+    def test_selected_by_settings(self, tmp_path):
+        """Test that the engine builds the model from settings."""
+        settings = Settings(
+            model_name="reference",
+            reference_sample_rate=22050,
+            reference_seconds_per_char=0.1,
+            audio_output_dir=str(tmp_path)
+        )
+        engine = TTSEngine(settings)
+        assert engine.get_sample_rate() == 22050
+        assert not engine.supports_native_emotion()
+        assert len(engine.synthesize("abc", emotion="sad")) == 3 * 2205
+
+    def test_unsupported_emotion(self):
+        """Test that unknown emotions are rejected by the engine."""
+        engine = TTSEngine(Settings(model_name="reference"))
+        with pytest.raises(ValueError):
+            engine.synthesize("abc", emotion="bored")
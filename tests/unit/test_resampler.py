@@ -0,0 +1,51 @@
+"""Unit tests for the polyphase resampler."""
+
+import pytest
+import numpy as np
+from scipy import signal
+from src.core.resampler import PolyphaseResampler, get_resampler
+
+
+RATE_PAIRS = [(24000, 44100), (44100, 16000), (16000, 22050), (22050, 24000)]
+
+
+class TestPolyphaseResampler:
+    """Test suite for PolyphaseResampler."""
+    
+    @pytest.mark.parametrize("orig_sr,target_sr", RATE_PAIRS)
+    def test_matches_resample_poly(self, orig_sr, target_sr):
+        """Test that output matches scipy's resample_poly."""
+        audio = np.random.randn(5000)
+        expected = signal.resample_poly(audio, target_sr, orig_sr)
+        result = get_resampler(orig_sr, target_sr).process(audio)
+        assert len(result) == len(expected)
+        assert np.allclose(result, expected, atol=1e-9)
+    
+    @pytest.mark.parametrize("block_size", [1, 97, 4096])
+    def test_blocks_match_whole_signal(self, block_size):
+        """Test that block processing gives the same output as one pass."""
+        resampler = get_resampler(24000, 44100)
+        audio = np.random.randn(10000)
+        blocks = (audio[i:i + block_size] for i in range(0, len(audio), block_size))
+        
+        result = np.concatenate(list(resampler.process_blocks(blocks)))
+        assert np.allclose(result, resampler.process(audio), atol=1e-9)
+    
+    def test_output_length(self):
+        """Test output length for a rate change."""
+        resampler = PolyphaseResampler(24000, 16000)
+        assert len(resampler.process(np.zeros(2400))) == 1600
+    
+    def test_preserves_float32(self):
+        """Test that float32 input produces float32 output."""
+        result = get_resampler(24000, 16000).process(np.zeros(100, dtype=np.float32))
+        assert result.dtype == np.float32
+    
+    def test_filters_are_cached(self):
+        """Test that resamplers are shared per rate pair."""
+        assert get_resampler(24000, 16000) is get_resampler(24000, 16000)
+    
+    def test_invalid_rate_raises_error(self):
+        """Test that non-positive rates raise ValueError."""
+        with pytest.raises(ValueError):
+            PolyphaseResampler(0, 16000)
@@ -0,0 +1,151 @@
+"""Unit tests for the content-addressed synthesis cache."""
+
+from src.core.audio_index import AudioIndex
+from src.core.synthesis_cache import ContentCache, make_cache_key, quantize, shard_path
+
+
+class TestCacheKey:
+    """Test suite for cache key helpers."""
+    
+    def test_key_is_order_independent(self):
+        """Test that keyword order does not change the key."""
+        key_a = make_cache_key(text="Hello", emotion="sad", options={"a": 1, "b": 2})
+        key_b = make_cache_key(options={"b": 2, "a": 1}, emotion="sad", text="Hello")
+        assert key_a == key_b
+    
+    def test_key_changes_with_parameters(self):
+        """Test that any parameter change produces a new key."""
+        base = make_cache_key(text="Hello", emotion="sad")
+        assert base != make_cache_key(text="Hello", emotion="excited")
+        assert base != make_cache_key(text="Hello!", emotion="sad")
+    
+    def test_quantize(self):
+        """Test intensity quantization."""
+        assert quantize(0.52, 0.05) == 0.5
+        assert quantize(0.53, 0.05) == 0.55
+        assert quantize(0.53, 0.0) == 0.53
+
+
+class TestShardPath:
+    """Test suite for shard_path."""
+    
+    def test_two_level_prefix(self, tmp_path):
+        """Test that files are nested under their leading characters."""
+        path = shard_path(tmp_path, "0f3a9c21-7d.wav")
+        assert path == tmp_path / "0f" / "3a" / "0f3a9c21-7d.wav"
+    
+    def test_short_names_stay_flat(self, tmp_path):
+        """Test that names too short to shard are not nested."""
+        assert shard_path(tmp_path, "abc.wav") == tmp_path / "abc.wav"
+    
+    def test_cache_writes_sharded(self, tmp_path):
+        """Test that cache entries are stored in the sharded layout."""
+        key = make_cache_key(text="hello")
+        path = ContentCache(tmp_path).store(key, "wav", b"data")
+        assert path == tmp_path / key[:2] / key[2:4] / f"{key}.wav"
+        assert path.read_bytes() == b"data"
+
+
+class TestContentCache:
+    """Test suite for ContentCache."""
+    
+    def test_miss_then_hit(self, tmp_path):
+        """Test that stored entries are found on lookup."""
+        cache = ContentCache(tmp_path)
+        assert cache.lookup("abc", "wav") is None
+        
+        path = cache.store("abc", "wav", b"audio-bytes")
+        assert path.read_bytes() == b"audio-bytes"
+        assert cache.lookup("abc", "wav") == path
+        
+        stats = cache.get_stats()
+        assert stats["misses"] == 1
+        assert stats["memory_hits"] == 1
+    
+    def test_disk_hit_after_restart(self, tmp_path):
+        """Test that a fresh cache finds entries written earlier."""
+        ContentCache(tmp_path).store("abc", "wav", b"audio-bytes")
+        
+        cache = ContentCache(tmp_path)
+        assert cache.load("abc", "wav") == b"audio-bytes"
+        assert cache.get_stats()["disk_hits"] == 1
+        
+        # Promoted into memory on load
+        cache.load("abc", "wav")
+        assert cache.get_stats()["memory_hits"] == 1
+    
+    def test_memory_hit_restores_deleted_file(self, tmp_path):
+        """Test that a memory hit rewrites a file removed from disk."""
+        cache = ContentCache(tmp_path)
+        path = cache.store("abc", "wav", b"audio-bytes")
+        path.unlink()
+        
+        assert cache.lookup("abc", "wav") == path
+        assert path.read_bytes() == b"audio-bytes"
+    
+    def test_memory_budget_evicts_lru(self, tmp_path):
+        """Test that the memory tier stays within its byte budget."""
+        cache = ContentCache(tmp_path, memory_budget_bytes=10)
+        cache.store("a", "wav", b"12345")
+        cache.store("b", "wav", b"12345")
+        cache.load("a", "wav")  # a becomes most recently used
+        cache.store("c", "wav", b"12345")
+        
+        stats = cache.get_stats()
+        assert stats["memory_bytes"] <= 10
+        assert stats["evictions"] == 1
+        
+        # b was evicted from memory but is still on disk
+        assert cache.load("b", "wav") == b"12345"
+        assert cache.get_stats()["disk_hits"] == 1
+    
+    def test_oversized_entry_skips_memory(self, tmp_path):
+        """Test that entries larger than the budget are disk-only."""
+        cache = ContentCache(tmp_path, memory_budget_bytes=4)
+        cache.store("big", "wav", b"123456789")
+        assert cache.get_stats()["memory_entries"] == 0
+        assert cache.lookup("big", "wav") is not None
+    
+    def test_remember_is_memory_only(self, tmp_path):
+        """Test that remembered entries are written to disk only on lookup."""
+        cache = ContentCache(tmp_path)
+        cache.remember("abc", "wav", b"inline")
+        path = cache.path_for("abc", "wav")
+
+        assert cache.load("abc", "wav") == b"inline"
+        assert not path.exists()
+        assert cache.lookup("abc", "wav") == path
+        assert path.read_bytes() == b"inline"
+
+    def test_peek_reads_memory_only(self, tmp_path):
+        """Test that peek answers from memory and leaves misses to load."""
+        cache = ContentCache(tmp_path, memory_budget_bytes=1024)
+        cache.store("abc", "wav", b"12345")
+        assert cache.peek("abc", "wav") == b"12345"
+        assert cache.peek("abc", "wav", max_bytes=4) is None
+        
+        restarted = ContentCache(tmp_path)
+        assert restarted.peek("abc", "wav") is None
+        assert restarted.get_stats()["misses"] == 0
+        assert restarted.load("abc", "wav") == b"12345"
+    
+    def test_store_file_streams_to_disk(self, tmp_path):
+        """Test that entries can be written directly into the cache file."""
+        cache = ContentCache(tmp_path)
+        path = cache.store_file("abc", "wav", lambda f: f.write(b"streamed"))
+        
+        assert path.read_bytes() == b"streamed"
+        assert cache.get_stats()["memory_entries"] == 1
+    
+    def test_index_records_writes_and_hits(self, tmp_path):
+        """Test that writes and hits are recorded in the audio index."""
+        now = [100.0]
+        index = AudioIndex(tmp_path, clock=lambda: now[0])
+        cache = ContentCache(tmp_path / "chunks", index=index)
+        
+        cache.store("a" * 64, "wav", b"12345")
+        assert index.totals() == (1, 5)
+        
+        now[0] = 200.0
+        cache.lookup("a" * 64, "wav")
+        assert index.least_recent(1)[0] == (f"chunks/aa/aa/{'a' * 64}.wav", 5, 200.0)
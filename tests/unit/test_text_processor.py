@@ -56,6 +56,27 @@ class TestTextProcessor:
         assert len(chunks) > 1
         assert all(len(chunk) <= 35 for chunk in chunks)  # Small buffer
     
+    def test_chunk_text_keeps_last_sentence(self):
+        """Test that the final sentence is not dropped."""
+        processor = TextProcessor()
+        assert processor.chunk_text("Hello world.") == ["Hello world."]
+        
+        chunks = processor.chunk_text("First one. Second one. Third one.")
+        assert " ".join(chunks) == "First one. Second one. Third one."
+    
+    def test_chunk_text_edit_is_local(self):
+        """Test that editing one sentence leaves other chunks unchanged."""
+        processor = TextProcessor()
+        sentences = [f"The river crossed valley {name} at dawn." for name in "ABCDEFGHIJKLMNOPQRST"]
+        original = processor.chunk_text(" ".join(sentences), max_chunk_size=200)
+        
+        sentences[10] = "The river slowed near the old mill."
+        edited = processor.chunk_text(" ".join(sentences), max_chunk_size=200)
+        
+        changed = set(edited) - set(original)
+        assert len(changed) == 1
+        assert "old mill" in changed.pop()
+    
     def test_detect_emotion_excited(self):
         """Test emotion detection for excited text."""
         processor = TextProcessor()
@@ -0,0 +1,67 @@
+"""Unit tests for the phase vocoder time-stretch."""
+
+import pytest
+import numpy as np
+from src.core.time_stretch import PhaseVocoder, fft_size_for, get_phase_vocoder
+
+
+def dominant_frequency(audio: np.ndarray, sample_rate: int) -> float:
+    """Return the frequency of the strongest spectral peak."""
+    spectrum = np.abs(np.fft.rfft(audio * np.hanning(len(audio))))
+    return np.argmax(spectrum) * sample_rate / len(audio)
+
+
+class TestPhaseVocoder:
+    """Test suite for PhaseVocoder."""
+    
+    @pytest.mark.parametrize("rate", [0.5, 0.85, 1.25, 2.0])
+    def test_output_length(self, rate):
+        """Test that output length is scaled by the rate."""
+        audio = np.random.randn(24000)
+        result = PhaseVocoder().stretch(audio, rate)
+        assert len(result) == round(len(audio) / rate)
+    
+    @pytest.mark.parametrize("rate", [0.75, 1.5])
+    def test_preserves_pitch(self, rate):
+        """Test that a tone keeps its frequency when stretched."""
+        sr = 24000
+        t = np.arange(sr) / sr
+        audio = 0.5 * np.sin(2 * np.pi * 440 * t)
+        
+        result = PhaseVocoder().stretch(audio, rate)
+        assert abs(dominant_frequency(result[2048:-2048], sr) - 440) < 3
+    
+    @pytest.mark.parametrize("block_size", [1, 333, 4096])
+    def test_blocks_match_whole_signal(self, block_size):
+        """Test that streaming gives the same output as one pass."""
+        vocoder = PhaseVocoder()
+        audio = np.random.randn(8000)
+        blocks = (audio[i:i + block_size] for i in range(0, len(audio), block_size))
+        
+        result = np.concatenate(list(vocoder.process_blocks(blocks, 1.3)))
+        assert np.allclose(result, vocoder.stretch(audio, 1.3), atol=1e-9)
+    
+    def test_unit_rate_is_identity(self):
+        """Test that rate 1.0 returns the input unchanged."""
+        audio = np.random.randn(1000)
+        assert np.array_equal(PhaseVocoder().stretch(audio, 1.0), audio)
+    
+    def test_preserves_float32(self):
+        """Test that float32 input produces float32 output."""
+        audio = np.random.randn(4000).astype(np.float32)
+        assert PhaseVocoder().stretch(audio, 1.2).dtype == np.float32
+    
+    def test_empty_input(self):
+        """Test that empty input produces empty output."""
+        assert len(PhaseVocoder().stretch(np.zeros(0), 1.5)) == 0
+    
+    def test_invalid_hop(self):
+        """Test that a hop not dividing the FFT size is rejected."""
+        with pytest.raises(ValueError):
+            PhaseVocoder(n_fft=1024, hop_length=300)
+    
+    def test_fft_size_for(self):
+        """Test FFT size selection by sample rate."""
+        assert fft_size_for(24000) == 1024
+        assert fft_size_for(44100) == 2048
+        assert get_phase_vocoder(1024) is get_phase_vocoder(1024)
@@ -0,0 +1,137 @@
+"""Unit tests for stage timing."""
+
+import threading
+import time
+
+import pytest
+from src.services.micro_batcher import MicroBatchScheduler
+from src.utils.metrics import MetricsRegistry
+from src.utils.timing import (
+    DISABLED,
+    STAGE_BUCKETS,
+    Timings,
+    current_timings,
+    new_timings,
+    server_timing,
+    span,
+    stage_stats,
+)
+
+
+class TestTimings:
+    """Test suite for Timings and spans."""
+
+    def test_spans_accumulate(self):
+        """Test that repeated spans add up under one stage name."""
+        timings = Timings()
+        for _ in range(2):
+            with timings.span("chunk"):
+                time.sleep(0.005)
+        timings.record("queue", 1.5)
+
+        durations = timings.as_dict()
+        assert list(durations) == ["chunk", "queue"]
+        assert durations["chunk"] >= 10
+        assert durations["queue"] == 1.5
+
+    def test_module_span_uses_active_timings(self):
+        """Test that the module-level span records into the active Timings."""
+        timings = Timings()
+        with span("outside"):
+            pass
+        with timings.activate():
+            assert current_timings() is timings
+            with span("inside"):
+                pass
+        assert current_timings() is None
+        assert list(timings.as_dict()) == ["inside"]
+
+    def test_activation_is_per_thread(self):
+        """Test that other threads do not see the active Timings."""
+        seen = []
+        with Timings().activate():
+            thread = threading.Thread(target=lambda: seen.append(current_timings()))
+            thread.start()
+            thread.join()
+        assert seen == [None]
+
+    def test_disabled(self):
+        """Test that disabled timing records nothing."""
+        timings = new_timings(enabled=False)
+        assert timings is DISABLED
+        with timings.activate():
+            with span("stage"):
+                pass
+        timings.record("queue", 1.0)
+        assert timings.as_dict() == {}
+
+    def test_server_timing(self):
+        """Test the Server-Timing header format."""
+        header = server_timing({"inference": 812.4, "encode": 5.05})
+        assert header == "inference;dur=812.400, encode;dur=5.050"
+
+
+class TestStageStats:
+    """Test suite for stage statistics built on the metrics histogram."""
+
+    def test_buckets_and_quantiles(self):
+        """Test cumulative buckets (ms) and interpolated quantiles."""
+        histogram = MetricsRegistry().histogram("stage", "Stages", ("stage",), buckets=STAGE_BUCKETS)
+        for ms in [4] * 50 + [40] * 45 + [400] * 5:
+            histogram.observe(ms / 1000, ("inference",))
+        histogram.observe(0.003, ("encode",))
+
+        stats = stage_stats(histogram)
+        inference = stats["inference"]
+        assert inference["count"] == 100
+        assert inference["sum_ms"] == pytest.approx(4000)
+        assert inference["buckets"]["5"] == 50
+        assert inference["buckets"]["50"] == 95
+        assert inference["buckets"]["+Inf"] == 100
+        assert inference["p50_ms"] <= 5
+        assert 25 < inference["p95_ms"] <= 50
+        assert 250 < inference["p99_ms"] <= 500
+        assert stats["encode"]["count"] == 1
+
+    def test_empty(self):
+        """Test that an unused histogram reports no stages."""
+        histogram = MetricsRegistry().histogram("stage", "Stages", ("stage",), buckets=STAGE_BUCKETS)
+        assert stage_stats(histogram) == {}
+
+
+class TestMicroBatchTimings:
+    """Test that micro-batches report model time to their callers."""
+
+    def test_batch_time_recorded_once_per_caller(self):
+        """Test that a caller's texts in one batch count the model time once."""
+        def batch_fn(texts, emotion, intensity):
+            time.sleep(0.02)
+            return texts
+
+        scheduler = MicroBatchScheduler(batch_fn, max_batch_size=4, max_wait_ms=5)
+        timings = Timings()
+        try:
+            with timings.activate():
+                assert scheduler.synthesize_batch(["a", "b", "c"]) == ["a", "b", "c"]
+        finally:
+            scheduler.shutdown()
+
+        durations = timings.as_dict()
+        assert 20 <= durations["model"] < 40
+        assert "batch_wait" in durations
+
+    def test_failed_batch_time_recorded(self):
+        """Test that a failed batch's time is recorded before the caller sees the error."""
+        def batch_fn(texts, emotion, intensity):
+            raise RuntimeError("model failed")
+
+        scheduler = MicroBatchScheduler(batch_fn, max_batch_size=1, max_wait_ms=0)
+        timings = Timings()
+        try:
+            with timings.activate():
+                with pytest.raises(RuntimeError):
+                    scheduler.synthesize_batch(["a"])
+        finally:
+            scheduler.shutdown()
+
+        assert {"batch_wait", "model"} <= set(timings.as_dict())
@@ -0,0 +1,84 @@
+"""Unit tests for model warm-up and readiness."""
+
+import asyncio
+
+import pytest
+from config.settings import Settings
+from src.core.resampler import get_resampler
+from src.services.speech_service import WARMUP_PENDING, WARMUP_READY, SpeechService
+
+
+@pytest.fixture
+def make_service(tmp_path):
+    """Build speech services on the reference model and shut them down afterwards."""
+    services = []
+
+    def make(**overrides):
+        settings = Settings(
+            model_name="reference",
+            audio_output_dir=str(tmp_path / "audio"),
+            **overrides
+        )
+        service = SpeechService(settings)
+        services.append(service)
+        return service
+
+    yield make
+    for service in services:
+        service.shutdown()
+
+
+class TestWarmUp:
+    """Test suite for SpeechService.warm_up."""
+
+    def test_warm_up_every_emotion(self, make_service):
+        """Test that warm-up renders each emotion and then reports ready."""
+        service = make_service(warmup_sample_rates=[16000, 44100], warmup_formats=["wav", "ogg"])
+        assert not service.is_ready()
+        assert service.get_warmup_status()["state"] == WARMUP_PENDING
+
+        status = service.warm_up()
+        assert service.is_ready()
+        assert status["state"] == WARMUP_READY
+        assert status["syntheses"] == len(service.emotion_controller.list_emotions())
+        assert status["errors"] == 0
+        assert set(status["emotions_ms"]) == set(service.emotion_controller.list_emotions())
+        assert status["model_load_ms"] is not None
+        assert status["startup_ms"] >= status["warmup_ms"]
+
+        # Filters for the supported rates are built; nothing was cached or counted
+        assert get_resampler.cache_info().currsize > 0
+        assert service.chunk_cache.get_stats()["misses"] == 0
+        assert service.get_stats()["stages"] == {}
+
+    def test_disabled(self, make_service):
+        """Test that without warm-up only the model is loaded."""
+        service = make_service(warmup_enabled=False)
+        status = service.warm_up()
+        assert service.is_ready()
+        assert status["syntheses"] == 0
+        assert status["warmup_ms"] is None
+
+    def test_selected_emotions(self, make_service):
+        """Test that warm-up synthesizes each configured emotion once."""
+        service = make_service(
+            warmup_emotions=["sad", "urgent"],
+            warmup_sample_rates=[24000],
+            warmup_formats=["wav"]
+        )
+        status = service.warm_up()
+        assert status["syntheses"] == 2
+        assert list(status["emotions_ms"]) == ["sad", "urgent"]
+
+    def test_first_request_latency(self, make_service):
+        """Test that the first synthesis request's latency is recorded."""
+        service = make_service(warmup_sample_rates=[24000], warmup_formats=["wav"])
+        service.warm_up()
+        assert service.get_warmup_status()["first_request_ms"] is None
+
+        asyncio.run(service.synthesize("The first request after warm-up."))
+        first = service.get_warmup_status()["first_request_ms"]
+        assert first > 0
+
+        asyncio.run(service.synthesize("A later request."))
+        assert service.get_warmup_status()["first_request_ms"] == first